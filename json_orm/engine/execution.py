@@ -21,10 +21,62 @@ Example:
 
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
 from .interfaces import (
-    IExecutionPlan, IExecutionContext, IResultSet, IPredicate, IExpression
+    IExecutionPlan, IExecutionContext, IResultSet, IColumnarResultSet,
+    IPredicate, IExpression
 )
 
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+# Per-byte popcount lookup used by PackedBoolColumn.count().
+_POPCOUNT8 = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+class PackedBoolColumn:
+    """Boolean column stored as a packed bitmap (one bit per row).
+
+    Boolean values cost one bit here instead of a boxed Python bool (or
+    a full byte in a NumPy bool array), so predicate-dominated scans
+    load 8-64x fewer bytes. Counting set rows is a popcount over the
+    packed bytes; full unpacking only happens when a consumer actually
+    projects the column.
+    """
+
+    def __init__(self, values: Any):
+        """Pack an iterable of booleans into a bitmap.
+
+        Args:
+            values: Boolean values to pack.
+        """
+        arr = np.asarray(values, dtype=bool)
+        self._packed = np.packbits(arr)
+        self._n = len(arr)
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __getitem__(self, index: Any) -> Any:
+        return self.unpack()[index]
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        unpacked = self.unpack()
+        return unpacked.astype(dtype) if dtype is not None else unpacked
+
+    def unpack(self) -> np.ndarray:
+        """Unpack to a bool ndarray (for projection or masking)."""
+        return np.unpackbits(self._packed, count=self._n).view(bool)
+
+    def count(self) -> int:
+        """Number of True rows, computed as a popcount without unpacking."""
+        return int(_POPCOUNT8[self._packed].sum())
+
 
 class ExecutionPlan(IExecutionPlan):
     """Base class for all execution plans.
@@ -74,7 +126,7 @@ class TableScanPlan(ExecutionPlan):
             predicate: Optional[IPredicate] = None
     ):
         """Initialize a table scan plan.
-        
+
         Args:
             table: Name of the table to scan.
             columns: List of columns to select.
@@ -83,27 +135,235 @@ class TableScanPlan(ExecutionPlan):
         self.table = table
         self.columns = columns
         self.predicate = predicate
+        self._columnar_cache: Dict[str, np.ndarray] = {}
+        # Token describing the storage state the cache was built from;
+        # a mismatch on the next execute rebuilds the buffers (plans
+        # are reused across statements via the planner's plan cache).
+        self._cache_token: Any = None
 
     def execute(self, context: IExecutionContext) -> IResultSet:
         """Execute the table scan.
-        
+
+        When the storage layer exposes raw row access and the predicate
+        can be compiled to a NumPy expression, the filter is evaluated
+        as a single boolean mask over columnar buffers instead of one
+        Python call per row.
+
         Args:
             context: Execution context containing storage access.
-            
+
         Returns:
             IResultSet: Filtered and projected rows from the table.
         """
         storage = context.get_storage()
-        return storage.read(self.table, self.columns, self.predicate)
+        if (self.predicate is None
+                or not hasattr(storage, 'read_raw')
+                or not hasattr(self.predicate, 'compile_to_numpy')):
+            return storage.read(self.table, self.columns, self.predicate)
+
+        rows = storage.read_raw(self.table)
+        columns = self._materialize_columns(rows, storage)
+        try:
+            mask = self.predicate.compile_to_numpy(columns)
+        except TypeError:
+            # Absent fields materialize as None in the buffers (see
+            # _materialize_columns); a predicate hook that cannot
+            # handle them must not crash the scan.
+            mask = None
+        if mask is None:
+            # Predicate could not be vectorized; fall back to row-at-a-time
+            return storage.read(self.table, self.columns, self.predicate)
+
+        idx = np.flatnonzero(mask)
+        projected = self.columns or list(columns)
+        return ColumnarResultSet(
+            {col: columns[col][idx] for col in projected if col in columns},
+            len(idx)
+        )
+
+    def _materialize_columns(self, rows: List[Dict[str, Any]],
+                             storage: Any = None) -> Dict[str, np.ndarray]:
+        """Build (and cache) SoA column buffers for the scanned rows.
+
+        The cache is validated against the storage's state on every
+        call: a ``data_version`` token when the storage exposes one,
+        the row list's identity and length otherwise. A changed token
+        drops the buffers and rebuilds, so a plan reused from the
+        planner's cache never serves rows from before a mutation.
+
+        Args:
+            rows: Raw table rows as dictionaries.
+            storage: Storage the rows came from, for its version token.
+
+        Returns:
+            Dict[str, np.ndarray]: Column name to value-array mapping.
+        """
+        token = getattr(storage, 'data_version', None)
+        if token is None:
+            token = (id(rows), len(rows))
+        if token != self._cache_token:
+            self._columnar_cache = {}
+            self._cache_token = token
+        if not self._columnar_cache and rows:
+            for col in rows[0]:
+                values = np.array([row.get(col) for row in rows])
+                if values.dtype == np.bool_:
+                    # Boolean flags (e.g. is_active) are bit-packed;
+                    # predicates unpack lazily, counts use popcount.
+                    self._columnar_cache[col] = PackedBoolColumn(values)
+                else:
+                    self._columnar_cache[col] = values
+        return self._columnar_cache
+
+
+# Operator codes for the compiled comparison kernel; passing a small
+# int instead of a callable keeps the kernel in nopython mode.
+_JIT_OP_CODES = {'eq': 0, 'ne': 1, 'lt': 2, 'le': 3, 'gt': 4, 'ge': 5}
+
+if HAS_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _jit_compare(column, value, op_code):  # pragma: no cover - jitted
+        """Parallel comparison kernel producing a boolean mask.
+
+        Numba specializes this per column dtype on first call; the
+        prange loop compiles to an auto-vectorized parallel sweep.
+        """
+        n = column.shape[0]
+        out = np.empty(n, dtype=np.bool_)
+        for i in prange(n):
+            v = column[i]
+            if op_code == 0:
+                out[i] = v == value
+            elif op_code == 1:
+                out[i] = v != value
+            elif op_code == 2:
+                out[i] = v < value
+            elif op_code == 3:
+                out[i] = v <= value
+            elif op_code == 4:
+                out[i] = v > value
+            else:
+                out[i] = v >= value
+        return out
+
+
+class JITTableScan(TableScanPlan):
+    """Table scan whose predicate loop is JIT-compiled with Numba.
+
+    For homogeneous numeric columns the per-leaf comparison runs in an
+    ``@njit(parallel=True)`` kernel: no interpreter dispatch per row,
+    and LLVM auto-vectorizes the comparison loop. Everything the kernel
+    cannot handle — missing Numba, string columns, opaque operators —
+    degrades to the plain :class:`TableScanPlan` path unchanged, so
+    this plan is always safe to substitute.
+
+    Example:
+        ```python
+        plan = JITTableScan("events", ["id", "ts"], gt("value", 0.5))
+        results = plan.execute(context)
+        ```
+    """
+
+    def execute(self, context: IExecutionContext) -> IResultSet:
+        """Execute the scan, preferring the compiled kernel.
+
+        Args:
+            context: Execution context containing storage access.
+
+        Returns:
+            IResultSet: Filtered and projected rows from the table.
+        """
+        storage = context.get_storage()
+        if (not HAS_NUMBA
+                or self.predicate is None
+                or not hasattr(storage, 'read_raw')):
+            return super().execute(context)
+
+        rows = storage.read_raw(self.table)
+        columns = self._materialize_columns(rows, storage)
+        mask = self._jit_mask(self.predicate, columns)
+        if mask is None:
+            return super().execute(context)
+
+        idx = np.flatnonzero(mask)
+        projected = self.columns or list(columns)
+        return ColumnarResultSet(
+            {col: columns[col][idx] for col in projected if col in columns},
+            len(idx)
+        )
+
+    @classmethod
+    def _jit_mask(cls, predicate: Any,
+                  columns: Dict[str, np.ndarray]) -> Optional[np.ndarray]:
+        """Lower a predicate tree to kernel-computed masks.
+
+        Tagged comparison leaves over numeric columns go through the
+        compiled kernel; And/Or/Not nodes combine child masks. Any
+        unsupported node makes the whole predicate non-jittable.
+
+        Args:
+            predicate: Condition tree to lower.
+            columns: Materialized column buffers.
+
+        Returns:
+            Optional[np.ndarray]: Boolean row mask, or None when any
+            part of the tree cannot run in the kernel.
+        """
+        children = getattr(predicate, 'conditions', None)
+        if children is not None:
+            masks = []
+            for child in children:
+                mask = cls._jit_mask(child, columns)
+                if mask is None:
+                    return None
+                masks.append(mask)
+            kind = type(predicate).__name__
+            if kind == 'AndCondition':
+                return np.logical_and.reduce(masks)
+            if kind == 'OrCondition':
+                return np.logical_or.reduce(masks)
+            if kind == 'NotCondition':
+                return np.logical_not(masks[0])
+            return None
+
+        op_code = _JIT_OP_CODES.get(getattr(predicate, 'tag', None))
+        column = columns.get(getattr(predicate, 'field', None))
+        if op_code is None or column is None:
+            return None
+        column = np.asarray(column)
+        if column.dtype.kind not in 'ifb':
+            # Object/string columns are not nopython-compatible.
+            return None
+        return _jit_compare(column, predicate.value, op_code)
 
 
 class JoinPlan(ExecutionPlan):
     """Join execution plan.
-    
+
     This plan performs a join between two tables or intermediate results.
     Supports different join types (INNER, LEFT, RIGHT, FULL) and conditions.
     """
 
+    def __init__(
+            self,
+            left: IExecutionPlan,
+            right: IExecutionPlan,
+            condition: Optional[IExpression] = None,
+            join_type: str = "INNER"
+    ):
+        """Initialize a join plan.
+
+        Args:
+            left: Plan producing the left input.
+            right: Plan producing the right input.
+            condition: Optional join condition.
+            join_type: Type of join (INNER, LEFT, RIGHT, FULL).
+        """
+        self.left = left
+        self.right = right
+        self.condition = condition
+        self.join_type = join_type
+
 
 
 class AggregatePlan(ExecutionPlan):
@@ -124,27 +384,163 @@ class SortPlan(ExecutionPlan):
 
 class ProjectPlan(ExecutionPlan):
     """Projection execution plan.
-    
+
     This plan selects specific columns from its input,
     optionally with computed expressions.
     """
 
+    def __init__(self, input_plan: IExecutionPlan, columns: List[str]):
+        """Initialize a projection plan.
+
+        Args:
+            input_plan: Plan producing the rows to project.
+            columns: Columns to keep in the output.
+        """
+        self.input_plan = input_plan
+        self.columns = columns
+
+    def execute(self, context: IExecutionContext) -> IResultSet:
+        """Execute the projection over the input plan's rows."""
+        rows = self.input_plan.execute(context).all()
+        return RowResultSet([
+            {col: row.get(col) for col in self.columns} for row in rows
+        ])
+
 
 class LimitPlan(ExecutionPlan):
     """Limit execution plan.
-    
+
     This plan limits the number of rows returned and/or
     skips a specified number of initial rows.
     """
 
+    def __init__(self, input_plan: IExecutionPlan, count: int, offset: int = 0):
+        """Initialize a limit plan.
+
+        Args:
+            input_plan: Plan producing the rows to limit.
+            count: Maximum number of rows to return.
+            offset: Number of initial rows to skip.
+        """
+        self.input_plan = input_plan
+        self.count = count
+        self.offset = offset
+
+    def execute(self, context: IExecutionContext) -> IResultSet:
+        """Execute the limit over the input plan's rows."""
+        rows = self.input_plan.execute(context).all()
+        return RowResultSet(rows[self.offset:self.offset + self.count])
+
+
+class FusedScanProjectLimitPlan(ExecutionPlan):
+    """Fused Scan + Project + Limit execution plan.
+
+    Produced by the planner's fusion rewrite for the common paginated
+    query shape. Instead of materializing the full table scan, then a
+    projected copy, then slicing, this plan streams rows from storage,
+    filters and projects each one, and stops reading as soon as the
+    limit is satisfied — O(offset + limit) work instead of O(table).
+    """
+
+    def __init__(
+            self,
+            table: str,
+            columns: List[str],
+            predicate: Optional[IPredicate],
+            count: int,
+            offset: int = 0
+    ):
+        """Initialize the fused plan.
+
+        Args:
+            table: Table to scan.
+            columns: Columns to keep in the output.
+            predicate: Optional filtering condition.
+            count: Maximum number of rows to return.
+            offset: Number of matching rows to skip first.
+        """
+        self.table = table
+        self.columns = columns
+        self.predicate = predicate
+        self.count = count
+        self.offset = offset
+
+    def execute(self, context: IExecutionContext) -> IResultSet:
+        """Stream rows from storage, stopping once the limit is hit."""
+        storage = context.get_storage()
+        if not hasattr(storage, 'read_raw'):
+            # Storage can't stream raw rows; fall back to the unfused
+            # pipeline semantics.
+            rows = storage.read(self.table, self.columns, self.predicate).all()
+            return RowResultSet(rows[self.offset:self.offset + self.count])
+
+        out: List[Dict[str, Any]] = []
+        skipped = 0
+        predicate = self.predicate
+        columns = self.columns
+        for row in storage.read_raw(self.table):
+            if predicate is not None and not predicate.evaluate(row):
+                continue
+            if skipped < self.offset:
+                skipped += 1
+                continue
+            out.append({col: row.get(col) for col in columns} if columns
+                       else row)
+            if len(out) >= self.count:
+                break
+        return RowResultSet(out)
+
 
 class InsertPlan(ExecutionPlan):
     """Insert execution plan.
-    
+
     This plan handles insertion of new rows into a table,
     with support for single and bulk inserts.
+
+    The column list is frozen to a tuple once at construction; when the
+    storage backend accepts columnar input (``write_columnar``) the
+    positional value tuples are passed straight through, skipping
+    per-row dict construction entirely. Row-dict storage backends get
+    the dicts built in one pass against the cached column tuple.
+
+    Attributes:
+        table: Name of the table to insert into.
+        columns: Column names, positionally matching each value row.
+        values: Rows to insert, as positional value sequences.
     """
 
+    def __init__(self, table: str, columns: List[str],
+                 values: List[Any]):
+        """Initialize an insert plan.
+
+        Args:
+            table: Name of the table to insert into.
+            columns: Column names, positionally matching each row.
+            values: Rows to insert, as positional value sequences.
+        """
+        self.table = table
+        self.columns = tuple(columns)
+        self.values = values
+
+    def execute(self, context: IExecutionContext) -> IResultSet:
+        """Execute the insert.
+
+        Args:
+            context: Execution context containing storage access.
+
+        Returns:
+            IResultSet: A single row with the inserted-row count.
+        """
+        storage = context.get_storage()
+        if hasattr(storage, 'write_columnar'):
+            count = storage.write_columnar(self.table, self.columns,
+                                           self.values)
+        else:
+            cols = self.columns
+            count = storage.write(
+                self.table, [dict(zip(cols, row)) for row in self.values])
+        return RowResultSet([{'inserted': count}])
+
 
 class UpdatePlan(ExecutionPlan):
     """Update execution plan.
@@ -162,9 +558,212 @@ class DeletePlan(ExecutionPlan):
     """
 
 
+class RowViewAdapter:
+    """Read-only dict-like view of one row of a columnar result.
+
+    Lets row-at-a-time consumers (``row[key]`` / ``row.get(key)``)
+    read straight out of the column buffers without materializing a
+    dict per row; only the values actually accessed are unboxed.
+    """
+
+    __slots__ = ('_columns', '_i')
+
+    def __init__(self, columns: Dict[str, np.ndarray], i: int):
+        """Bind the view to row ``i`` of the given column buffers."""
+        self._columns = columns
+        self._i = i
+
+    def __getitem__(self, key: str) -> Any:
+        return _unbox(self._columns[key][self._i])
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a column's value for this row, or a default."""
+        column = self._columns.get(key)
+        if column is None:
+            return default
+        return _unbox(column[self._i])
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._columns
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def keys(self):
+        """The column names visible through this view."""
+        return self._columns.keys()
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materialize this row as a plain dict."""
+        return {name: _unbox(col[self._i])
+                for name, col in self._columns.items()}
+
+
+class ColumnarResultSet(IColumnarResultSet):
+    """Result set backed by SoA (structure-of-arrays) column buffers.
+
+    The concrete :class:`IColumnarResultSet`: rows are held as one
+    NumPy array per column rather than a dict per row, so numeric
+    columns stay unboxed and projections are views into shared
+    buffers. Dict rows are only materialized on demand when a consumer
+    iterates row-wise; :meth:`row_view` avoids even that.
+    """
+
+    __slots__ = ('_columns', '_n', '_pos')
+
+    def __init__(self, columns: Dict[str, np.ndarray], n: Optional[int] = None):
+        """Initialize the result set.
+
+        Args:
+            columns: Mapping of column name to value array.
+            n: Number of rows; inferred from the buffers if omitted.
+        """
+        self._columns = columns
+        if n is None:
+            n = len(next(iter(columns.values()))) if columns else 0
+        self._n = n
+        self._pos = 0
+
+    @property
+    def columns(self) -> Dict[str, np.ndarray]:
+        """The underlying column buffers (no copies)."""
+        return self._columns
+
+    def row_count(self) -> int:
+        """The number of rows, independent of iteration position."""
+        return self._n
+
+    def row_view(self, i: int) -> RowViewAdapter:
+        """Get a zero-copy dict-like view of row ``i``."""
+        return RowViewAdapter(self._columns, i)
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __iter__(self):
+        names = list(self._columns)
+        for values in zip(*self._columns.values()):
+            yield dict(zip(names, (_unbox(v) for v in values)))
+
+    def next(self) -> Optional[Dict[str, Any]]:
+        """Materialize and return the next row, or None when exhausted."""
+        if self._pos >= self._n:
+            return None
+        i = self._pos
+        self._pos += 1
+        return {name: _unbox(col[i]) for name, col in self._columns.items()}
+
+    def all(self) -> List[Dict[str, Any]]:
+        """Materialize all remaining rows as dicts."""
+        names = list(self._columns)
+        rows = [
+            dict(zip(names, (_unbox(v) for v in values)))
+            for values in zip(*(col[self._pos:] for col in self._columns.values()))
+        ]
+        self._pos = self._n
+        return rows
+
+    def iter_batches(self, size: int = 8192):
+        """Iterate the remaining rows as columnar batches.
+
+        Overrides the row-pivoting default: each batch is a slice of
+        the underlying buffers, so no row dicts are materialized and
+        slices share memory with the result set.
+
+        Args:
+            size: Maximum number of rows per batch.
+
+        Yields:
+            Dict[str, np.ndarray]: Views into the column buffers for
+                up to ``size`` rows.
+        """
+        while self._pos < self._n:
+            start = self._pos
+            self._pos = min(start + size, self._n)
+            yield {name: col[start:self._pos]
+                   for name, col in self._columns.items()}
+
+
+def _unbox(value: Any) -> Any:
+    """Convert a NumPy scalar to its Python equivalent."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+class RowResultSet(IResultSet):
+    """Result set backed by a materialized list of rows.
+
+    This is the default result set implementation for plans that
+    produce their full output in memory (scans, joins, etc.).
+    """
+
+    __slots__ = ('_rows', '_pos')
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        """Initialize the result set.
+
+        Args:
+            rows: The materialized rows to iterate over.
+        """
+        self._rows = rows
+        self._pos = 0
+
+    def next(self) -> Optional[Dict[str, Any]]:
+        """Get the next row, or None when exhausted."""
+        if self._pos >= len(self._rows):
+            return None
+        row = self._rows[self._pos]
+        self._pos += 1
+        return row
+
+    def all(self) -> List[Dict[str, Any]]:
+        """Get all remaining rows."""
+        remaining = self._rows[self._pos:]
+        self._pos = len(self._rows)
+        return remaining
+
+
 class SingleRowResult(IResultSet):
     """Result set containing a single row.
-    
+
     This is a specialized result set implementation for operations
-    that return exactly one row (e.g., getting by primary key).
+    that return exactly one row (e.g., getting by primary key). Both
+    attributes live in slots, and ``all()``/``__iter__`` skip the
+    returned-gate entirely — the gate only matters for repeated
+    ``next()`` calls.
+
+    Attributes:
+        row: The single result row.
+        returned: Whether next() has already yielded the row.
     """
+
+    __slots__ = ('row', 'returned')
+
+    def __init__(self, row: Dict[str, Any]):
+        """Initialize the result set.
+
+        Args:
+            row: The single result row.
+        """
+        self.row = row
+        self.returned = False
+
+    def next(self) -> Optional[Dict[str, Any]]:
+        """Get the row on the first call, None afterwards."""
+        if self.returned:
+            return None
+        self.returned = True
+        return self.row
+
+    def all(self) -> List[Dict[str, Any]]:
+        """Get the row as a one-element list, without the gate check."""
+        self.returned = True
+        return [self.row]
+
+    def __iter__(self):
+        # Tuple iteration runs through the C iterator protocol; no
+        # per-step Python attribute lookups.
+        self.returned = True
+        return iter((self.row,))
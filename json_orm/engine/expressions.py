@@ -4,74 +4,268 @@ This module provides the core expression classes used by the query engine
 to represent and evaluate SQL expressions. It implements the Visitor pattern
 for flexible processing of different expression types.
 
+Evaluation does not walk the tree per row: :func:`compile_expression`
+linearizes an expression once into a flat list of ``(opcode, arg)``
+tuples and :func:`run` executes them on a small stack machine in one
+tight loop — no recursion, no isinstance dispatch, and no per-node
+string comparison in the hot path.
+
 Example:
     ```python
     # Create expressions
     name_col = Column("name", "users")
     age_col = Column("age", "users")
     age_check = BinaryOperator(age_col, ">", Literal(18))
-    
+
     # Evaluate expressions
     evaluator = ExpressionEvaluator()
-    result = age_check.accept(evaluator)
+    result = evaluator.evaluate(age_check, {"users.age": 25})
     ```
 """
 
-from dataclasses import dataclass
+import operator as _operator
+from dataclasses import dataclass, field
+from enum import IntEnum
+import weakref
+
+import numpy as np
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 from .interfaces import (
-    IExpressionVisitor,
-    IColumn, ILiteral, IOperator
+    IExpression, IExpressionVisitor,
+    IColumn, ILiteral, IOperator, IPredicate
 )
 
+# Bytecode opcodes. Small contiguous ints so the VM dispatch is a
+# chain of C-level int compares, ordered by expected frequency.
+PUSH_LIT = 0
+LOAD_COL = 1
+EQ = 2
+NE = 3
+GT = 4
+LT = 5
+GE = 6
+LE = 7
+AND = 10
+OR = 11
+NOT = 12
+NEG = 13
+
+# Short-circuit jumps (CPython's *_OR_POP semantics): if the value on
+# top of the stack decides the chain, jump past the right operand's
+# code leaving it as the result; otherwise pop it and fall through.
+# The compiler emits these for AND/OR instead of the eager reduction
+# opcodes, so a false left operand skips the whole right subtree.
+JUMP_IF_FALSE = 14
+JUMP_IF_TRUE = 15
+
+# Superinstructions fusing LOAD_COL k; PUSH_LIT v; <cmp> — the most
+# common predicate shape — into one dispatch with arg (key, value).
+COL_EQ_CONST = 20
+COL_NE_CONST = 21
+COL_GT_CONST = 22
+COL_LT_CONST = 23
+COL_GE_CONST = 24
+COL_LE_CONST = 25
+
+# Set-membership superinstruction: arg is (key, frozenset) and one
+# hash probe replaces the k comparisons of an OR-of-equalities chain.
+COL_IN_CONST = 26
+
+_FUSED_CMP: Dict[int, int] = {
+    EQ: COL_EQ_CONST, NE: COL_NE_CONST,
+    GT: COL_GT_CONST, LT: COL_LT_CONST,
+    GE: COL_GE_CONST, LE: COL_LE_CONST,
+}
+
+# Binary opcodes foldable when both operands are literals.
+_FOLD_FUNCS: Dict[int, Any] = {
+    EQ: _operator.eq, NE: _operator.ne,
+    GT: _operator.gt, LT: _operator.lt,
+    GE: _operator.ge, LE: _operator.le,
+    AND: lambda a, b: a and b,
+    OR: lambda a, b: a or b,
+}
+
+
+class OpCode(IntEnum):
+    """Operator codes for expression nodes.
+
+    Small contiguous integers so every dispatch site — the compiler,
+    the batch evaluator, the source generator — is a tuple index by
+    ``value`` rather than a cascade of string compares. Operator nodes
+    normalize their SQL spellings to these at construction, keeping
+    the string compare out of every per-row and per-compile path.
+    """
+    EQ = 0
+    NE = 1
+    LT = 2
+    LE = 3
+    GT = 4
+    GE = 5
+    AND = 6
+    OR = 7
+    NOT = 8
+    NEG = 9
+
+    def __str__(self) -> str:
+        """The canonical SQL spelling, for serialization."""
+        return _OPCODE_SQL[self]
+
+
+# Canonical SQL spellings, indexed by OpCode value.
+_OPCODE_SQL = ('=', '!=', '<', '<=', '>', '>=', 'AND', 'OR', 'NOT', '-')
+
+# Accepted operator spellings, resolved once at node construction.
+_OPCODE_FROM_STRING: Dict[str, OpCode] = {
+    '=': OpCode.EQ, '==': OpCode.EQ, '!=': OpCode.NE, '<>': OpCode.NE,
+    '<': OpCode.LT, '<=': OpCode.LE, '>': OpCode.GT, '>=': OpCode.GE,
+    'AND': OpCode.AND, 'and': OpCode.AND,
+    'OR': OpCode.OR, 'or': OpCode.OR,
+    'NOT': OpCode.NOT, 'not': OpCode.NOT, '-': OpCode.NEG,
+}
+
+# VM opcode for each OpCode, indexed by value.
+_VM_OPCODES = (EQ, NE, LT, LE, GT, GE, AND, OR, NOT, NEG)
+
+
+def _normalize_op(op: Any) -> OpCode:
+    """Resolve an operator spelling (or OpCode) to its OpCode.
+
+    Raises:
+        ValueError: If the spelling is not a known operator.
+    """
+    if isinstance(op, OpCode):
+        return op
+    code = _OPCODE_FROM_STRING.get(op)
+    if code is None:
+        raise ValueError(f"Unknown operator: {op!r}")
+    return code
+
 
-@dataclass
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class Column(IColumn):
     """Column reference expression.
-    
+
     Represents a reference to a database column in an expression.
-    
+
     Attributes:
         name: Name of the column.
         table: Optional name of the table containing the column.
         alias: Optional alias for the column in query results.
-        
+
     Example:
         ```python
         name_col = Column("name", "users", "user_name")
         ```
     """
+    name: str
+    table: Optional[str] = None
+    alias: Optional[str] = None
+    # Row key pre-joined once at construction so no per-row f-string
+    # ever runs; derived, so excluded from equality and repr.
+    _key: str = field(init=False, compare=False, repr=False, default='')
+    # Position in a bound schema (see ExpressionBuilder.bind); -1 when
+    # unbound. Participates in equality and hash so bound and unbound
+    # forms of the same column compile to distinct cached programs.
+    _col_idx: int = field(init=False, repr=False, default=-1)
 
+    def __post_init__(self):
+        """Pre-join the row lookup key for this column reference."""
+        object.__setattr__(
+            self, '_key',
+            f"{self.table}.{self.name}" if self.table else self.name)
 
-@dataclass
+    def __hash__(self) -> int:
+        """Structural hash over (kind, table, name, binding)."""
+        return hash((Column, self.table, self.name, self._col_idx))
+
+
+@dataclass(frozen=True, slots=True)
 class Literal(ILiteral):
     """Literal value expression.
-    
+
     Represents a constant value in an expression.
-    
+
     Attributes:
         value: The literal value.
         type_: Optional type hint for the value.
-        
+
     Example:
         ```python
         age_limit = Literal(18, int)
         name_pattern = Literal("%John%", str)
         ```
     """
+    value: Any
+    type_: Optional[Type] = None
 
+    def __hash__(self) -> int:
+        """Structural hash over (kind, value, type)."""
+        return hash((Literal, self.value, self.type_))
 
-@dataclass
+
+# Interned Column instances keyed (name, table, alias). Values are held
+# weakly, so entries vanish as soon as no expression tree references
+# them; the table never grows past the live working set.
+_COLUMN_INTERN: 'weakref.WeakValueDictionary[tuple, Column]' = \
+    weakref.WeakValueDictionary()
+
+# Interned tiny-value literals — True/False/None and small ints, the
+# same values the interpreter itself caches. The key set is bounded,
+# so strong references are fine here.
+_LITERAL_INTERN: Dict[tuple, Literal] = {}
+
+
+def intern_column(name: str, table: Optional[str] = None,
+                  alias: Optional[str] = None) -> Column:
+    """Return the shared :class:`Column` for ``(name, table, alias)``.
+
+    A query whose predicates reference the same column many times
+    (``t.a > 5 AND t.a < 100``) gets one node instead of one per
+    reference: a smaller tree, and identity (``is``) can stand in for
+    structural equality during rewrites.
+    """
+    key = (name, table, alias)
+    column = _COLUMN_INTERN.get(key)
+    if column is None:
+        column = Column(name, table, alias)
+        _COLUMN_INTERN[key] = column
+    return column
+
+
+def intern_literal(value: Any) -> Literal:
+    """Return a :class:`Literal` for ``value``, shared when tiny.
+
+    ``True``, ``False``, ``None`` and integers in ``-16..256`` come
+    from a cache; anything else gets a fresh node. The key includes
+    the value's type so ``True`` and ``1`` stay distinct.
+    """
+    if value is None or value is True or value is False or (
+            type(value) is int and -16 <= value <= 256):
+        key = (value, type(value))
+        literal = _LITERAL_INTERN.get(key)
+        if literal is None:
+            literal = Literal(value)
+            _LITERAL_INTERN[key] = literal
+        return literal
+    return Literal(value)
+
+
+@dataclass(frozen=True, slots=True)
 class BinaryOperator(IOperator):
     """Binary operator expression.
-    
+
     Represents an operation between two expressions.
-    
+
     Attributes:
         left: Left operand expression.
-        operator: Operator symbol (e.g., '=', '>', '+').
+        operator: The operation's :class:`OpCode`; SQL spellings
+            (e.g. ``'='``, ``'>'``, ``'AND'``) are accepted and
+            normalized at construction.
         right: Right operand expression.
-        
+
     Example:
         ```python
         age_check = BinaryOperator(
@@ -81,18 +275,32 @@ class BinaryOperator(IOperator):
         )
         ```
     """
+    left: IExpression
+    operator: OpCode
+    right: IExpression
 
+    def __post_init__(self):
+        """Normalize a string operator spelling to its OpCode."""
+        object.__setattr__(self, 'operator', _normalize_op(self.operator))
 
-@dataclass
+    def __hash__(self) -> int:
+        """Structural hash composing the operand hashes."""
+        return hash((BinaryOperator, self.operator,
+                     hash(self.left), hash(self.right)))
+
+
+@dataclass(frozen=True, slots=True)
 class UnaryOperator(IOperator):
     """Unary operator expression.
-    
+
     Represents an operation on a single expression.
-    
+
     Attributes:
-        operator: Operator symbol (e.g., 'NOT', '-').
+        operator: The operation's :class:`OpCode`; the spellings
+            ``'NOT'`` and ``'-'`` are accepted and normalized at
+            construction.
         operand: The expression to operate on.
-        
+
     Example:
         ```python
         not_active = UnaryOperator(
@@ -101,13 +309,755 @@ class UnaryOperator(IOperator):
         )
         ```
     """
+    operator: OpCode
+    operand: IExpression
+
+    def __post_init__(self):
+        """Normalize a string operator spelling to its OpCode."""
+        object.__setattr__(self, 'operator', _normalize_op(self.operator))
+
+    def __hash__(self) -> int:
+        """Structural hash composing the operand hash."""
+        return hash((UnaryOperator, self.operator, hash(self.operand)))
+
+
+@dataclass(frozen=True, slots=True)
+class InOperator(IOperator):
+    """Set-membership expression: column IN a constant value set.
+
+    Produced by :func:`fuse_or_equalities` from OR-of-equalities
+    chains over one column; a single hash probe per row replaces the
+    chain's k equality comparisons.
+
+    Attributes:
+        column: The column whose value is tested.
+        values: The constant alternatives, as a frozenset.
+    """
+    column: Column
+    values: frozenset
+
+    def accept(self, visitor: IExpressionVisitor) -> Any:
+        """Dispatch to the visitor's IN handler."""
+        return visitor.visit_in(self)
+
+    def __hash__(self) -> int:
+        """Structural hash over (kind, column, values)."""
+        return hash((InOperator, hash(self.column), self.values))
+
+
+@dataclass(frozen=True, slots=True)
+class Conjunction(IOperator):
+    """N-ary AND over a flat tuple of children.
+
+    A k-way AND chain evaluates as one loop with an early exit
+    instead of k-1 nested :class:`BinaryOperator` frames; see
+    :func:`flatten_connectives`.
+
+    Attributes:
+        children: The AND-connected terms, in evaluation order.
+    """
+    children: Tuple[IExpression, ...]
+
+    def accept(self, visitor: IExpressionVisitor) -> Any:
+        """Dispatch to the visitor's conjunction handler."""
+        return visitor.visit_conjunction(self)
+
+    def __hash__(self) -> int:
+        """Structural hash composing the child hashes."""
+        return hash((Conjunction, tuple(map(hash, self.children))))
+
+
+@dataclass(frozen=True, slots=True)
+class Disjunction(IOperator):
+    """N-ary OR over a flat tuple of children.
+
+    The OR counterpart of :class:`Conjunction`: one loop, early exit
+    on the first truthy child.
+
+    Attributes:
+        children: The OR-connected terms, in evaluation order.
+    """
+    children: Tuple[IExpression, ...]
+
+    def accept(self, visitor: IExpressionVisitor) -> Any:
+        """Dispatch to the visitor's disjunction handler."""
+        return visitor.visit_disjunction(self)
+
+    def __hash__(self) -> int:
+        """Structural hash composing the child hashes."""
+        return hash((Disjunction, tuple(map(hash, self.children))))
+
+
+def _column_key(column: Column) -> str:
+    """A column's row key, pre-joined on the node at construction."""
+    return column._key
+
+
+def cast_literal(value: Any, dtype: Any) -> Literal:
+    """Build a Literal pre-cast to a column's dtype, once.
+
+    Comparing a NumPy column against a plain Python value coerces the
+    value on every comparison; materializing the constant in the
+    column's representation up front pays that cost a single time and
+    keeps the vectorized evaluator on its fast same-dtype path.
+
+    Args:
+        value: The literal value.
+        dtype: The target NumPy dtype (anything ``np.dtype`` accepts),
+            or None to skip casting.
+
+    Returns:
+        Literal: The cast literal, or an uncast one when ``dtype`` is
+            None, the object dtype, or the value cannot represent the
+            cast (the comparison then falls back to per-row coercion).
+    """
+    if dtype is None:
+        return Literal(value)
+    try:
+        kind = np.dtype(dtype)
+        if kind.kind == 'O':
+            return Literal(value)
+        cast = kind.type(value)
+    except (TypeError, ValueError):
+        return Literal(value)
+    return Literal(cast, type(cast))
+
+
+def peephole(code: List[Tuple[int, Any]]) -> List[Tuple[int, Any]]:
+    """Optimize compiled bytecode with a small sliding window.
+
+    Applied to completion (each pass re-exposes new windows):
+
+    * constant folding — ``PUSH_LIT a; PUSH_LIT b; <op>`` becomes one
+      ``PUSH_LIT`` with the folded value, and ``PUSH_LIT a; NOT``
+      folds likewise;
+    * cancellation — ``NOT; NOT`` disappears;
+    * boolean identities — a literal that never takes its short-circuit
+      jump (``PUSH_LIT True; JUMP_IF_FALSE`` and the OR mirror) drops
+      out, as do the eager ``PUSH_LIT True; AND`` / ``False; OR``
+      forms;
+    * fusion — ``LOAD_COL k; PUSH_LIT v; <cmp>`` becomes one
+      ``COL_<cmp>_CONST (k, v)`` superinstruction, eliminating the
+      stack traffic of the most common predicate shape.
+
+    Args:
+        code: Program produced by :func:`compile_expression`.
+
+    Returns:
+        List[Tuple[int, Any]]: The optimized program.
+    """
+    changed = True
+    while changed:
+        changed = False
+        # Windows must not swallow an instruction another jump lands
+        # on, and surviving jump args need remapping afterwards.
+        targets = {arg for op, arg in code
+                   if op == JUMP_IF_FALSE or op == JUMP_IF_TRUE}
+        out: List[Tuple[int, Any]] = []
+        pos_map: Dict[int, int] = {}
+        i = 0
+        n = len(code)
+        while i < n:
+            op, arg = code[i]
+            start = len(out)
+            if i + 2 < n and i + 1 not in targets and i + 2 not in targets:
+                mid_op, mid_arg = code[i + 1]
+                last_op = code[i + 2][0]
+                if (op == LOAD_COL and mid_op == PUSH_LIT
+                        and last_op in _FUSED_CMP):
+                    out.append((_FUSED_CMP[last_op], (arg, mid_arg)))
+                    pos_map[i] = pos_map[i + 1] = pos_map[i + 2] = start
+                    i += 3
+                    changed = True
+                    continue
+                if (op == PUSH_LIT and mid_op == PUSH_LIT
+                        and last_op in _FOLD_FUNCS):
+                    out.append((PUSH_LIT, _FOLD_FUNCS[last_op](arg, mid_arg)))
+                    pos_map[i] = pos_map[i + 1] = pos_map[i + 2] = start
+                    i += 3
+                    changed = True
+                    continue
+            if i + 1 < n and i + 1 not in targets:
+                next_op = code[i + 1][0]
+                drop = False
+                if op == PUSH_LIT and next_op == NOT:
+                    out.append((PUSH_LIT, not arg))
+                    drop = True
+                elif op == NOT and next_op == NOT:
+                    drop = True
+                elif op == PUSH_LIT and (
+                        (arg and next_op == JUMP_IF_FALSE)
+                        or (not arg and next_op == JUMP_IF_TRUE)):
+                    # A literal that never takes its jump is a no-op
+                    # pair: push then pop-and-fall-through.
+                    drop = True
+                elif op == PUSH_LIT and (
+                        (arg is True and next_op == AND)
+                        or (arg is False and next_op == OR)):
+                    drop = True
+                if drop:
+                    pos_map[i] = pos_map[i + 1] = start
+                    i += 2
+                    changed = True
+                    continue
+            out.append((op, arg))
+            pos_map[i] = start
+            i += 1
+        pos_map[n] = len(out)
+        code = [(op, pos_map[arg])
+                if op == JUMP_IF_FALSE or op == JUMP_IF_TRUE
+                else (op, arg)
+                for op, arg in out]
+    return code
+
+
+def _compile(expression: IExpression,
+             optimize: bool = True) -> List[Tuple[int, Any]]:
+    """Compile an expression tree, unconditionally (no caching)."""
+    code: List[Tuple[int, Any]] = []
+
+    def emit(node: IExpression) -> None:
+        if isinstance(node, Literal):
+            code.append((PUSH_LIT, node.value))
+        elif isinstance(node, Column):
+            # Bound columns address the row by integer position.
+            code.append((LOAD_COL,
+                         node._col_idx if node._col_idx >= 0 else node._key))
+        elif isinstance(node, BinaryOperator):
+            opc = node.operator
+            if opc is OpCode.AND or opc is OpCode.OR:
+                # Short-circuit: jump over the right operand when the
+                # left value already decides the chain.
+                emit(node.left)
+                jump_at = len(code)
+                code.append((JUMP_IF_FALSE if opc is OpCode.AND
+                             else JUMP_IF_TRUE, -1))
+                emit(node.right)
+                code[jump_at] = (code[jump_at][0], len(code))
+            else:
+                emit(node.left)
+                emit(node.right)
+                code.append((_VM_OPCODES[opc], None))
+        elif isinstance(node, UnaryOperator):
+            emit(node.operand)
+            code.append((_VM_OPCODES[node.operator], None))
+        elif isinstance(node, InOperator):
+            column = node.column
+            code.append((COL_IN_CONST,
+                         (column._col_idx if column._col_idx >= 0
+                          else column._key, node.values)))
+        elif isinstance(node, (Conjunction, Disjunction)):
+            # One short-circuit jump per child, all to the same end:
+            # a k-way chain stays one flat run of code.
+            jump_op = (JUMP_IF_FALSE if isinstance(node, Conjunction)
+                       else JUMP_IF_TRUE)
+            jumps = []
+            for child in node.children[:-1]:
+                emit(child)
+                jumps.append(len(code))
+                code.append((jump_op, -1))
+            emit(node.children[-1])
+            end = len(code)
+            for at in jumps:
+                code[at] = (jump_op, end)
+        else:
+            raise ValueError(f"Cannot compile expression node: {node!r}")
+
+    emit(expression)
+    return peephole(code) if optimize else code
+
+
+# Compiled programs cached by the expressions' structural hash/equality
+# (see the __hash__ methods above): query workloads repeat the same
+# predicate shapes heavily, so structurally-equal trees — not just the
+# same instance — share one compile. Oldest entries are evicted beyond
+# COMPILE_CACHE_SIZE programs.
+COMPILE_CACHE_SIZE = 1024
+
+_compile_cached = lru_cache(maxsize=COMPILE_CACHE_SIZE)(_compile)
+
+
+def compile_expression(expression: IExpression,
+                       optimize: bool = True) -> List[Tuple[int, Any]]:
+    """Linearize an expression tree into stack-machine bytecode.
+
+    The tree is walked post-order exactly once; each node becomes one
+    ``(opcode, arg)`` tuple. Operator spellings are resolved to integer
+    opcodes here, and column row keys are pre-joined, so nothing about
+    the tree shape is re-derived per row. Results are memoized by the
+    tree's structural hash, so repeat compiles of an equal predicate
+    are a cache hit; callers must treat the returned program as
+    immutable.
+
+    Args:
+        expression: The expression tree to compile.
+        optimize: Run :func:`peephole` over the result (the default).
+
+    Returns:
+        List[Tuple[int, Any]]: The flat program for :func:`run`.
+
+    Raises:
+        ValueError: If the tree contains an unknown node or operator.
+    """
+    try:
+        return _compile_cached(expression, optimize)
+    except TypeError:
+        # Unhashable literal somewhere in the tree (e.g. a list value):
+        # compile without caching.
+        return _compile(expression, optimize)
+
+
+def run(code: List[Tuple[int, Any]], row: Any) -> Any:
+    """Execute compiled expression bytecode against one row.
+
+    A single loop over the flat program with an explicit value stack:
+    no Python frames per node, no isinstance checks, no string
+    comparisons.
+
+    Args:
+        code: Program produced by :func:`compile_expression`.
+        row: The row to evaluate against — a dict keyed by column row
+            keys, or, for programs compiled from a schema-bound tree
+            (see :meth:`ExpressionBuilder.bind`), a sequence indexed
+            by schema position.
+
+    Returns:
+        Any: The expression's value for this row.
+    """
+    stack: List[Any] = []
+    push = stack.append
+    pop = stack.pop
+    # Schema-bound programs carry integer column indices and run
+    # against sequence rows; dict rows keep the tolerant .get path.
+    get = row.get if isinstance(row, dict) else row.__getitem__
+    pc = 0
+    n = len(code)
+    while pc < n:
+        op, arg = code[pc]
+        pc += 1
+        if op >= COL_EQ_CONST:
+            key, value = arg
+            if op == COL_EQ_CONST:
+                push(get(key) == value)
+            elif op == COL_NE_CONST:
+                push(get(key) != value)
+            elif op == COL_GT_CONST:
+                push(get(key) > value)
+            elif op == COL_LT_CONST:
+                push(get(key) < value)
+            elif op == COL_GE_CONST:
+                push(get(key) >= value)
+            elif op == COL_LE_CONST:
+                push(get(key) <= value)
+            else:  # COL_IN_CONST
+                push(get(key) in value)
+        elif op == LOAD_COL:
+            push(get(arg))
+        elif op == PUSH_LIT:
+            push(arg)
+        elif op == EQ:
+            b = pop()
+            push(pop() == b)
+        elif op == NE:
+            b = pop()
+            push(pop() != b)
+        elif op == GT:
+            b = pop()
+            push(pop() > b)
+        elif op == LT:
+            b = pop()
+            push(pop() < b)
+        elif op == GE:
+            b = pop()
+            push(pop() >= b)
+        elif op == LE:
+            b = pop()
+            push(pop() <= b)
+        elif op == JUMP_IF_FALSE:
+            if stack[-1]:
+                pop()
+            else:
+                pc = arg
+        elif op == JUMP_IF_TRUE:
+            if stack[-1]:
+                pc = arg
+            else:
+                pop()
+        elif op == AND:
+            b = pop()
+            push(pop() and b)
+        elif op == OR:
+            b = pop()
+            push(pop() or b)
+        elif op == NOT:
+            push(not pop())
+        else:  # NEG
+            push(-pop())
+    return stack[-1]
+
+
+# Leaf cost heuristic for selectivity reordering: cheap, selective
+# equality tests first, then ranges, nested boolean subtrees, and
+# finally function calls.
+_EQUALITY_OPS = frozenset((OpCode.EQ, OpCode.NE))
+_RANGE_OPS = frozenset((OpCode.LT, OpCode.LE, OpCode.GT, OpCode.GE))
+
+
+def _chain_terms(expression: IExpression, op_code: OpCode,
+                 terms: List[IExpression]) -> None:
+    """Flatten a same-operator chain into a term list, in author order.
+
+    Binary chains and the n-ary :class:`Conjunction`/:class:`Disjunction`
+    forms of the operator flatten alike.
+    """
+    if (isinstance(expression, BinaryOperator)
+            and expression.operator is op_code):
+        _chain_terms(expression.left, op_code, terms)
+        _chain_terms(expression.right, op_code, terms)
+    elif isinstance(expression, Conjunction) and op_code is OpCode.AND:
+        for child in expression.children:
+            _chain_terms(child, op_code, terms)
+    elif isinstance(expression, Disjunction) and op_code is OpCode.OR:
+        for child in expression.children:
+            _chain_terms(child, op_code, terms)
+    else:
+        terms.append(expression)
+
+
+def _leaf_cost(expression: IExpression,
+               statistics: Optional[Dict[str, float]]) -> float:
+    """Estimate the evaluation cost / selectivity rank of one term.
+
+    Lower ranks are evaluated first. A caller-supplied cardinality in
+    ``statistics`` (keyed by the column's row key) scales an equality
+    term down further: the more distinct values, the more selective
+    the test.
+    """
+    if isinstance(expression, InOperator):
+        return 1.5  # one hash probe, slightly above a plain equality
+    if isinstance(expression, (Conjunction, Disjunction)):
+        return 5.0  # nested boolean subtree
+    if isinstance(expression, BinaryOperator):
+        op = expression.operator
+        if op in _EQUALITY_OPS:
+            cost = 1.0
+            if statistics:
+                for side in (expression.left, expression.right):
+                    if isinstance(side, Column):
+                        cost /= 1.0 + statistics.get(_column_key(side), 0.0)
+            return cost
+        if op in _RANGE_OPS:
+            return 2.0
+        return 5.0  # nested boolean subtree
+    if isinstance(expression, (Column, Literal)):
+        return 1.0
+    return 10.0  # function call or unknown node
+
+
+def reorder_by_selectivity(
+        expression: IExpression,
+        statistics: Optional[Dict[str, float]] = None) -> IExpression:
+    """Reorder AND/OR chains so short-circuiting does the least work.
+
+    Each same-operator chain is flattened, its terms recursively
+    reordered and stable-sorted by :func:`_leaf_cost` — selective
+    equality tests before range tests before nested subtrees and
+    function calls — then rebuilt right-deep. For AND this fails fast
+    on the cheapest most-selective term; for OR the same ordering puts
+    the cheap decisive tests first.
+
+    Args:
+        expression: The expression tree to reorder.
+        statistics: Optional column cardinalities (keyed like row
+            lookups, e.g. ``"users.age"``) refining equality ranks.
+
+    Returns:
+        IExpression: The reordered tree (input is not mutated).
+    """
+    if isinstance(expression, (Conjunction, Disjunction)):
+        terms = [reorder_by_selectivity(child, statistics)
+                 for child in expression.children]
+        terms.sort(key=lambda term: _leaf_cost(term, statistics))
+        return type(expression)(tuple(terms))
+    if not isinstance(expression, BinaryOperator):
+        return expression
+    op_code = expression.operator
+    if op_code is not OpCode.AND and op_code is not OpCode.OR:
+        return BinaryOperator(
+            reorder_by_selectivity(expression.left, statistics),
+            expression.operator,
+            reorder_by_selectivity(expression.right, statistics))
+
+    terms: List[IExpression] = []
+    _chain_terms(expression, op_code, terms)
+    terms = [reorder_by_selectivity(term, statistics) for term in terms]
+    terms.sort(key=lambda term: _leaf_cost(term, statistics))
+    rebuilt = terms[-1]
+    for term in reversed(terms[:-1]):
+        rebuilt = BinaryOperator(term, expression.operator, rebuilt)
+    return rebuilt
+
+
+def _eq_leaf(expression: IExpression) -> Tuple[Optional[Column], Any]:
+    """Match ``column = literal`` (either operand order).
+
+    Returns:
+        Tuple[Optional[Column], Any]: The column and the literal's
+            value, or ``(None, None)`` when the term is not a fusable
+            equality (including unhashable literal values).
+    """
+    if (isinstance(expression, BinaryOperator)
+            and expression.operator is OpCode.EQ):
+        left, right = expression.left, expression.right
+        if isinstance(right, Column) and isinstance(left, Literal):
+            left, right = right, left
+        if isinstance(left, Column) and isinstance(right, Literal):
+            try:
+                hash(right.value)
+            except TypeError:
+                return None, None
+            return left, right.value
+    return None, None
+
+
+def fuse_or_equalities(expression: IExpression) -> IExpression:
+    """Rewrite OR-of-equalities over one column into an IN test.
+
+    ``region = 'a' OR region = 'b' OR region = 'c'`` performs k
+    comparisons per row; this pass flattens each OR chain, groups its
+    ``column = literal`` leaves by column, and replaces every group of
+    two or more with one :class:`InOperator` over a frozenset — a
+    single hash probe per row. Other terms (and non-OR subtrees) are
+    rewritten recursively and kept in place.
+
+    Args:
+        expression: The expression tree to rewrite.
+
+    Returns:
+        IExpression: The rewritten tree (input is not mutated).
+    """
+    if isinstance(expression, UnaryOperator):
+        return UnaryOperator(expression.operator,
+                             fuse_or_equalities(expression.operand))
+    if isinstance(expression, Conjunction):
+        return Conjunction(tuple(
+            fuse_or_equalities(child) for child in expression.children))
+    if isinstance(expression, Disjunction):
+        fused = fuse_or_equalities(_disjoin(list(expression.children)))
+        return flatten_connectives(fused)
+    if not isinstance(expression, BinaryOperator):
+        return expression
+    if expression.operator is not OpCode.OR:
+        return BinaryOperator(fuse_or_equalities(expression.left),
+                              expression.operator,
+                              fuse_or_equalities(expression.right))
+
+    terms: List[IExpression] = []
+    _chain_terms(expression, OpCode.OR, terms)
+    groups: Dict[Column, List[Any]] = {}
+    fused: List[Any] = []
+    for term in terms:
+        column, value = _eq_leaf(term)
+        if column is not None:
+            values = groups.get(column)
+            if values is None:
+                groups[column] = values = []
+                # 1-tuple placeholder keeps the group's first-seen
+                # position without colliding with expression terms.
+                fused.append((column,))
+            values.append(value)
+        else:
+            fused.append(fuse_or_equalities(term))
+    out: List[IExpression] = []
+    for term in fused:
+        if type(term) is tuple:
+            column = term[0]
+            values = groups[column]
+            if len(values) >= 2:
+                out.append(InOperator(column, frozenset(values)))
+            else:
+                out.append(BinaryOperator(column, OpCode.EQ,
+                                          Literal(values[0])))
+        else:
+            out.append(term)
+    rebuilt = out[-1]
+    for term in reversed(out[:-1]):
+        rebuilt = BinaryOperator(term, OpCode.OR, rebuilt)
+    return rebuilt
+
+
+def split_conjuncts(expression: IExpression) -> List[IExpression]:
+    """Flatten a conjunctive (AND) tree into its terms.
+
+    A non-AND expression is returned as a single-element list, so the
+    result is always the list whose conjunction equals the input.
+
+    Args:
+        expression: The WHERE tree to split.
+
+    Returns:
+        List[IExpression]: The AND-connected terms, in author order.
+    """
+    terms: List[IExpression] = []
+    _chain_terms(expression, OpCode.AND, terms)
+    return terms
+
+
+def referenced_tables(expression: IExpression) -> frozenset:
+    """Collect the table names referenced by an expression's columns.
+
+    Args:
+        expression: The expression tree to walk.
+
+    Returns:
+        frozenset: The ``Column.table`` values found; contains ``None``
+            when unqualified column references occur.
+    """
+    tables: set = set()
+
+    def walk(node: IExpression) -> None:
+        if isinstance(node, Column):
+            tables.add(node.table)
+        elif isinstance(node, BinaryOperator):
+            walk(node.left)
+            walk(node.right)
+        elif isinstance(node, UnaryOperator):
+            walk(node.operand)
+        elif isinstance(node, InOperator):
+            tables.add(node.column.table)
+        elif isinstance(node, (Conjunction, Disjunction)):
+            for child in node.children:
+                walk(child)
+
+    walk(expression)
+    return frozenset(tables)
+
+
+def _conjoin(terms: List[IExpression]) -> IExpression:
+    """Rebuild a right-deep AND tree from a term list."""
+    rebuilt = terms[-1]
+    for term in reversed(terms[:-1]):
+        rebuilt = BinaryOperator(term, OpCode.AND, rebuilt)
+    return rebuilt
+
+
+def _disjoin(terms: List[IExpression]) -> IExpression:
+    """Rebuild a right-deep OR tree from a term list."""
+    rebuilt = terms[-1]
+    for term in reversed(terms[:-1]):
+        rebuilt = BinaryOperator(term, OpCode.OR, rebuilt)
+    return rebuilt
+
+
+def flatten_connectives(expression: IExpression) -> IExpression:
+    """Collapse binary AND/OR chains into n-ary nodes.
+
+    A k-way chain of :class:`BinaryOperator` AND (or OR) becomes one
+    :class:`Conjunction` (:class:`Disjunction`) over a flat child
+    tuple, so evaluation is a single loop with an early exit instead
+    of k-1 nested operator frames. Other nodes are rewritten
+    recursively; already-flat n-ary nodes absorb nested same-operator
+    children.
+
+    Args:
+        expression: The expression tree to flatten.
+
+    Returns:
+        IExpression: The flattened tree (input is not mutated).
+    """
+    if isinstance(expression, UnaryOperator):
+        return UnaryOperator(expression.operator,
+                             flatten_connectives(expression.operand))
+    if isinstance(expression, BinaryOperator):
+        op_code = expression.operator
+        if op_code is not OpCode.AND and op_code is not OpCode.OR:
+            return BinaryOperator(
+                flatten_connectives(expression.left), op_code,
+                flatten_connectives(expression.right))
+    elif isinstance(expression, Conjunction):
+        op_code = OpCode.AND
+    elif isinstance(expression, Disjunction):
+        op_code = OpCode.OR
+    else:
+        return expression
+    terms: List[IExpression] = []
+    _chain_terms(expression, op_code, terms)
+    if len(terms) == 1:
+        return flatten_connectives(terms[0])
+    children = tuple(flatten_connectives(term) for term in terms)
+    if op_code is OpCode.AND:
+        return Conjunction(children)
+    return Disjunction(children)
+
+
+class ExpressionPredicate(IPredicate):
+    """Adapts an expression tree to the storage ``IPredicate``.
+
+    Wraps one (usually pushed-down) conjunct so ``IStorage.read`` can
+    filter rows at the source; evaluation runs the expression's
+    compiled bytecode per candidate row.
+    """
+
+    __slots__ = ('expression', '_program')
+
+    def __init__(self, expression: IExpression):
+        """Wrap an expression, compiling it once up front.
+
+        Args:
+            expression: The predicate tree to evaluate per row.
+        """
+        self.expression = expression
+        self._program = compile_expression(expression)
+
+    def evaluate(self, row: Dict[str, Any]) -> bool:
+        """Evaluate the wrapped expression against a row."""
+        return bool(run(self._program, row))
+
+    def simplify(self) -> 'ExpressionPredicate':
+        """Re-run the peephole optimizer over the compiled program."""
+        self._program = peephole(self._program)
+        return self
+
+
+def push_down_predicate(
+        expression: IExpression, table: str
+) -> Tuple[Optional[ExpressionPredicate], Optional[IExpression]]:
+    """Split a WHERE tree into a storage-pushable part and a residual.
+
+    Conjuncts that reference only the target table (unqualified
+    columns count as the target's in a single-table read) are exact
+    pushdowns: storage can apply them while scanning, so only matching
+    rows are materialized, deserialized and walked by the evaluator.
+    Conjuncts spanning other tables stay behind as post-join filters.
+
+    Args:
+        expression: The full WHERE tree.
+        table: The table being read.
+
+    Returns:
+        Tuple[Optional[ExpressionPredicate], Optional[IExpression]]:
+            The predicate to hand to ``IStorage.read`` (None when
+            nothing is pushable) and the residual expression the
+            engine must still apply (None when everything pushed).
+    """
+    allowed = frozenset((table, None))
+    pushable: List[IExpression] = []
+    residual: List[IExpression] = []
+    for term in split_conjuncts(expression):
+        if referenced_tables(term) <= allowed:
+            pushable.append(term)
+        else:
+            residual.append(term)
+    predicate = ExpressionPredicate(_conjoin(pushable)) if pushable else None
+    remainder = _conjoin(residual) if residual else None
+    return predicate, remainder
 
 
 class ExpressionBuilder:
     """Builder for SQL expressions.
-    
+
     Provides a fluent interface for constructing complex SQL expressions.
-    
+
     Example:
         ```python
         builder = ExpressionBuilder()
@@ -121,17 +1071,732 @@ class ExpressionBuilder:
         ```
     """
 
+    def __init__(self, dtypes: Optional[Dict[str, Any]] = None):
+        """Initialize an empty builder.
+
+        Args:
+            dtypes: Optional mapping of column row key to the column's
+                NumPy dtype. When supplied, comparison literals are
+                cast to the column's dtype once at build time, so no
+                per-row (or per-element, in batch mode) coercion runs
+                at evaluation.
+        """
+        self._result: Optional[IExpression] = None
+        self._current: Optional[IExpression] = None
+        self._pending: Optional[OpCode] = None
+        self._dtypes = dtypes
+
+    def column(self, name: str, table: Optional[str] = None
+               ) -> 'ExpressionBuilder':
+        """Start a term referencing a column (interned, see
+        :func:`intern_column`)."""
+        self._current = intern_column(name, table)
+        return self
+
+    def literal(self, value: Any,
+                target_dtype: Any = None) -> 'ExpressionBuilder':
+        """Start a term holding a literal value.
+
+        Args:
+            value: The literal value.
+            target_dtype: Optional NumPy dtype to cast the value to
+                once, up front (see :func:`cast_literal`).
+        """
+        if target_dtype is not None:
+            self._current = cast_literal(value, target_dtype)
+        else:
+            self._current = intern_literal(value)
+        return self
+
+    def _compare(self, op: OpCode, value: Any) -> 'ExpressionBuilder':
+        """Close the current term with a comparison against a value.
+
+        With dtypes supplied at construction and a column on the left,
+        the comparison value is pre-cast to the column's dtype.
+        """
+        if self._current is None:
+            raise ValueError("No column or literal to compare")
+        if isinstance(value, IExpression):
+            operand = value
+        elif (self._dtypes is not None
+                and isinstance(self._current, Column)):
+            operand = cast_literal(
+                value, self._dtypes.get(self._current._key))
+        else:
+            operand = intern_literal(value)
+        term = BinaryOperator(self._current, op, operand)
+        self._current = None
+        if self._pending is not None:
+            self._result = self._connect(self._result, self._pending, term)
+            self._pending = None
+        else:
+            self._result = term
+        return self
+
+    @staticmethod
+    def _connect(left: IExpression, op: OpCode,
+                 right: IExpression) -> IExpression:
+        """Join two expressions, dropping trivial boolean identities.
+
+        ``Literal(True) AND x`` collapses to ``x`` (and ``Literal(False)
+        OR x`` likewise) during construction, so the dead term never
+        reaches the compiler.
+        """
+        if op is OpCode.AND:
+            if isinstance(left, Literal) and left.value is True:
+                return right
+            if isinstance(right, Literal) and right.value is True:
+                return left
+        elif op is OpCode.OR:
+            if isinstance(left, Literal) and left.value is False:
+                return right
+            if isinstance(right, Literal) and right.value is False:
+                return left
+        return BinaryOperator(left, op, right)
+
+    def eq(self, value: Any) -> 'ExpressionBuilder':
+        """Compare the current term with ``=``."""
+        return self._compare(OpCode.EQ, value)
+
+    def ne(self, value: Any) -> 'ExpressionBuilder':
+        """Compare the current term with ``!=``."""
+        return self._compare(OpCode.NE, value)
+
+    def gt(self, value: Any) -> 'ExpressionBuilder':
+        """Compare the current term with ``>``."""
+        return self._compare(OpCode.GT, value)
+
+    def lt(self, value: Any) -> 'ExpressionBuilder':
+        """Compare the current term with ``<``."""
+        return self._compare(OpCode.LT, value)
+
+    def ge(self, value: Any) -> 'ExpressionBuilder':
+        """Compare the current term with ``>=``."""
+        return self._compare(OpCode.GE, value)
+
+    def le(self, value: Any) -> 'ExpressionBuilder':
+        """Compare the current term with ``<=``."""
+        return self._compare(OpCode.LE, value)
+
+    def and_(self) -> 'ExpressionBuilder':
+        """Connect the next comparison with AND."""
+        self._pending = OpCode.AND
+        return self
+
+    def or_(self) -> 'ExpressionBuilder':
+        """Connect the next comparison with OR."""
+        self._pending = OpCode.OR
+        return self
+
+    @staticmethod
+    def bind(expression: IExpression,
+             schema: Dict[str, int]) -> IExpression:
+        """Resolve column references to positions in a row schema.
+
+        Returns a copy of the tree whose ``Column`` nodes carry the
+        integer index of their row key in ``schema``; programs
+        compiled from a bound tree address sequence rows by native
+        indexing instead of a dict hash-lookup per column reference
+        per row. Columns absent from the schema stay unbound, and the
+        input tree is not mutated.
+
+        Args:
+            expression: The expression tree to bind.
+            schema: Mapping of column row key (``"table.name"`` or
+                the bare name) to its position in each row.
+
+        Returns:
+            IExpression: The bound copy of the tree.
+        """
+        if isinstance(expression, Column):
+            index = schema.get(expression._key, -1)
+            if index < 0:
+                return expression
+            # Deliberately a fresh, non-interned instance: the binding
+            # is schema-specific and must not leak through the shared
+            # node in the intern table.
+            bound = Column(expression.name, expression.table,
+                           expression.alias)
+            object.__setattr__(bound, '_col_idx', index)
+            return bound
+        if isinstance(expression, BinaryOperator):
+            return BinaryOperator(
+                ExpressionBuilder.bind(expression.left, schema),
+                expression.operator,
+                ExpressionBuilder.bind(expression.right, schema))
+        if isinstance(expression, UnaryOperator):
+            return UnaryOperator(
+                expression.operator,
+                ExpressionBuilder.bind(expression.operand, schema))
+        if isinstance(expression, InOperator):
+            return InOperator(
+                ExpressionBuilder.bind(expression.column, schema),
+                expression.values)
+        if isinstance(expression, (Conjunction, Disjunction)):
+            return type(expression)(tuple(
+                ExpressionBuilder.bind(child, schema)
+                for child in expression.children))
+        return expression
+
+    def build(self, statistics: Optional[Dict[str, float]] = None
+              ) -> IExpression:
+        """Get the built expression tree, rewritten for evaluation.
+
+        OR-of-equalities chains are fused into IN tests (see
+        :func:`fuse_or_equalities`) and AND/OR chains are emitted in
+        estimated-selectivity order rather than author order (see
+        :func:`reorder_by_selectivity`).
+
+        Args:
+            statistics: Optional column cardinalities refining the
+                ordering of equality terms.
+
+        Raises:
+            ValueError: If nothing has been built.
+        """
+        if self._result is None:
+            raise ValueError("No expression built")
+        return flatten_connectives(reorder_by_selectivity(
+            fuse_or_equalities(self._result), statistics))
+
+
+# Scalar callable for each OpCode, indexed by value. The comparisons
+# and unary forms come from the C-implemented stdlib operator module;
+# AND/OR are None because the visitor inlines them for short-circuit.
+_SCALAR_FUNCS = (
+    _operator.eq, _operator.ne, _operator.lt, _operator.le,
+    _operator.gt, _operator.ge,
+    None, None,
+    _operator.not_, _operator.neg,
+)
+
+
+def _eval_column(expression: Column, row: Any) -> Any:
+    """Read the column's value from a dict or sequence row."""
+    if isinstance(row, dict):
+        return row.get(expression._key)
+    return row[expression._col_idx]
+
+
+def _eval_literal(expression: Literal, row: Any) -> Any:
+    """Return the literal's value."""
+    return expression.value
+
+
+def _eval_binary(expression: BinaryOperator, row: Any) -> Any:
+    """Evaluate a binary node: inline short-circuit, indexed dispatch."""
+    op = expression.operator
+    left = expression.left
+    if op is OpCode.AND:
+        return (_HANDLERS[type(left)](left, row)
+                and evaluate(expression.right, row))
+    if op is OpCode.OR:
+        return (_HANDLERS[type(left)](left, row)
+                or evaluate(expression.right, row))
+    right = expression.right
+    return _SCALAR_FUNCS[op](_HANDLERS[type(left)](left, row),
+                             _HANDLERS[type(right)](right, row))
+
+
+def _eval_unary(expression: UnaryOperator, row: Any) -> Any:
+    """Evaluate a unary node via the OpCode-indexed callables."""
+    operand = expression.operand
+    return _SCALAR_FUNCS[expression.operator](
+        _HANDLERS[type(operand)](operand, row))
+
+
+def _eval_in(expression: InOperator, row: Any) -> bool:
+    """Test the column's row value for set membership."""
+    column = expression.column
+    if isinstance(row, dict):
+        return row.get(column._key) in expression.values
+    return row[column._col_idx] in expression.values
+
+
+def _eval_conjunction(expression: Conjunction, row: Any) -> Any:
+    """Evaluate an n-ary AND: one loop, early exit on falsy."""
+    value: Any = True
+    for child in expression.children:
+        value = _HANDLERS[type(child)](child, row)
+        if not value:
+            return value
+    return value
+
+
+def _eval_disjunction(expression: Disjunction, row: Any) -> Any:
+    """Evaluate an n-ary OR: one loop, early exit on truthy."""
+    value: Any = False
+    for child in expression.children:
+        value = _HANDLERS[type(child)](child, row)
+        if value:
+            return value
+    return value
+
+
+# Handler per concrete node type, so evaluation is one dict lookup on
+# type() per node — no accept()/visit_*() double dispatch.
+_HANDLERS: Dict[type, Any] = {
+    Column: _eval_column,
+    Literal: _eval_literal,
+    BinaryOperator: _eval_binary,
+    UnaryOperator: _eval_unary,
+    InOperator: _eval_in,
+    Conjunction: _eval_conjunction,
+    Disjunction: _eval_disjunction,
+}
+
+
+def evaluate(expression: IExpression, row: Any) -> Any:
+    """Evaluate an expression tree by direct type-dispatched recursion.
+
+    Skips the Visitor pattern's accept()/visit_*() double dispatch —
+    two Python calls and two attribute lookups per node — in favor of
+    one ``type()`` dict lookup per node, with handlers recursing into
+    children directly. The :class:`IExpressionVisitor` interface
+    remains for non-hot uses (serialization, explain plans); for
+    repeated evaluation of one tree over many rows, the compiled
+    bytecode path (:func:`compile_expression` + :func:`run`) is still
+    preferred.
+
+    Args:
+        expression: The expression tree to evaluate.
+        row: The row to evaluate against — a dict, or a sequence for
+            schema-bound trees.
+
+    Returns:
+        Any: The expression's value for this row.
+
+    Raises:
+        KeyError: If the tree contains a node type with no handler.
+    """
+    return _HANDLERS[type(expression)](expression, row)
+
 
 class ExpressionEvaluator(IExpressionVisitor):
     """Evaluates expressions against a row of data.
-    
-    Implements the visitor pattern to evaluate different types of
-    expressions against actual data values.
-    
+
+    The visitor methods provide one-off per-node evaluation; the main
+    entry point is :meth:`evaluate`, which compiles each expression
+    tree to bytecode once (cached per tree) and runs the stack machine
+    per row.
+
     Example:
         ```python
         evaluator = ExpressionEvaluator()
-        row = {"age": 25, "name": "John"}
-        result = expression.accept(evaluator.with_row(row))
+        row = {"users.age": 25, "users.name": "John"}
+        result = evaluator.evaluate(age_check, row)
+        ```
+    """
+
+    def __init__(self):
+        """Initialize the evaluator."""
+        self._row: Dict[str, Any] = {}
+
+    def with_row(self, row: Dict[str, Any]) -> 'ExpressionEvaluator':
+        """Bind the row the visitor methods evaluate against."""
+        self._row = row
+        return self
+
+    def evaluate(self, expression: IExpression,
+                 row: Dict[str, Any]) -> Any:
+        """Evaluate an expression against a row via compiled bytecode.
+
+        Compilation is memoized by the tree's structural hash inside
+        :func:`compile_expression`, so repeated rows (and structurally
+        equal trees from other evaluators) reuse one program. There is
+        deliberately no per-evaluator layer on top: keying one by
+        ``id(expression)`` would hand a recycled address the previous
+        expression's program once the original is garbage-collected.
+
+        Args:
+            expression: The expression tree to evaluate.
+            row: The row to evaluate against.
+
+        Returns:
+            Any: The expression's value for this row.
+        """
+        return run(compile_expression(expression), row)
+
+    def visit_column(self, column: IColumn) -> Any:
+        """Look the column up in the bound row.
+
+        Dict rows are addressed by the pre-joined key; sequence rows
+        by the column's schema position (see
+        :meth:`ExpressionBuilder.bind`).
+        """
+        row = self._row
+        if isinstance(row, dict):
+            return row.get(column._key)
+        return row[column._col_idx]
+
+    def visit_literal(self, literal: ILiteral) -> Any:
+        """Return the literal's value."""
+        return literal.value
+
+    def visit_function(self, function: Any) -> Any:
+        """Function evaluation is handled by the execution engine."""
+        raise NotImplementedError(
+            "Function expressions are evaluated by the planner")
+
+    def visit_operator(self, operator: IOperator) -> Any:
+        """Evaluate one operator node directly, without compiling.
+
+        Dispatch indexes the C-implemented callables in
+        :data:`_SCALAR_FUNCS` by OpCode; AND/OR stay inline so Python's
+        native short-circuit skips the right subtree. This is the
+        one-off path — repeated evaluation goes through
+        :meth:`evaluate` and the bytecode VM.
+        """
+        op = operator.operator
+        if isinstance(operator, UnaryOperator):
+            return _SCALAR_FUNCS[op](operator.operand.accept(self))
+        if op is OpCode.AND:
+            return operator.left.accept(self) and operator.right.accept(self)
+        if op is OpCode.OR:
+            return operator.left.accept(self) or operator.right.accept(self)
+        return _SCALAR_FUNCS[op](operator.left.accept(self),
+                                 operator.right.accept(self))
+
+    def visit_in(self, in_operator: InOperator) -> bool:
+        """Test the column's row value for set membership."""
+        row = self._row
+        if isinstance(row, dict):
+            return row.get(in_operator.column._key) in in_operator.values
+        return row[in_operator.column._col_idx] in in_operator.values
+
+    def visit_conjunction(self, conjunction: Conjunction) -> Any:
+        """Evaluate an n-ary AND: one loop, early exit on falsy."""
+        value: Any = True
+        for child in conjunction.children:
+            value = child.accept(self)
+            if not value:
+                return value
+        return value
+
+    def visit_disjunction(self, disjunction: Disjunction) -> Any:
+        """Evaluate an n-ary OR: one loop, early exit on truthy."""
+        value: Any = False
+        for child in disjunction.children:
+            value = child.accept(self)
+            if value:
+                return value
+        return value
+
+
+# NumPy ufunc for each OpCode, indexed by value: comparisons, then
+# the boolean connectives (whose operands are already masks), then
+# the unary forms.
+_BATCH_UFUNCS = (
+    np.equal, np.not_equal, np.less, np.less_equal,
+    np.greater, np.greater_equal,
+    np.logical_and, np.logical_or, np.logical_not, np.negative,
+)
+
+
+class BatchExpressionEvaluator(IExpressionVisitor):
+    """Evaluates expressions against whole columns at once via NumPy.
+
+    Where :class:`ExpressionEvaluator` walks one row per call, this
+    visitor is handed a columnar batch (``Dict[str, np.ndarray]``) and
+    evaluates each node over every row in one vectorized operation, so
+    the per-row cost collapses to NumPy's C loops. Comparison nodes
+    return boolean masks, ``AND``/``OR``/``NOT`` combine masks with
+    ``np.logical_*``, and the final result indexes straight back into
+    the columns: ``{c: arr[mask] for c, arr in columns.items()}``.
+
+    Short-circuiting does not apply here — both operands of a
+    connective are fully materialized — which is the usual trade of
+    batch evaluation: a few extra vectorized passes in exchange for
+    removing the per-row interpreter entirely.
+
+    Example:
+        ```python
+        columns = {"age": np.array([17, 25, 40]),
+                   "active": np.array([True, True, False])}
+        mask = BatchExpressionEvaluator(columns).evaluate(predicate)
+        survivors = {c: arr[mask] for c, arr in columns.items()}
         ```
-    """
\ No newline at end of file
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        """Bind the columnar batch to evaluate against.
+
+        Args:
+            columns: Mapping of column key (as produced by the same
+                naming the row evaluator uses — ``"table.name"`` or
+                the bare name) to a NumPy array of values. All arrays
+                must share one length.
+        """
+        self.columns = columns
+
+    def evaluate(self, expression: IExpression) -> np.ndarray:
+        """Evaluate an expression tree over the bound batch.
+
+        Args:
+            expression: The expression tree to evaluate.
+
+        Returns:
+            np.ndarray: A boolean mask (or value array, for
+                non-predicate subtrees) with one entry per row.
+        """
+        return expression.accept(self)
+
+    def visit_column(self, column: IColumn) -> np.ndarray:
+        """Return the column's array for the qualified or bare key."""
+        key = column._key
+        array = self.columns.get(key)
+        if array is None and column.table is not None:
+            array = self.columns.get(column.name)
+        if array is None:
+            raise KeyError(f"Unknown column in batch: {key!r}")
+        return array
+
+    def visit_literal(self, literal: ILiteral) -> Any:
+        """Return the literal's value; NumPy broadcasts scalars."""
+        return literal.value
+
+    def visit_function(self, function: Any) -> Any:
+        """Function evaluation is handled by the execution engine."""
+        raise NotImplementedError(
+            "Function expressions are evaluated by the planner")
+
+    def visit_operator(self, operator: IOperator) -> np.ndarray:
+        """Vectorize one operator node over the batch.
+
+        The node's OpCode indexes straight into the ufunc table —
+        comparisons, mask connectives and the unary forms alike — so
+        dispatch is one tuple lookup, no string compares.
+        """
+        if isinstance(operator, UnaryOperator):
+            return _BATCH_UFUNCS[operator.operator](
+                operator.operand.accept(self))
+        return _BATCH_UFUNCS[operator.operator](
+            operator.left.accept(self), operator.right.accept(self))
+
+    def visit_in(self, in_operator: InOperator) -> np.ndarray:
+        """Vectorize a set-membership test over the column's array."""
+        return np.isin(self.visit_column(in_operator.column),
+                       list(in_operator.values))
+
+    def visit_conjunction(self, conjunction: Conjunction) -> np.ndarray:
+        """Reduce the child masks with a single logical AND pass."""
+        return np.logical_and.reduce(
+            [child.accept(self) for child in conjunction.children])
+
+    def visit_disjunction(self, disjunction: Disjunction) -> np.ndarray:
+        """Reduce the child masks with a single logical OR pass."""
+        return np.logical_or.reduce(
+            [child.accept(self) for child in disjunction.children])
+
+
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Source-level spelling for each OpCode, indexed by value.
+# Comparisons use NumPy's elementwise operators and connectives the
+# bitwise forms, so the same generated source is valid both as a
+# plain vectorized NumPy function and as a Numba-compiled kernel.
+_SRC_SYMBOLS = ('==', '!=', '<', '<=', '>', '>=', '&', '|', '~', '-')
+
+# Calls before an expression is considered hot enough to pay the
+# Numba compile cost (ClickHouse's min_count_to_compile_expression
+# plays the same role); colder expressions run the generated source
+# as a plain vectorized NumPy function.
+MIN_CALLS_TO_JIT = 3
+
+# (structural hash, dtype signature) -> compiled callable, plus the
+# per-expression call counts driving the hotness threshold.
+_jit_cache: Dict[Tuple[int, Tuple[Tuple[str, str], ...]], Any] = {}
+_jit_call_counts: Dict[int, int] = {}
+
+
+def _jit_source(expression: IExpression) -> Tuple[str, List[str]]:
+    """Generate Python source for an expression over array arguments.
+
+    Columns become positional parameters (names sanitized to valid
+    identifiers), literals are embedded as constants, and operators
+    use NumPy's elementwise spellings, so the emitted function is
+    equally valid as a plain NumPy function or a Numba kernel.
+
+    Args:
+        expression: The expression tree to translate.
+
+    Returns:
+        Tuple[str, List[str]]: The function source (named ``_pred``)
+            and the column keys in parameter order.
+
+    Raises:
+        ValueError: If the tree contains a node or literal the
+            generator cannot express as source.
+    """
+    params: Dict[str, str] = {}
+
+    def emit(node: IExpression) -> str:
+        if isinstance(node, Literal):
+            if node.value is None or isinstance(
+                    node.value, (bool, int, float, str)):
+                return repr(node.value)
+            raise ValueError(
+                f"Literal not expressible as source: {node.value!r}")
+        if isinstance(node, Column):
+            key = _column_key(node)
+            name = params.get(key)
+            if name is None:
+                name = f"_col{len(params)}"
+                params[key] = name
+            return name
+        if isinstance(node, BinaryOperator):
+            symbol = _SRC_SYMBOLS[node.operator]
+            return f"({emit(node.left)} {symbol} {emit(node.right)})"
+        if isinstance(node, UnaryOperator):
+            return f"({_SRC_SYMBOLS[node.operator]}{emit(node.operand)})"
+        if isinstance(node, Conjunction):
+            return "(" + " & ".join(
+                emit(child) for child in node.children) + ")"
+        if isinstance(node, Disjunction):
+            return "(" + " | ".join(
+                emit(child) for child in node.children) + ")"
+        raise ValueError(f"Cannot generate source for: {node!r}")
+
+    body = emit(expression)
+    source = (f"def _pred({', '.join(params.values())}):\n"
+              f"    return {body}\n")
+    return source, list(params)
+
+
+def jit_compile(expression: IExpression,
+                dtypes: Dict[str, Any]) -> Any:
+    """Compile an expression to a native (or vectorized) array kernel.
+
+    The tree is translated to Python source over positional array
+    arguments and compiled with ``numba.njit`` once it has been
+    requested :data:`MIN_CALLS_TO_JIT` times with the same structural
+    hash — single-shot queries never pay the compile cost. Below the
+    threshold, when Numba is unavailable, or when a column dtype is
+    not numeric, the same generated source runs as a plain vectorized
+    NumPy function, which is already the batch-evaluation fast path.
+
+    Compiled kernels are cached keyed by (structural AST hash, dtype
+    signature), so the same predicate over differently-typed columns
+    specializes separately.
+
+    Args:
+        expression: The predicate tree to compile.
+        dtypes: Mapping of column key to ``np.dtype`` for the arrays
+            the kernel will be called with.
+
+    Returns:
+        Callable: A function taking one positional ``np.ndarray`` per
+            referenced column and returning a boolean mask. The
+            argument order is exposed on the returned function as its
+            ``columns`` attribute.
+    """
+    source, columns = _jit_source(expression)
+    tree_hash = hash(expression)
+    signature = tuple(sorted(
+        (key, np.dtype(dtype).str) for key, dtype in dtypes.items()))
+    cache_key = (tree_hash, signature)
+    fn = _jit_cache.get(cache_key)
+    if fn is not None:
+        return fn
+    namespace: Dict[str, Any] = {}
+    exec(source, namespace)  # noqa: S102 - source built above
+    fn = namespace['_pred']
+
+    calls = _jit_call_counts.get(tree_hash, 0) + 1
+    _jit_call_counts[tree_hash] = calls
+    numeric = all(
+        np.dtype(dtypes[key]).kind in 'ifb'
+        for key in columns if key in dtypes)
+    if HAS_NUMBA and numeric and calls >= MIN_CALLS_TO_JIT:
+        fn = numba.njit(cache=True)(fn)
+        _jit_cache[cache_key] = fn
+    fn.columns = tuple(columns)
+    return fn
+
+
+# Python source spelling for each OpCode, indexed by value, for the
+# closure generator: comparisons as-is, connectives as the keyword
+# forms so the generated lambda gets CPython's native short-circuit.
+_CLOSURE_SYMBOLS = ('==', '!=', '<', '<=', '>', '>=',
+                    'and', 'or', 'not', '-')
+
+# Generated closures cached by their source text, which doubles as a
+# structural key: equal trees render to equal source.
+_CLOSURE_CACHE: Dict[str, Any] = {}
+
+
+def build_source(expression: IExpression) -> str:
+    """Render an expression tree as a Python source fragment over ``row``.
+
+    Columns become ``row['table.name']`` subscripts (or ``row[i]`` for
+    schema-bound columns), literals are embedded as constants, and
+    AND/OR use the keyword forms so short-circuiting comes from
+    CPython itself.
+
+    Args:
+        expression: The expression tree to render.
+
+    Returns:
+        str: A Python expression string reading from a ``row`` name.
+
+    Raises:
+        ValueError: If the tree contains a node or literal that
+            cannot be rendered as source.
+    """
+    if isinstance(expression, Literal):
+        if expression.value is None or isinstance(
+                expression.value, (bool, int, float, str)):
+            return repr(expression.value)
+        raise ValueError(
+            f"Literal not expressible as source: {expression.value!r}")
+    if isinstance(expression, Column):
+        if expression._col_idx >= 0:
+            return f"row[{expression._col_idx}]"
+        return f"row[{expression._key!r}]"
+    if isinstance(expression, BinaryOperator):
+        return (f"({build_source(expression.left)}"
+                f" {_CLOSURE_SYMBOLS[expression.operator]}"
+                f" {build_source(expression.right)})")
+    if isinstance(expression, UnaryOperator):
+        return (f"({_CLOSURE_SYMBOLS[expression.operator]}"
+                f" {build_source(expression.operand)})")
+    if isinstance(expression, Conjunction):
+        return "(" + " and ".join(
+            build_source(child) for child in expression.children) + ")"
+    if isinstance(expression, Disjunction):
+        return "(" + " or ".join(
+            build_source(child) for child in expression.children) + ")"
+    raise ValueError(f"Cannot generate source for: {expression!r}")
+
+
+def compile_closure(expression: IExpression) -> Any:
+    """Specialize an expression into one Python closure via codegen.
+
+    The tree is rendered by :func:`build_source` and compiled as a
+    single ``lambda row: ...``, so CPython inlines the whole predicate
+    into one bytecode stream — no interpreter dispatch per node, no
+    new dependencies. Closures are cached by source text, so
+    structurally equal trees share one compile.
+
+    Unlike :func:`run`'s tolerant ``.get`` lookups, the generated
+    closure subscripts the row directly: a missing column raises
+    ``KeyError`` rather than comparing against ``None``.
+
+    Args:
+        expression: The predicate tree to specialize.
+
+    Returns:
+        Callable: A function of one row (dict, or sequence for
+            schema-bound trees) returning the predicate's value.
+    """
+    source = f"lambda row: {build_source(expression)}"
+    fn = _CLOSURE_CACHE.get(source)
+    if fn is None:
+        code = compile(source, '<predicate>', 'eval')
+        fn = eval(code, {'__builtins__': {}})  # noqa: S307 - built above
+        _CLOSURE_CACHE[source] = fn
+    return fn
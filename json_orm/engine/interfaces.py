@@ -23,7 +23,9 @@ Typical usage example:
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Generic, TypeVar
+from typing import Any, Dict, Iterator, List, Optional, Generic, TypeVar
+
+import numpy as np
 
 T = TypeVar('T')
 
@@ -45,6 +47,11 @@ class IExpression(ABC):
         ```
     """
 
+    # Empty slots so slotted expression dataclasses actually shed
+    # their per-instance __dict__; a WHERE clause allocates one node
+    # per comparison and connective.
+    __slots__ = ()
+
     @abstractmethod
     def accept(self, visitor: 'IExpressionVisitor') -> Any:
         """Accepts a visitor to process this expression.
@@ -120,6 +127,96 @@ class IExpressionVisitor(ABC):
         """
         pass
 
+    def visit_in(self, in_operator: Any) -> Any:
+        """Process a set-membership (IN) expression.
+
+        Concrete by default so visitors predating the IN rewrite keep
+        working; evaluating visitors override this.
+
+        Args:
+            in_operator: The IN expression to process.
+
+        Returns:
+            Any: The result of processing the expression.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not handle IN expressions")
+
+    def visit_conjunction(self, conjunction: Any) -> Any:
+        """Process an n-ary AND expression.
+
+        Concrete by default, like :meth:`visit_in`; evaluating
+        visitors override this.
+
+        Args:
+            conjunction: The n-ary AND expression to process.
+
+        Returns:
+            Any: The result of processing the expression.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not handle n-ary AND")
+
+    def visit_disjunction(self, disjunction: Any) -> Any:
+        """Process an n-ary OR expression.
+
+        Concrete by default, like :meth:`visit_in`; evaluating
+        visitors override this.
+
+        Args:
+            disjunction: The n-ary OR expression to process.
+
+        Returns:
+            Any: The result of processing the expression.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not handle n-ary OR")
+
+
+class IColumn(IExpression):
+    """Marker interface for column reference expressions.
+
+    Concrete column expressions subclass this so visitors and the
+    expression compiler can dispatch on node kind without probing
+    attributes.
+    """
+
+    __slots__ = ()
+
+    def accept(self, visitor: 'IExpressionVisitor') -> Any:
+        """Dispatch to the visitor's column handler."""
+        return visitor.visit_column(self)
+
+
+class ILiteral(IExpression):
+    """Marker interface for literal value expressions."""
+
+    __slots__ = ()
+
+    def accept(self, visitor: 'IExpressionVisitor') -> Any:
+        """Dispatch to the visitor's literal handler."""
+        return visitor.visit_literal(self)
+
+
+class IFunction(IExpression):
+    """Marker interface for function call expressions."""
+
+    __slots__ = ()
+
+    def accept(self, visitor: 'IExpressionVisitor') -> Any:
+        """Dispatch to the visitor's function handler."""
+        return visitor.visit_function(self)
+
+
+class IOperator(IExpression):
+    """Marker interface for operator expressions (unary and binary)."""
+
+    __slots__ = ()
+
+    def accept(self, visitor: 'IExpressionVisitor') -> Any:
+        """Dispatch to the visitor's operator handler."""
+        return visitor.visit_operator(self)
+
 
 class IStatement(ABC):
     """Abstract base class for all SQL statements.
@@ -292,7 +389,7 @@ class IStorage(ABC):
 
     @abstractmethod
     def read(self, table: str, columns: List[str],
-             predicate: Optional['IPredicate'] = None) -> 'IResultSet':
+             predicate: Optional['IPredicate'] = None) -> 'IColumnarResultSet':
         """Read data from storage.
 
         Args:
@@ -301,7 +398,9 @@ class IStorage(ABC):
             predicate: Optional predicate to filter rows.
 
         Returns:
-            IResultSet: The query results.
+            IColumnarResultSet: The query results in columnar (SoA)
+                form; row-wise consumers go through the inherited
+                :class:`IResultSet` iteration methods.
         """
         pass
 
@@ -362,6 +461,11 @@ class IResultSet(ABC, Generic[T]):
         ```
     """
 
+    # Empty slots so concrete result sets can declare their own and
+    # actually drop the per-instance __dict__; results are created and
+    # iterated in the hottest loops of query execution.
+    __slots__ = ()
+
     @abstractmethod
     def next(self) -> Optional[T]:
         """Get the next result.
@@ -380,6 +484,83 @@ class IResultSet(ABC, Generic[T]):
         """
         pass
 
+    def iter_batches(self, size: int = 8192
+                     ) -> Iterator[Dict[str, np.ndarray]]:
+        """Iterate the remaining results as columnar batches.
+
+        Amortizes the per-row Python-call cost of :meth:`next` over
+        ``size`` rows at a time and yields batches in the shape the
+        vectorized expression evaluator consumes directly: one array
+        per column. This default accumulates rows through
+        :meth:`next` and pivots; columnar result sets override it to
+        slice their buffers without touching rows at all.
+
+        Args:
+            size: Maximum number of rows per batch.
+
+        Yields:
+            Dict[str, np.ndarray]: Column name to value-array mapping
+                for up to ``size`` rows. Arrays are typed (``int64``,
+                ``float64``, ``bool``) where the values allow, dtype
+                ``object`` otherwise.
+        """
+        while True:
+            rows: List[Any] = []
+            while len(rows) < size:
+                row = self.next()
+                if row is None:
+                    break
+                rows.append(row)
+            if not rows:
+                return
+            yield {
+                name: np.array([row.get(name) for row in rows])
+                for name in rows[0]
+            }
+            if len(rows) < size:
+                return
+
+
+class IColumnarResultSet(IResultSet[Dict[str, Any]]):
+    """Interface for columnar (structure-of-arrays) query results.
+
+    The primary result layout of the engine: one array per column
+    instead of one dict per row, so scans and the vectorized
+    expression evaluator touch contiguous buffers rather than doing a
+    hash lookup per value. Row-at-a-time consumers still work through
+    the inherited :class:`IResultSet` methods, which materialize dict
+    views lazily during migration.
+
+    Example:
+        ```python
+        result = storage.read("users", ["id", "age"])
+        mask = BatchExpressionEvaluator(result.columns).evaluate(pred)
+        ```
+    """
+
+    __slots__ = ()
+
+    @property
+    @abstractmethod
+    def columns(self) -> Dict[str, np.ndarray]:
+        """The underlying column buffers, keyed by column name.
+
+        Returns:
+            Dict[str, np.ndarray]: Typed arrays (``int64``,
+                ``float64``, ``bool``) where the data allows, dtype
+                ``object`` for heterogeneous columns. No copies.
+        """
+        pass
+
+    @abstractmethod
+    def row_count(self) -> int:
+        """Get the number of rows in the result.
+
+        Returns:
+            int: The row count, independent of iteration position.
+        """
+        pass
+
 
 class IOptimizer(ABC):
     """Interface for query optimization.
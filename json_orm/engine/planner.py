@@ -12,43 +12,501 @@ Example:
     ```python
     # Create a query planner
     planner = QueryPlanner()
-    
+
     # Plan a query
     select_stmt = select(User).where(User.age > 18).join(Order)
     plan = select_stmt.accept(planner)
-    
+
     # Execute the plan
     result = plan.execute(context)
     ```
 """
 
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from .execution import (
+    DeletePlan, FusedScanProjectLimitPlan, InsertPlan, JoinPlan, LimitPlan,
+    ProjectPlan, TableScanPlan, UpdatePlan
+)
+from .expressions import (
+    BinaryOperator, Column, Conjunction, Disjunction, InOperator, OpCode,
+    UnaryOperator, referenced_tables, split_conjuncts
+)
 from .interfaces import (
-    IStatementVisitor
+    IExpression, IStatementVisitor
 )
 
+# Default selectivity assumed for a join condition when no statistics
+# are available for the joined columns.
+DEFAULT_JOIN_SELECTIVITY = 0.1
+
+# Row count assumed for tables that have never been analyzed.
+DEFAULT_ROW_COUNT = 1000
+
+# Fraction of rows an equality predicate is assumed to keep when the
+# column's distinct count is unknown.
+DEFAULT_EQUALITY_SELECTIVITY = 0.1
+
+# Fraction of rows a range predicate is assumed to keep when the
+# column's min/max are unknown.
+DEFAULT_RANGE_SELECTIVITY = 0.33
+
+# Cached plans kept per planner; each entry pins its plan and
+# predicate, so the cache is LRU-bounded rather than unbounded.
+PLAN_CACHE_SIZE = 256
+
+
+def _predicate_fingerprint(predicate: Any) -> Any:
+    """Structural fingerprint of a predicate, for plan-cache keys.
+
+    ``str(predicate)`` is not usable as a key: model conditions have no
+    structural ``__repr__``, so stringifying them embeds the instance's
+    memory address and every rerun of an identical query would get a
+    fresh cache slot. The fingerprint captures type, field, operator
+    and operand instead. Literal values are deliberately part of the
+    key — cached plans pin the predicate instance they were built
+    with, so a plan must only be reused for an operand-identical query.
+    """
+    if predicate is None:
+        return None
+    field = getattr(predicate, 'field', None)
+    if field is not None:
+        op = getattr(predicate, 'tag', None) \
+            or getattr(getattr(predicate, 'op', None), '__name__', '')
+        return (type(predicate).__name__, field, op,
+                _operand_key(getattr(predicate, 'value', None)))
+    children = getattr(predicate, 'conditions', None)
+    if children is not None:
+        return (type(predicate).__name__,
+                tuple(_predicate_fingerprint(c) for c in children))
+    # Engine expressions are frozen dataclasses whose repr is
+    # structural (fields and literals, no addresses).
+    return (type(predicate).__name__, str(predicate))
+
+
+def _operand_key(value: Any) -> Any:
+    """Hashable key for a predicate's constant operand."""
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+class TableStatistics:
+    """Summary statistics for one table, feeding the cost model.
+
+    Attributes:
+        row_count: Number of rows in the table.
+        distinct_values: Per-column distinct value counts.
+        minimums: Per-column minimum values.
+        maximums: Per-column maximum values.
+        null_counts: Per-column null counts.
+    """
+
+    def __init__(self, row_count: int = DEFAULT_ROW_COUNT,
+                 distinct_values: Optional[Dict[str, int]] = None,
+                 minimums: Optional[Dict[str, Any]] = None,
+                 maximums: Optional[Dict[str, Any]] = None,
+                 null_counts: Optional[Dict[str, int]] = None):
+        self.row_count = row_count
+        self.distinct_values = distinct_values or {}
+        self.minimums = minimums or {}
+        self.maximums = maximums or {}
+        self.null_counts = null_counts or {}
+
+
+class StatsCatalog:
+    """Holds table statistics used by the planner's cost model."""
+
+    def __init__(self):
+        self._tables: Dict[str, TableStatistics] = {}
+
+    def set_row_count(self, table: str, count: int) -> None:
+        """Record the number of rows in a table."""
+        self._ensure(table).row_count = count
+
+    def row_count(self, table: str) -> int:
+        """Get the (estimated) number of rows in a table."""
+        statistics = self._tables.get(table)
+        return statistics.row_count if statistics else DEFAULT_ROW_COUNT
+
+    def set_statistics(self, table: str,
+                       statistics: TableStatistics) -> None:
+        """Record full summary statistics for a table."""
+        self._tables[table] = statistics
+
+    def statistics(self, table: Optional[str]) -> Optional[TableStatistics]:
+        """Get a table's statistics, or None if never analyzed."""
+        return self._tables.get(table) if table is not None else None
+
+    def analyze_rows(self, table: str,
+                     rows: List[Dict[str, Any]]) -> TableStatistics:
+        """Build (and record) statistics from a table's raw rows.
+
+        One pass over the rows collects row count, per-column distinct
+        counts, min/max for orderable columns and null counts.
+
+        Args:
+            table: Name of the analyzed table.
+            rows: The table's rows as dictionaries.
+
+        Returns:
+            TableStatistics: The recorded statistics.
+        """
+        statistics = TableStatistics(row_count=len(rows))
+        columns = rows[0].keys() if rows else ()
+        for column in columns:
+            values = [row.get(column) for row in rows]
+            present = [v for v in values if v is not None]
+            statistics.null_counts[column] = len(values) - len(present)
+            try:
+                statistics.distinct_values[column] = len(set(present))
+            except TypeError:
+                # Unhashable values; leave the distinct count unknown.
+                pass
+            try:
+                statistics.minimums[column] = min(present)
+                statistics.maximums[column] = max(present)
+            except (TypeError, ValueError):
+                pass
+        self._tables[table] = statistics
+        return statistics
+
+    def _ensure(self, table: str) -> TableStatistics:
+        """Get a table's statistics, creating a default record."""
+        statistics = self._tables.get(table)
+        if statistics is None:
+            statistics = TableStatistics()
+            self._tables[table] = statistics
+        return statistics
+
+
+def _equality_selectivity(column: Column,
+                          catalog: Optional[StatsCatalog]) -> float:
+    """Selectivity of ``column = constant``: one value in distinct."""
+    statistics = catalog.statistics(column.table) if catalog else None
+    if statistics is not None:
+        distinct = statistics.distinct_values.get(column.name)
+        if distinct:
+            return 1.0 / distinct
+    return DEFAULT_EQUALITY_SELECTIVITY
+
+
+def _equijoin_selectivity(left: Column, right: Column,
+                          catalog: Optional[StatsCatalog]) -> float:
+    """Selectivity of ``left = right`` across two tables.
+
+    The classic estimate ``1 / max(distinct_left, distinct_right)`` —
+    equivalently ``|L|*|R|*min(1/d_L, 1/d_R)`` output rows.
+    """
+    distinct = 0
+    for column in (left, right):
+        statistics = catalog.statistics(column.table) if catalog else None
+        if statistics is not None:
+            distinct = max(distinct,
+                           statistics.distinct_values.get(column.name, 0))
+    return 1.0 / distinct if distinct else DEFAULT_JOIN_SELECTIVITY
+
+
+def _range_selectivity(operator: BinaryOperator,
+                       catalog: Optional[StatsCatalog]) -> float:
+    """Selectivity of a range comparison against a constant.
+
+    Interpolates the constant's position inside the column's [min, max]
+    when statistics allow, falling back to a fixed default.
+    """
+    column, literal = operator.left, operator.right
+    flipped = False
+    if not isinstance(column, Column):
+        column, literal, flipped = literal, column, True
+    statistics = catalog.statistics(column.table) if catalog else None
+    if statistics is None:
+        return DEFAULT_RANGE_SELECTIVITY
+    low = statistics.minimums.get(column.name)
+    high = statistics.maximums.get(column.name)
+    try:
+        span = high - low
+        fraction = (literal.value - low) / span if span else 0.5
+    except TypeError:
+        return DEFAULT_RANGE_SELECTIVITY
+    fraction = min(1.0, max(0.0, fraction))
+    below = operator.operator in (OpCode.LT, OpCode.LE)
+    if flipped:
+        below = not below
+    return fraction if below else 1.0 - fraction
+
+
+def _comparison_selectivity(operator: BinaryOperator,
+                            catalog: Optional[StatsCatalog]) -> float:
+    """Selectivity of a single comparison node."""
+    left_is_column = isinstance(operator.left, Column)
+    right_is_column = isinstance(operator.right, Column)
+    if left_is_column and right_is_column:
+        if operator.operator is OpCode.EQ:
+            return _equijoin_selectivity(operator.left, operator.right,
+                                         catalog)
+        return DEFAULT_RANGE_SELECTIVITY
+    if not (left_is_column or right_is_column):
+        return 1.0
+    column = operator.left if left_is_column else operator.right
+    if operator.operator is OpCode.EQ:
+        return _equality_selectivity(column, catalog)
+    if operator.operator is OpCode.NE:
+        return 1.0 - _equality_selectivity(column, catalog)
+    if operator.operator in (OpCode.LT, OpCode.LE, OpCode.GT, OpCode.GE):
+        return _range_selectivity(operator, catalog)
+    return 1.0
+
+
+def estimate_selectivity(expression: Any,
+                         catalog: Optional[StatsCatalog] = None) -> float:
+    """Estimate the fraction of rows a predicate keeps.
+
+    Equality keeps ``1/distinct``, ranges interpolate against the
+    column's min/max, AND multiplies, OR combines by
+    inclusion-exclusion and NOT complements. Shapes the estimator does
+    not understand count as keeping every row, so an unknown predicate
+    never makes a plan look cheaper than it is.
+
+    Args:
+        expression: Predicate expression tree.
+        catalog: Optional statistics refining the estimates.
+
+    Returns:
+        float: Estimated selectivity in ``[0.0, 1.0]``.
+    """
+    if isinstance(expression, BinaryOperator):
+        operator = expression.operator
+        if operator is OpCode.AND:
+            return (estimate_selectivity(expression.left, catalog)
+                    * estimate_selectivity(expression.right, catalog))
+        if operator is OpCode.OR:
+            s1 = estimate_selectivity(expression.left, catalog)
+            s2 = estimate_selectivity(expression.right, catalog)
+            return s1 + s2 - s1 * s2
+        return _comparison_selectivity(expression, catalog)
+    if isinstance(expression, UnaryOperator):
+        if expression.operator is OpCode.NOT:
+            return 1.0 - estimate_selectivity(expression.operand, catalog)
+        return 1.0
+    if isinstance(expression, InOperator):
+        equality = _equality_selectivity(expression.column, catalog)
+        return min(1.0, equality * len(expression.values))
+    if isinstance(expression, Conjunction):
+        selectivity = 1.0
+        for child in expression.children:
+            selectivity *= estimate_selectivity(child, catalog)
+        return selectivity
+    if isinstance(expression, Disjunction):
+        selectivity = 0.0
+        for child in expression.children:
+            s = estimate_selectivity(child, catalog)
+            selectivity = selectivity + s - selectivity * s
+        return selectivity
+    return 1.0
+
+
+class JoinGraph:
+    """Join graph over a statement's tables, held as integer bitsets.
+
+    Each table occupies one bit of a Python int, so subsets of tables
+    are plain ints and set algebra is bitwise arithmetic. Edges come
+    from predicate conjuncts that reference exactly two tables; the
+    graph drives connected-subgraph enumeration during join ordering,
+    so only subsets that can actually be joined without a cross
+    product are ever costed.
+
+    Attributes:
+        tables: The tables, in bit order (bit ``i`` is ``tables[i]``).
+        neighbors: Per-table bitmask of adjacent tables.
+        selectivities: Estimated selectivity per edge, keyed by the
+            two-bit edge mask.
+    """
+
+    def __init__(self, tables: Tuple[str, ...],
+                 predicates: Tuple[Any, ...] = (),
+                 catalog: Optional[StatsCatalog] = None,
+                 table_refs: Optional[Tuple[FrozenSet, ...]] = None):
+        """Build the graph from tables and predicate conjuncts.
+
+        Args:
+            tables: Tables participating in the join.
+            predicates: Predicate conjuncts; those referencing exactly
+                two of the tables become edges.
+            catalog: Optional statistics; equi-join edges then carry
+                distinct-count based selectivities instead of the
+                default.
+            table_refs: Optional precomputed referenced-table sets,
+                parallel to ``predicates``; saves re-walking trees the
+                planner has already analyzed.
+        """
+        self.tables = list(tables)
+        self._index = {table: i for i, table in enumerate(self.tables)}
+        self.neighbors: List[int] = [0] * len(self.tables)
+        self.selectivities: Dict[int, float] = {}
+        if table_refs is None:
+            table_refs = tuple(referenced_tables(p) for p in predicates)
+        for predicate, all_refs in zip(predicates, table_refs):
+            refs = sorted(t for t in all_refs if t in self._index)
+            if len(refs) != 2:
+                continue
+            self._add_edge(self._index[refs[0]], self._index[refs[1]],
+                           self._edge_selectivity(predicate, catalog))
+        self._connect_components()
+
+    @staticmethod
+    def _edge_selectivity(predicate: Any,
+                          catalog: Optional[StatsCatalog]) -> float:
+        """Estimate how much of the cross product an edge keeps."""
+        if (isinstance(predicate, BinaryOperator)
+                and predicate.operator is OpCode.EQ
+                and isinstance(predicate.left, Column)
+                and isinstance(predicate.right, Column)):
+            return _equijoin_selectivity(predicate.left, predicate.right,
+                                         catalog)
+        return DEFAULT_JOIN_SELECTIVITY
+
+    def _add_edge(self, i: int, j: int, selectivity: float) -> None:
+        """Record an edge between tables ``i`` and ``j``."""
+        self.neighbors[i] |= 1 << j
+        self.neighbors[j] |= 1 << i
+        edge = (1 << i) | (1 << j)
+        self.selectivities[edge] = min(
+            selectivity, self.selectivities.get(edge, 1.0))
+
+    def _connect_components(self) -> None:
+        """Link disconnected components so every table is reachable.
+
+        A table with no join predicate against the rest can only be
+        combined by cross product; a selectivity-1.0 edge to table 0
+        keeps the enumeration complete without making the cross
+        product look cheaper than any real join.
+        """
+        n = len(self.tables)
+        if n == 0:
+            return
+        full = (1 << n) - 1
+        while True:
+            unreached = ~self._reachable(0) & full
+            if not unreached:
+                return
+            lowest = unreached & -unreached
+            self._add_edge(0, lowest.bit_length() - 1, 1.0)
+
+    def _reachable(self, start: int) -> int:
+        """Bitmask of tables reachable from table ``start``."""
+        seen = 1 << start
+        frontier = seen
+        while frontier:
+            grown = seen
+            i = frontier
+            while i:
+                bit = i & -i
+                grown |= self.neighbors[bit.bit_length() - 1]
+                i ^= bit
+            frontier = grown & ~seen
+            seen = grown
+        return seen
+
+    def neighborhood(self, subset: int) -> int:
+        """Bitmask of tables adjacent to ``subset`` but not in it."""
+        adjacent = 0
+        i = subset
+        while i:
+            bit = i & -i
+            adjacent |= self.neighbors[bit.bit_length() - 1]
+            i ^= bit
+        return adjacent & ~subset
+
+    def crossing_selectivity(self, s1: int, s2: int) -> float:
+        """Combined selectivity of the edges between two subsets.
+
+        Args:
+            s1: Bitmask of one side of the join.
+            s2: Bitmask of the other (disjoint) side.
+
+        Returns:
+            float: Product of the selectivities of edges with one
+                endpoint in each subset; 1.0 for a pure cross product.
+        """
+        selectivity = 1.0
+        for edge, value in self.selectivities.items():
+            if edge & s1 and edge & s2:
+                selectivity *= value
+        return selectivity
+
+    def csg_cmp_pairs(self):
+        """Enumerate connected csg-cmp pairs (Moerkotte & Neumann).
+
+        DPccp: every yielded ``(s1, s2)`` is a pair of disjoint,
+        individually connected subsets joined by at least one edge, so
+        join ordering costs exactly the subsets a plan could produce —
+        far fewer than the O(3^n) of naive subset splitting on sparse
+        graphs.
+
+        Yields:
+            Tuple[int, int]: Bitmask pair of joinable subsets.
+        """
+        for s1 in self._connected_subgraphs():
+            yield from ((s1, s2) for s2 in self._complements(s1))
+
+    def _connected_subgraphs(self):
+        """Enumerate every connected subset, as bitmasks."""
+        for i in range(len(self.tables) - 1, -1, -1):
+            start = 1 << i
+            yield start
+            yield from self._csg_rec(start, start | (start - 1))
+
+    def _csg_rec(self, subset: int, excluded: int):
+        """Grow ``subset`` through its non-excluded neighborhood."""
+        fringe = self.neighborhood(subset) & ~excluded
+        grow = fringe
+        while grow:
+            yield subset | grow
+            grow = (grow - 1) & fringe
+        grow = fringe
+        while grow:
+            yield from self._csg_rec(subset | grow, excluded | fringe)
+            grow = (grow - 1) & fringe
+
+    def _complements(self, s1: int):
+        """Enumerate connected complements of ``s1`` (its cmps)."""
+        lowest = s1 & -s1
+        excluded = s1 | (lowest - 1)
+        fringe = self.neighborhood(s1) & ~excluded
+        for i in range(fringe.bit_length() - 1, -1, -1):
+            if not (fringe >> i) & 1:
+                continue
+            start = 1 << i
+            yield start
+            yield from self._csg_rec(
+                start, excluded | ((start | (start - 1)) & fringe))
+
 
 class QueryPlanner(IStatementVisitor):
     """Plans query execution strategies.
-    
+
     This class analyzes SQL statements and creates optimal execution plans.
     It implements the visitor pattern to handle different types of statements
     and considers various optimization opportunities.
-    
+
     Attributes:
         optimizer: Query optimizer for improving plans
         stats: Statistics about tables and columns
-        
+
     Example:
         ```python
         planner = QueryPlanner()
-        
+
         # Plan a simple query
         plan = planner.visit_select(
             select(User)
             .where(User.age > 18)
             .order_by(User.name)
         )
-        
+
         # Plan a complex join
         plan = planner.visit_select(
             select(User, Order)
@@ -58,4 +516,289 @@ class QueryPlanner(IStatementVisitor):
             .having(func.count(Order.id) > 5)
         )
         ```
-    """
\ No newline at end of file
+    """
+
+    def __init__(self):
+        """Initialize the planner with empty caches and statistics."""
+        self.optimizer = None
+        self.stats = StatsCatalog()
+        # LRU of plans keyed by statement fingerprint, bounded at
+        # PLAN_CACHE_SIZE since every entry pins its plan and predicate.
+        self._plan_cache: 'OrderedDict[Any, Any]' = OrderedDict()
+        # Memoized join-order decisions keyed by table set and join-graph
+        # edges; survives across statements so repeated query shapes plan
+        # in O(1).
+        self._join_order_cache: Dict[Tuple, List[str]] = {}
+        # Per-statement analysis memos keyed by id(): each predicate is
+        # split into conjuncts once and its referenced tables computed
+        # once, however many passes look at it. Cleared when planning of
+        # a new statement starts, so ids can never go stale.
+        self._refs_cache: Dict[int, FrozenSet[Optional[str]]] = {}
+        self._split_cache: Dict[int, Tuple[Any, ...]] = {}
+
+    def visit_select(self, select: Any) -> Any:
+        """Plan a SELECT statement.
+
+        Plans are cached by a structural fingerprint of the statement
+        (tables, predicate shape and operands, ordering). Because a
+        cached plan pins the predicate it was built with, the operand
+        values are part of the key: only operand-identical reruns share
+        a plan. Parameter-varying reruns re-plan, but still hit the
+        join-order memo, which is keyed by shape alone.
+
+        Args:
+            select: The SELECT statement to plan.
+
+        Returns:
+            The execution plan for the statement.
+        """
+        key = self._statement_key(select)
+        plan = self._plan_cache.get(key)
+        if plan is not None:
+            self._plan_cache.move_to_end(key)
+            return plan
+        self._refs_cache.clear()
+        self._split_cache.clear()
+
+        tables = list(getattr(select, 'tables', ()) or ())
+        columns = list(getattr(select, 'columns', ()) or ())
+        predicate = getattr(select, 'predicate', None)
+
+        if len(tables) <= 1:
+            plan = TableScanPlan(tables[0] if tables else '', columns, predicate)
+        else:
+            conjuncts: Tuple[Any, ...] = ()
+            if isinstance(predicate, IExpression):
+                conjuncts = self._conjuncts(predicate)
+            order = self._join_order(tuple(tables), conjuncts)
+            # Filters are pushed into the leftmost (driving) scan so they
+            # are applied before any join work.
+            plan = TableScanPlan(order[0], columns, predicate)
+            for table in order[1:]:
+                plan = JoinPlan(left=plan, right=TableScanPlan(table, columns))
+
+        self._plan_cache[key] = plan
+        if len(self._plan_cache) > PLAN_CACHE_SIZE:
+            self._plan_cache.popitem(last=False)
+        return plan
+
+    def _conjuncts(self, predicate: Any) -> Tuple[Any, ...]:
+        """Split a predicate into conjuncts, memoized per statement."""
+        key = id(predicate)
+        conjuncts = self._split_cache.get(key)
+        if conjuncts is None:
+            conjuncts = tuple(split_conjuncts(predicate))
+            self._split_cache[key] = conjuncts
+        return conjuncts
+
+    def _predicate_tables(self, predicate: Any) -> FrozenSet[Optional[str]]:
+        """Tables referenced by a predicate, memoized per statement."""
+        key = id(predicate)
+        refs = self._refs_cache.get(key)
+        if refs is None:
+            refs = referenced_tables(predicate)
+            self._refs_cache[key] = refs
+        return refs
+
+    def _fuse(self, plan: Any,
+              cache: Optional[Dict[int, Any]] = None) -> Any:
+        """Fuse adjacent Limit(Project(Scan)) nodes into a single plan.
+
+        The fused plan streams rows and stops at the limit, avoiding two
+        intermediate materializations; all other plan shapes are
+        returned unchanged (joins are fused recursively per side).
+        Sub-plans shared between branches are rewritten once per pass
+        via an id-keyed memo.
+
+        Args:
+            plan: Root of the plan tree to rewrite.
+            cache: Per-pass memo of already rewritten nodes; created
+                at the root and threaded through the recursion.
+
+        Returns:
+            The rewritten plan tree.
+        """
+        if cache is None:
+            cache = {}
+        memo = cache.get(id(plan))
+        if memo is not None:
+            return memo
+
+        if isinstance(plan, JoinPlan):
+            cache[id(plan)] = plan
+            plan.left = self._fuse(plan.left, cache)
+            plan.right = self._fuse(plan.right, cache)
+            return plan
+
+        fused = plan
+        if isinstance(plan, LimitPlan):
+            inner = plan.input_plan
+            if isinstance(inner, ProjectPlan) \
+                    and isinstance(inner.input_plan, TableScanPlan):
+                scan = inner.input_plan
+                fused = FusedScanProjectLimitPlan(
+                    scan.table, inner.columns, scan.predicate,
+                    plan.count, plan.offset
+                )
+            elif isinstance(inner, TableScanPlan):
+                fused = FusedScanProjectLimitPlan(
+                    inner.table, inner.columns, inner.predicate,
+                    plan.count, plan.offset
+                )
+        cache[id(plan)] = fused
+        return fused
+
+    def plan_relationship_load(
+            self,
+            table: str,
+            foreign_key: str,
+            order_by: Optional[Any] = None,
+            enforce_order: bool = False
+    ) -> TableScanPlan:
+        """Plan the child-row query of a relationship eager load.
+
+        The child rows of a joinedload/selectin load do not need an
+        ORDER BY on the parent key: collation is done in Python with a
+        hash map (see collate_by_foreign_key), so sorting the result set
+        first would be pure O(n log n) overhead. Any requested ordering
+        is therefore dropped unless enforce_order is True.
+
+        Args:
+            table: Table holding the related rows.
+            foreign_key: Column referencing the parent's primary key.
+            order_by: Ordering requested by the caller, normally ignored.
+            enforce_order: Keep the requested ordering anyway.
+
+        Returns:
+            TableScanPlan: Unordered scan of the related table.
+        """
+        plan = TableScanPlan(table, [], None)
+        plan.order_by = order_by if enforce_order else None
+        return plan
+
+    def visit_insert(self, insert: Any) -> Any:
+        """Plan an INSERT statement."""
+        return InsertPlan(
+            getattr(insert, 'table', '') or '',
+            list(getattr(insert, 'columns', ()) or ()),
+            list(getattr(insert, 'values', ()) or ()),
+        )
+
+    def visit_update(self, update: Any) -> Any:
+        """Plan an UPDATE statement."""
+        return UpdatePlan()
+
+    def visit_delete(self, delete: Any) -> Any:
+        """Plan a DELETE statement."""
+        return DeletePlan()
+
+    @staticmethod
+    def _statement_key(select: Any) -> Tuple:
+        """Build a hashable cache key describing a statement's shape.
+
+        The predicate contributes a structural fingerprint (see
+        :func:`_predicate_fingerprint`), not its str(), so predicate
+        types without a structural repr still key by content rather
+        than by instance address.
+        """
+        return (
+            frozenset(getattr(select, 'tables', ()) or ()),
+            _predicate_fingerprint(getattr(select, 'predicate', None)),
+            tuple(str(o) for o in (getattr(select, 'order_by', ()) or ())),
+        )
+
+    def _join_order(self, tables: Tuple[str, ...],
+                    predicates: Tuple[Any, ...] = ()) -> List[str]:
+        """Pick a join order with DPccp over the join graph.
+
+        Plan enumeration walks only connected csg-cmp pairs of the
+        :class:`JoinGraph` (see :meth:`JoinGraph.csg_cmp_pairs`)
+        instead of every subset split, so sparse join graphs of 10+
+        tables stay tractable. Sub-plan costs are memoized per subset
+        bitmask; a join costs its estimated output cardinality plus
+        both input costs, so plans with small intermediate results win
+        even when their final cardinality is the same.
+
+        Args:
+            tables: Tables participating in the join.
+            predicates: Predicate conjuncts; two-table conjuncts
+                become join edges of the graph.
+
+        Returns:
+            List[str]: Tables in the chosen join order.
+        """
+        if len(tables) <= 1:
+            return list(tables)
+        graph = JoinGraph(tables, predicates, self.stats, tuple(
+            self._predicate_tables(p) for p in predicates))
+        key = (frozenset(tables),
+               frozenset(str(p) for p in predicates),
+               frozenset(
+                   (frozenset(self._edge_tables(graph, edge)), selectivity)
+                   for edge, selectivity in graph.selectivities.items()))
+        cached = self._join_order_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # best[bitmask] = (cost, estimated_rows, order)
+        best: Dict[int, Tuple[float, float, List[str]]] = {}
+        for i, table in enumerate(graph.tables):
+            rows = float(self.stats.row_count(table))
+            # Single-table filters shrink the base cardinality before
+            # any join is costed, so the most selective scan drives.
+            for predicate in predicates:
+                refs = self._predicate_tables(predicate) - {None}
+                if refs == frozenset((table,)):
+                    rows *= estimate_selectivity(predicate, self.stats)
+            best[1 << i] = (rows, rows, [table])
+
+        # Pairs sorted by joined-subset size so both inputs of every
+        # pair are already solved when it is costed.
+        pairs = sorted(graph.csg_cmp_pairs(),
+                       key=lambda pair: (pair[0] | pair[1]).bit_count())
+        for s1, s2 in pairs:
+            left = best[s1]
+            right = best[s2]
+            rows = left[1] * right[1] * graph.crossing_selectivity(s1, s2)
+            cost = rows + left[0] + right[0]
+            joined = s1 | s2
+            entry = best.get(joined)
+            if entry is None or cost < entry[0]:
+                # The smaller input drives (comes first): visit_select
+                # builds the plan left-deep from this order.
+                if left[1] <= right[1]:
+                    order = left[2] + right[2]
+                else:
+                    order = right[2] + left[2]
+                best[joined] = (cost, rows, order)
+
+        order = best[(1 << len(graph.tables)) - 1][2]
+        self._join_order_cache[key] = order
+        return order
+
+    @staticmethod
+    def _edge_tables(graph: JoinGraph, edge: int) -> List[str]:
+        """Resolve an edge bitmask back to its two table names."""
+        return [graph.tables[i] for i in range(edge.bit_length())
+                if (edge >> i) & 1]
+
+
+def collate_by_foreign_key(rows: List[Dict[str, Any]],
+                           foreign_key: str) -> Dict[Any, List[Dict[str, Any]]]:
+    """Group eagerly loaded child rows by their foreign key value.
+
+    This replaces the ORDER BY + linear grouping pass an eager load
+    would otherwise need: a single hash-map pass is O(n) regardless of
+    input order.
+
+    Args:
+        rows: Child rows from the relationship scan.
+        foreign_key: Column referencing the parent's primary key.
+
+    Returns:
+        Mapping of foreign key value to the rows referencing it.
+    """
+    groups: Dict[Any, List[Dict[str, Any]]] = defaultdict(list)
+    for row in rows:
+        groups[row.get(foreign_key)].append(row)
+    return groups
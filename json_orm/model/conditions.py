@@ -0,0 +1,515 @@
+"""Row-level predicate conditions for table scans.
+
+This module provides the predicate objects the database uses to filter
+records during a table scan. A :class:`Condition` tests one field of a
+record against a constant; a :class:`CompoundCondition` combines several
+conditions with AND/OR/NOT semantics. Factory helpers (``eq``, ``lt``,
+``like``, ``and_``, ``or_``, ...) build the common shapes.
+
+Both classes declare ``__slots__``: predicate objects are touched once
+per record in scan loops, so dropping the per-instance ``__dict__``
+both shrinks them and routes attribute access through C-level
+descriptors.
+
+Example:
+    ```python
+    adults = and_(gte("age", 18), eq("status", "active"))
+    rows = [r for r in table if adults.evaluate(r)]
+    ```
+"""
+
+import operator
+import re
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+# Comparison operators by string tag. Tagged conditions can be
+# vectorized: the same callables broadcast elementwise over NumPy
+# arrays, so one tagged comparison covers both the per-row and the
+# batch path.
+_SCALAR_OPS: Dict[str, Callable[[Any, Any], Any]] = {
+    'eq': operator.eq,
+    'ne': operator.ne,
+    'lt': operator.lt,
+    'le': operator.le,
+    'gt': operator.gt,
+    'ge': operator.ge,
+}
+
+# Source-level spellings of the tagged operators, for compile().
+_OP_SYMBOLS: Dict[str, str] = {
+    'eq': '==', 'ne': '!=', 'lt': '<', 'le': '<=', 'gt': '>', 'ge': '>=',
+}
+
+# Compiled predicate closures keyed by (source, constants); predicate
+# trees with the same shape and literals share one closure.
+_COMPILED_PREDICATES: Dict[Any, Callable[[Dict[str, Any]], bool]] = {}
+
+
+def _compile_predicate(predicate: Any) -> Callable[[Dict[str, Any]], bool]:
+    """Partially evaluate a predicate tree into one Python closure.
+
+    The tree is flattened into a single boolean expression — one
+    function call per record instead of a recursive evaluate() walk,
+    with field names and operators inlined as source text and literal
+    operands bound through the closure namespace. Sub-conditions that
+    cannot be expressed as source (opaque operators, the datetime
+    string path) are bound as calls to their own evaluate, so the
+    result is always exactly equivalent to the tree.
+    """
+    constants: List[Any] = []
+    fallbacks: List[Callable] = []
+    expr = predicate._source(constants, fallbacks)
+    source = f"def _pred(r):\n    return {expr}"
+
+    key: Optional[Any] = None
+    if not fallbacks:
+        try:
+            key = (source, tuple(constants))
+            cached = _COMPILED_PREDICATES.get(key)
+            if cached is not None:
+                return cached
+        except TypeError:
+            key = None
+
+    namespace: Dict[str, Any] = {
+        f'_c{i}': value for i, value in enumerate(constants)}
+    namespace.update(
+        (f'_f{i}', fn) for i, fn in enumerate(fallbacks))
+    exec(source, namespace)  # noqa: S102 - source built from literals above
+    compiled = namespace['_pred']
+    if key is not None:
+        _COMPILED_PREDICATES[key] = compiled
+    return compiled
+
+
+class Condition:
+    """A single-field predicate over a record.
+
+    Attributes:
+        field: Name of the record field to test.
+        op: Binary callable applied as ``op(record_value, value)``.
+        value: Constant right-hand operand.
+        tag: String tag of the operator ('eq', 'lt', ...) when the
+            condition is a plain comparison; None for opaque callables
+            (LIKE, IN). Only tagged conditions can be vectorized.
+    """
+
+    __slots__ = ('field', 'op', 'value', 'tag', '_value_iso')
+
+    def __init__(self, field: str,
+                 op: Union[str, Callable[[Any, Any], bool]],
+                 value: Any):
+        """Initialize the condition.
+
+        Args:
+            field: Name of the record field to test.
+            op: Operator tag ('eq', 'lt', ...) or a binary callable
+                applied as ``op(record_value, value)``.
+            value: Constant right-hand operand.
+        """
+        if isinstance(op, str):
+            self.tag: Optional[str] = op
+            op = _SCALAR_OPS[op]
+        else:
+            self.tag = None
+        self.field = field
+        self.op = op
+        self.value = value
+        # Datetime operands are pre-rendered to ISO form once: records
+        # store datetimes as ISO-8601 strings, which sort
+        # lexicographically, so string-typed fields compare directly
+        # against the cached string instead of being parsed per row.
+        self._value_iso: Optional[str] = (
+            value.isoformat() if isinstance(value, datetime) else None)
+
+    def evaluate(self, record: Dict[str, Any]) -> bool:
+        """Evaluate the condition against one record.
+
+        Args:
+            record: The record to test.
+
+        Returns:
+            bool: True if the record satisfies the condition. Records
+            missing the field never match.
+        """
+        if self.field not in record:
+            return False
+        record_value = record[self.field]
+        if self._value_iso is not None and isinstance(record_value, str):
+            return bool(self.op(record_value, self._value_iso))
+        return bool(self.op(record_value, self.value))
+
+    def evaluate_batch(self, column: Any) -> Optional[np.ndarray]:
+        """Evaluate the condition over a whole column at once.
+
+        Replaces N per-row interpreter dispatches with one vectorized
+        comparison sweep over the column buffer. The scalar contract
+        holds: rows missing the field — materialized as ``None`` in an
+        object-dtype column — never match, for negated operators too.
+
+        Args:
+            column: Array (or array-like) of field values, one per row.
+
+        Returns:
+            Optional[np.ndarray]: Boolean mask, or None when the
+            operator is an opaque callable that cannot be vectorized,
+            or the column's values do not broadcast against the
+            operand; callers then fall back to per-row :meth:`evaluate`.
+        """
+        if self.tag is None:
+            return None
+        values = column if isinstance(column, np.ndarray) \
+            else np.asarray(column)
+        try:
+            if values.dtype == object:
+                # Compare only the present entries; absent ones stay
+                # False in the mask regardless of the operator.
+                valid = np.fromiter((v is not None for v in values),
+                                    dtype=bool, count=len(values))
+                mask = np.zeros(len(values), dtype=bool)
+                if valid.all():
+                    mask[:] = np.asarray(self.op(values, self.value),
+                                         dtype=bool)
+                else:
+                    mask[valid] = np.asarray(
+                        self.op(values[valid], self.value), dtype=bool)
+                return mask
+            return self.op(values, self.value)
+        except TypeError:
+            # Heterogeneous column the operator cannot broadcast over
+            # (mixed types, datetime strings); scan row-at-a-time.
+            return None
+
+    def compile_to_numpy(self,
+                         columns: Dict[str, Any]) -> Optional[np.ndarray]:
+        """Compile the condition to a mask over materialized columns.
+
+        This is the hook ``TableScanPlan.execute`` probes for; a None
+        return routes the scan back to row-at-a-time filtering.
+
+        Args:
+            columns: Column name to value-array mapping.
+
+        Returns:
+            Optional[np.ndarray]: Boolean row mask, or None when the
+            field is absent or the operator is not vectorizable.
+        """
+        column = columns.get(self.field)
+        if column is None:
+            return None
+        return self.evaluate_batch(column)
+
+    def estimate_cost(self) -> float:
+        """Relative cost of one evaluate() call.
+
+        Tagged comparisons are a single C-level operator; opaque
+        callables (LIKE regexes, IN sets, datetime paths) cost more.
+        """
+        return 1.0 if self.tag is not None else 2.0
+
+    def estimate_selectivity(self,
+                             indexes: Optional[Dict[str, Any]] = None
+                             ) -> float:
+        """Estimate the fraction of records this condition keeps.
+
+        Equality keeps one value in distinct — exact when the field's
+        index is available (its key count is the distinct count) and a
+        fixed default otherwise; ranges and negations use the usual
+        textbook defaults.
+
+        Args:
+            indexes: Optional mapping of field name to the field's
+                index, refining equality estimates.
+
+        Returns:
+            float: Estimated selectivity in ``[0.0, 1.0]``.
+        """
+        if self.tag == 'eq':
+            index = indexes.get(self.field) if indexes else None
+            if index is not None and len(index):
+                return 1.0 / len(index)
+            return 0.1
+        if self.tag in ('lt', 'le', 'gt', 'ge'):
+            return 0.33
+        if self.tag == 'ne':
+            return 0.9
+        return 1.0
+
+    def _source(self, constants: List[Any],
+                fallbacks: List[Callable]) -> str:
+        """Emit this condition as a Python boolean expression."""
+        if self.tag is not None and self._value_iso is None:
+            index = len(constants)
+            constants.append(self.value)
+            return (f"({self.field!r} in r"
+                    f" and r[{self.field!r}]"
+                    f" {_OP_SYMBOLS[self.tag]} _c{index})")
+        # Opaque operator or datetime string comparison: bind the
+        # condition's own evaluate into the closure.
+        index = len(fallbacks)
+        fallbacks.append(self.evaluate)
+        return f"_f{index}(r)"
+
+    def compile(self) -> Callable[[Dict[str, Any]], bool]:
+        """Compile the condition into a standalone closure.
+
+        Returns:
+            Callable: A function of one record, equivalent to
+            :meth:`evaluate` but with field name, operator and missing-
+            field check inlined into a single expression.
+        """
+        return _compile_predicate(self)
+
+
+class CompoundCondition:
+    """A boolean combination of sub-conditions.
+
+    The combinator is expressed through subclassing
+    (:class:`AndCondition`, :class:`OrCondition`, :class:`NotCondition`)
+    rather than a stored aggregator callable, so ``evaluate`` can
+    short-circuit: an AND over N conditions stops at the first failing
+    sub-condition instead of evaluating all N and aggregating after.
+
+    Attributes:
+        conditions: The combined sub-conditions.
+    """
+
+    __slots__ = ('conditions',)
+
+    def __init__(self, conditions: Sequence['Condition']):
+        """Initialize the compound condition.
+
+        Args:
+            conditions: Sub-conditions to combine.
+        """
+        self.conditions = list(conditions)
+
+    def evaluate(self, record: Dict[str, Any]) -> bool:
+        """Evaluate the combination against one record.
+
+        Args:
+            record: The record to test.
+
+        Returns:
+            bool: The combined result.
+        """
+        raise NotImplementedError
+
+    def _child_masks(self,
+                     columns: Dict[str, Any]) -> Optional[Sequence[np.ndarray]]:
+        """Compile every sub-condition to a mask, or None if any can't."""
+        masks = []
+        for condition in self.conditions:
+            mask = condition.compile_to_numpy(columns)
+            if mask is None:
+                return None
+            masks.append(mask)
+        return masks
+
+    def compile_to_numpy(self,
+                         columns: Dict[str, Any]) -> Optional[np.ndarray]:
+        """Compile the combination to a mask over materialized columns.
+
+        Args:
+            columns: Column name to value-array mapping.
+
+        Returns:
+            Optional[np.ndarray]: Boolean row mask, or None when any
+            sub-condition cannot be vectorized.
+        """
+        raise NotImplementedError
+
+    def estimate_cost(self) -> float:
+        """Relative cost: the children's costs plus the dispatch."""
+        return 0.5 + sum(c.estimate_cost() for c in self.conditions)
+
+    def estimate_selectivity(self,
+                             indexes: Optional[Dict[str, Any]] = None
+                             ) -> float:
+        """Estimate the fraction of records the combination keeps."""
+        raise NotImplementedError
+
+    def _source(self, constants: List[Any],
+                fallbacks: List[Callable]) -> str:
+        """Emit this combination as a Python boolean expression."""
+        raise NotImplementedError
+
+    def compile(self) -> Callable[[Dict[str, Any]], bool]:
+        """Compile the whole tree into one flat closure.
+
+        The recursive evaluate() walk is partially evaluated away: the
+        result is a single function whose body inlines every
+        sub-condition, combined with short-circuiting ``and``/``or``.
+
+        Returns:
+            Callable: A function of one record, equivalent to
+            :meth:`evaluate`.
+        """
+        return _compile_predicate(self)
+
+
+class AndCondition(CompoundCondition):
+    """Conjunction: every sub-condition must hold."""
+
+    __slots__ = ()
+
+    def evaluate(self, record: Dict[str, Any]) -> bool:
+        # Generator form short-circuits at the first False.
+        return all(c.evaluate(record) for c in self.conditions)
+
+    def compile_to_numpy(self,
+                         columns: Dict[str, Any]) -> Optional[np.ndarray]:
+        masks = self._child_masks(columns)
+        if masks is None:
+            return None
+        return np.logical_and.reduce(masks)
+
+    def estimate_selectivity(self,
+                             indexes: Optional[Dict[str, Any]] = None
+                             ) -> float:
+        selectivity = 1.0
+        for condition in self.conditions:
+            selectivity *= condition.estimate_selectivity(indexes)
+        return selectivity
+
+    def _source(self, constants: List[Any],
+                fallbacks: List[Callable]) -> str:
+        return '(' + ' and '.join(c._source(constants, fallbacks)
+                                  for c in self.conditions) + ')'
+
+
+class OrCondition(CompoundCondition):
+    """Disjunction: at least one sub-condition must hold."""
+
+    __slots__ = ()
+
+    def evaluate(self, record: Dict[str, Any]) -> bool:
+        # Generator form short-circuits at the first True.
+        return any(c.evaluate(record) for c in self.conditions)
+
+    def compile_to_numpy(self,
+                         columns: Dict[str, Any]) -> Optional[np.ndarray]:
+        masks = self._child_masks(columns)
+        if masks is None:
+            return None
+        return np.logical_or.reduce(masks)
+
+    def estimate_selectivity(self,
+                             indexes: Optional[Dict[str, Any]] = None
+                             ) -> float:
+        # Inclusion-exclusion, folded pairwise.
+        selectivity = 0.0
+        for condition in self.conditions:
+            s = condition.estimate_selectivity(indexes)
+            selectivity = selectivity + s - selectivity * s
+        return selectivity
+
+    def _source(self, constants: List[Any],
+                fallbacks: List[Callable]) -> str:
+        return '(' + ' or '.join(c._source(constants, fallbacks)
+                                 for c in self.conditions) + ')'
+
+
+class NotCondition(CompoundCondition):
+    """Negation of a single sub-condition."""
+
+    __slots__ = ()
+
+    def evaluate(self, record: Dict[str, Any]) -> bool:
+        return not self.conditions[0].evaluate(record)
+
+    def compile_to_numpy(self,
+                         columns: Dict[str, Any]) -> Optional[np.ndarray]:
+        mask = self.conditions[0].compile_to_numpy(columns)
+        if mask is None:
+            return None
+        return np.logical_not(mask)
+
+    def estimate_selectivity(self,
+                             indexes: Optional[Dict[str, Any]] = None
+                             ) -> float:
+        return 1.0 - self.conditions[0].estimate_selectivity(indexes)
+
+    def _source(self, constants: List[Any],
+                fallbacks: List[Callable]) -> str:
+        return 'not ' + self.conditions[0]._source(constants, fallbacks)
+
+
+def eq(field: str, value: Any) -> Condition:
+    """Build a ``field == value`` condition."""
+    return Condition(field, 'eq', value)
+
+
+def ne(field: str, value: Any) -> Condition:
+    """Build a ``field != value`` condition."""
+    return Condition(field, 'ne', value)
+
+
+def lt(field: str, value: Any) -> Condition:
+    """Build a ``field < value`` condition."""
+    return Condition(field, 'lt', value)
+
+
+def lte(field: str, value: Any) -> Condition:
+    """Build a ``field <= value`` condition."""
+    return Condition(field, 'le', value)
+
+
+def gt(field: str, value: Any) -> Condition:
+    """Build a ``field > value`` condition."""
+    return Condition(field, 'gt', value)
+
+
+def gte(field: str, value: Any) -> Condition:
+    """Build a ``field >= value`` condition."""
+    return Condition(field, 'ge', value)
+
+
+def in_(field: str, values: Sequence[Any]) -> Condition:
+    """Build a ``field IN values`` condition."""
+    return Condition(field, lambda v, vs: v in vs, set(values))
+
+
+def like(field: str, pattern: str) -> Condition:
+    """Build a SQL ``LIKE`` condition (``%`` matches any run).
+
+    The pattern is analyzed once at construction: patterns without a
+    wildcard compare with ``==``, a single trailing/leading ``%``
+    becomes ``str.startswith``/``str.endswith``, and only general
+    patterns fall back to a pre-compiled regex — never a per-row
+    compile or translate.
+
+    Args:
+        field: Name of the record field to test.
+        pattern: LIKE pattern; ``%`` is the only wildcard supported.
+    """
+    wildcards = pattern.count('%')
+    if wildcards == 0:
+        return Condition(field, 'eq', pattern)
+    if wildcards == 1 and pattern.endswith('%'):
+        return Condition(field, str.startswith, pattern[:-1])
+    if wildcards == 1 and pattern.startswith('%'):
+        return Condition(field, str.endswith, pattern[1:])
+
+    regex = re.compile('.*'.join(re.escape(part)
+                                 for part in pattern.split('%')) + '$')
+    return Condition(field, lambda v, _: regex.match(v) is not None,
+                     pattern)
+
+
+def and_(*conditions: Condition) -> AndCondition:
+    """Combine conditions so all must hold."""
+    return AndCondition(conditions)
+
+
+def or_(*conditions: Condition) -> OrCondition:
+    """Combine conditions so at least one must hold."""
+    return OrCondition(conditions)
+
+
+def not_(condition: Condition) -> NotCondition:
+    """Negate a condition."""
+    return NotCondition([condition])
@@ -26,11 +26,175 @@ Example:
     ```
 """
 
-from typing import TypeVar
+import json
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Type, TypeVar, Union
+
+import numpy as np
+
+try:
+    # Preferred serializer: C-level encode/decode, several times faster
+    # than stdlib json on the row-dict payloads _save produces. The
+    # stdlib module stays as the fallback for environments without it.
+    import orjson
+except ImportError:
+    orjson = None
+
+from .indexing import IndexManager
+from .query import QueryBuilder
 
 T = TypeVar('T')
 
 
+class ColumnTable:
+    """A table stored column-wise (SoA) instead of as a row list.
+
+    Each column lives in one contiguous NumPy array (``np.object_`` for
+    strings and mixed values), so a predicate scan touches only the
+    columns it references and comparisons run over contiguous memory
+    rather than chasing per-row dict pointers. Appends go into growable
+    buffers with power-of-two resizing, amortizing insertion to O(1)
+    per row. Row dicts (AoS) are materialized only on demand, for the
+    JSON persistence format and the ``query().all()`` return path.
+
+    Attributes:
+        INITIAL_CAPACITY: Buffer size allocated for the first append.
+    """
+
+    INITIAL_CAPACITY = 16
+
+    __slots__ = ('_columns', '_length', '_capacity')
+
+    def __init__(self):
+        """Initialize an empty table."""
+        self._columns: Dict[str, np.ndarray] = {}
+        self._length = 0
+        self._capacity = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _grow(self, minimum: int) -> None:
+        """Resize all column buffers to at least ``minimum`` slots."""
+        capacity = max(self.INITIAL_CAPACITY, self._capacity or 1)
+        while capacity < minimum:
+            capacity *= 2
+        for name, buf in self._columns.items():
+            grown = np.empty(capacity, dtype=buf.dtype)
+            grown[:self._length] = buf[:self._length]
+            self._columns[name] = grown
+        self._capacity = capacity
+
+    @staticmethod
+    def _dtype_for(value: Any) -> np.dtype:
+        """Pick the buffer dtype for a column's first value."""
+        if type(value) is bool:
+            return np.dtype(np.bool_)
+        if type(value) is int:
+            return np.dtype(np.int64)
+        if type(value) is float:
+            return np.dtype(np.float64)
+        return np.dtype(np.object_)
+
+    def _add_column(self, name: str, first_value: Any) -> None:
+        """Create a new column, backfilling existing rows with None.
+
+        A column starting mid-table must be object-typed (the backfill
+        is None); otherwise the dtype is inferred from the first value
+        so numeric columns get contiguous typed buffers.
+        """
+        dtype = (np.dtype(np.object_) if self._length
+                 else self._dtype_for(first_value))
+        buf = np.empty(max(self._capacity, self.INITIAL_CAPACITY),
+                       dtype=dtype)
+        if self._length:
+            buf[:self._length] = None
+        self._columns[name] = buf
+        self._capacity = len(buf)
+
+    def _set(self, name: str, index: int, value: Any) -> None:
+        """Store one cell, promoting the column to object on mismatch."""
+        buf = self._columns[name]
+        try:
+            buf[index] = value
+        except (TypeError, ValueError):
+            promoted = buf.astype(np.object_)
+            promoted[index] = value
+            self._columns[name] = promoted
+
+    def append(self, row: Dict[str, Any]) -> None:
+        """Append one row, growing buffers as needed.
+
+        Args:
+            row: Record to append; missing columns are filled with None.
+        """
+        if self._length + 1 > self._capacity:
+            self._grow(self._length + 1)
+        for name, value in row.items():
+            if name not in self._columns:
+                self._add_column(name, value)
+        for name in self._columns:
+            self._set(name, self._length, row.get(name))
+        self._length += 1
+
+    def extend(self, rows: List[Dict[str, Any]]) -> None:
+        """Append many rows with a single capacity check.
+
+        Args:
+            rows: Records to append.
+        """
+        if not rows:
+            return
+        if self._length + len(rows) > self._capacity:
+            self._grow(self._length + len(rows))
+        for row in rows:
+            for name, value in row.items():
+                if name not in self._columns:
+                    self._add_column(name, value)
+            for name in self._columns:
+                self._set(name, self._length, row.get(name))
+            self._length += 1
+
+    def column(self, name: str) -> np.ndarray:
+        """Get one column as an array view trimmed to the live rows.
+
+        Args:
+            name: Column name.
+
+        Returns:
+            np.ndarray: The column values, one per row.
+
+        Raises:
+            KeyError: If the column does not exist.
+        """
+        return self._columns[name][:self._length]
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Get all columns as trimmed array views, keyed by name."""
+        return {name: buf[:self._length]
+                for name, buf in self._columns.items()}
+
+    def iter_rows(self) -> Iterator[Dict[str, Any]]:
+        """Iterate the table as row dicts (AoS materialization).
+
+        NumPy scalars are unboxed back to native Python values so the
+        rows round-trip through stdlib json unchanged.
+        """
+        names = list(self._columns)
+        buffers = [self._columns[name] for name in names]
+        for i in range(self._length):
+            yield {name: (buf[i].item()
+                          if isinstance(buf[i], np.generic) else buf[i])
+                   for name, buf in zip(names, buffers)}
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Materialize the whole table as a list of row dicts."""
+        return list(self.iter_rows())
+
+
 class Database:
     """Main database class.
     
@@ -100,3 +264,316 @@ class Database:
         db.optimize_indexes()
         ```
     """
+
+    def __init__(self, path: Union[str, Path], max_connections: int = 10,
+                 timeout: int = 30, enforce_relationship_order: bool = False):
+        """Initialize the database.
+
+        Args:
+            path: Path to the database file.
+            max_connections: Maximum number of concurrent connections.
+            timeout: Operation timeout in seconds.
+            enforce_relationship_order: Keep ORDER BY clauses on
+                relationship eager-load queries. Off by default because
+                eager-load collation uses a hash map and needs no order.
+        """
+        self.path = Path(path)
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.enforce_relationship_order = enforce_relationship_order
+        self._write_lock = threading.Lock()
+        self._tables: Dict[str, ColumnTable] = {}
+        self._next_ids: Dict[str, int] = {}
+        self._in_txn = False
+        self._dirty = False
+        self.indexes = IndexManager(str(self.path) + '.indexes')
+        self._load()
+
+    def _load(self) -> None:
+        """Load table data from the database file, if it exists.
+
+        The on-disk format stays row-oriented JSON; rows are ingested
+        into per-table column stores on load.
+        """
+        if self.path.exists():
+            with open(self.path, 'rb') as f:
+                payload = f.read()
+            raw = (orjson.loads(payload) if orjson is not None
+                   else json.loads(payload))
+            for name, rows in raw.items():
+                table = ColumnTable()
+                table.extend(rows)
+                self._tables[name] = table
+                # One max() scan at load time seeds the O(1) counter
+                # that inserts consult from then on.
+                self._next_ids[name] = max(
+                    (row.get('id') or 0 for row in rows), default=0) + 1
+        self.indexes.load_all()
+
+    def _save(self) -> None:
+        """Persist all tables, or mark dirty under a transaction.
+
+        Inside a transaction() block every mutation would otherwise
+        rewrite the whole file; instead the save is deferred and the
+        commit path writes once.
+        """
+        if self._in_txn:
+            self._dirty = True
+            return
+        self._write_file()
+
+    def _write_file(self) -> None:
+        """Write all tables to disk atomically.
+
+        The payload goes to a sibling temp file first and is moved
+        into place with os.replace, so a crash mid-write can never
+        leave a torn database file behind.
+        """
+        payload = {name: table.rows()
+                   for name, table in self._tables.items()}
+        tmp = str(self.path) + '.tmp'
+        if orjson is not None:
+            with open(tmp, 'wb') as f:
+                f.write(orjson.dumps(payload))
+        else:
+            with open(tmp, 'w') as f:
+                json.dump(payload, f)
+        os.replace(tmp, self.path)
+        # Index files are flushed on the same commit boundary, so a
+        # batch of mutations writes each touched index exactly once.
+        self.indexes.flush()
+
+    @contextmanager
+    def transaction(self):
+        """Batch mutations into one atomic save on successful exit.
+
+        Mutations inside the block update the in-memory tables but
+        defer persistence; the file is written once (atomically) when
+        the block exits without an exception. On an exception nothing
+        is written — in-memory state is reloaded from disk so the
+        failed block's changes are discarded.
+
+        Example:
+            ```python
+            with db.transaction():
+                db.insert(user)
+                db.bulk_insert(Order, orders)
+            ```
+        """
+        self._in_txn = True
+        self._dirty = False
+        try:
+            yield self
+        except BaseException:
+            self._in_txn = False
+            self._dirty = False
+            self._tables = {}
+            self._next_ids = {}
+            # Discard the failed block's unflushed index mutations
+            # along with the row changes; load_all() below restores
+            # the last committed index state.
+            self.indexes = IndexManager(self.indexes.directory)
+            self._load()
+            raise
+        else:
+            self._in_txn = False
+            if self._dirty:
+                self._write_file()
+                self._dirty = False
+
+    @staticmethod
+    def _table_name(model: Union[str, Type[Any]]) -> str:
+        """Resolve the table name for a model class or raw table name."""
+        if isinstance(model, str):
+            return model
+        return model.__name__.lower()
+
+    @staticmethod
+    def _as_record(record: Any) -> Dict[str, Any]:
+        """Convert a model instance or mapping to a plain record dict."""
+        if isinstance(record, dict):
+            return dict(record)
+        to_dict = getattr(record, 'to_dict', None)
+        if to_dict is not None:
+            # Slotted model instances have no __dict__; their generated
+            # to_dict is also cheaper than a vars() copy.
+            return to_dict()
+        return dict(vars(record))
+
+    def _table(self, table: str) -> ColumnTable:
+        """Get (creating if needed) the column store for a table."""
+        store = self._tables.get(table)
+        if store is None:
+            store = self._tables[table] = ColumnTable()
+        return store
+
+    def _next_id(self, table: str) -> int:
+        """Get the next auto-increment id for a table, in O(1).
+
+        The per-table counter is seeded by a single max() scan at load
+        time and advanced on every insert, so assigning an id costs one
+        dict lookup regardless of table size.
+        """
+        return self._next_ids.get(table, 1)
+
+    def _note_id(self, table: str, used: int) -> None:
+        """Advance the id counter past an id that was just used.
+
+        Also keeps the sequence monotonic when callers insert rows
+        carrying explicit ids above the current counter.
+        """
+        if used >= self._next_ids.get(table, 1):
+            self._next_ids[table] = used + 1
+
+    def columns(self, model: Union[str, Type[Any]]) -> Dict[str, np.ndarray]:
+        """Get a table's column arrays for vectorized scans.
+
+        Args:
+            model: Model class (or table name) to read.
+
+        Returns:
+            Dict[str, np.ndarray]: Column name to value-array mapping;
+            empty if the table does not exist.
+        """
+        store = self._tables.get(self._table_name(model))
+        return store.columns() if store is not None else {}
+
+    def rows(self, model: Union[str, Type[Any]]) -> List[Dict[str, Any]]:
+        """Materialize a table as row dicts (the ``all()`` return shape).
+
+        Args:
+            model: Model class (or table name) to read.
+
+        Returns:
+            List[Dict[str, Any]]: The table's rows; empty if absent.
+        """
+        store = self._tables.get(self._table_name(model))
+        return store.rows() if store is not None else []
+
+    def query(self, model: Union[str, Type[Any]]) -> 'QueryBuilder':
+        """Start a fluent query over a model's table.
+
+        Filtering runs inside the scan (indexes, vectorized masks or
+        a streaming pass with early stop) rather than materializing
+        the whole table first; see :class:`QueryBuilder`.
+
+        Args:
+            model: Model class (or table name) to query.
+
+        Returns:
+            QueryBuilder: The query under construction.
+
+        Example:
+            ```python
+            adults = (db.query(User)
+                      .where(gte("age", 18))
+                      .order_by("name")
+                      .all())
+            ```
+        """
+        return QueryBuilder(self, model)
+
+    def add_index(self, model: Union[str, Type[Any]], field: Any,
+                  unique: bool = False):
+        """Create an index on a model field and build it over the data.
+
+        Subsequent inserts maintain the index incrementally; the index
+        file itself is written on the next commit boundary, not per
+        mutation.
+
+        Args:
+            model: Model class (or table name) owning the field.
+            field: Field name (or model Field attribute) to index.
+            unique: Reject duplicate values when True.
+
+        Returns:
+            The field's index.
+        """
+        table = self._table_name(model)
+        if isinstance(field, str):
+            name = field
+        else:
+            # A model Field, or the slot descriptor standing in for it
+            # on the class after field declarations move to __fields__.
+            name = getattr(field, 'name', None) or field.__name__
+        with self._write_lock:
+            index = self.indexes.create_index(table, name, unique)
+            store = self._tables.get(table)
+            if store is not None and len(store):
+                self.indexes.rebuild(table, store.rows())
+            self._save()
+        return index
+
+    def insert(self, record: Any) -> Dict[str, Any]:
+        """Insert a single record.
+
+        Args:
+            record: Model instance or dict to insert.
+
+        Returns:
+            Dict[str, Any]: The inserted record, with its id assigned.
+        """
+        table = self._table_name(type(record) if not isinstance(record, dict)
+                                 else record.get('__table__', 'records'))
+        with self._write_lock:
+            row = self._as_record(record)
+            if row.get('id') is None:
+                row['id'] = self._next_id(table)
+            if isinstance(row['id'], int):
+                self._note_id(table, row['id'])
+            self._table(table).append(row)
+            self.indexes.update_indexes(table, row)
+            self._save()
+        return row
+
+    def bulk_insert(self, model: Union[str, Type[Any]],
+                    records: List[Any], fast_insert: bool = True) -> int:
+        """Insert many records with a single write and save.
+
+        Unlike calling insert() per record, this takes the write lock
+        once, buffers all rows into the table, and persists the file a
+        single time, amortizing the save cost over the whole batch.
+
+        Args:
+            model: Model class (or table name) to insert into.
+            records: Model instances or dicts to insert.
+            fast_insert: When True (default), persist once after the
+                whole batch. When False, persist after every row for
+                per-row durability.
+
+        Returns:
+            int: Number of rows inserted.
+        """
+        table = self._table_name(model)
+        with self._write_lock:
+            store = self._table(table)
+            next_id = self._next_id(table)
+            if fast_insert:
+                rows = []
+                for record in records:
+                    row = self._as_record(record)
+                    if row.get('id') is None:
+                        row['id'] = next_id
+                        next_id += 1
+                    if isinstance(row['id'], int):
+                        self._note_id(table, row['id'])
+                    rows.append(row)
+                store.extend(rows)
+                for row in rows:
+                    self.indexes.update_indexes(table, row)
+                self._save()
+            else:
+                for record in records:
+                    row = self._as_record(record)
+                    if row.get('id') is None:
+                        row['id'] = next_id
+                        next_id += 1
+                    if isinstance(row['id'], int):
+                        self._note_id(table, row['id'])
+                    store.append(row)
+                    self.indexes.update_indexes(table, row)
+                    self._save()
+        return len(records)
+
+    # Mirrors the bulk API naming used by other ORMs.
+    insert_all = bulk_insert
@@ -5,7 +5,7 @@ It follows SQLModel/SQLAlchemy patterns for familiarity and easy migration paths
 """
 
 from dataclasses import dataclass
-from typing import Any, Optional, Type, TypeVar
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar
 
 T = TypeVar('T')
 
@@ -51,12 +51,184 @@ class Field:
 
 class ModelMeta(type):
     """Metaclass for Model to handle field definitions and provide ORM-like behavior.
-    
+
     This metaclass processes field definitions during class creation to:
     - Register fields and their constraints
     - Set up relationships between models
     - Create necessary indexes
     - Validate schema definitions
-    
+
     It enables SQLModel-like syntax while storing data in JSON format.
-    """
\ No newline at end of file
+
+    Instance construction and serialization are specialized per class
+    at creation time: ``__init__`` and ``to_dict`` are generated as
+    straight-line source over the class's exact fields and compiled
+    once, so building a model instance costs no per-field dict lookups
+    or ``setattr`` dispatch at runtime.
+    """
+
+    def __new__(mcs, name: str, bases: Tuple[type, ...],
+                namespace: Dict[str, Any]):
+        fields: Dict[str, Field] = {}
+        for base in bases:
+            fields.update(getattr(base, '__fields__', {}))
+        local: Dict[str, Field] = {}
+        annotations = namespace.get('__annotations__', {})
+        for attr in annotations:
+            if attr.startswith('_'):
+                continue
+            value = namespace.get(attr)
+            if isinstance(value, Field):
+                local[attr] = value
+            else:
+                # Bare annotation or plain default value.
+                local[attr] = Field(default=value)
+        for attr, value in namespace.items():
+            if isinstance(value, Field):
+                local[attr] = value
+        fields.update(local)
+        # Field declarations move off the class body into __fields__ so
+        # the names are free for slot descriptors: slotted instances
+        # skip the per-instance __dict__ entirely.
+        for attr in local:
+            namespace.pop(attr, None)
+        namespace.setdefault('__slots__', tuple(local))
+        namespace['__fields__'] = fields
+        # Constraint lookups are precomputed here so the hot paths read
+        # a class attribute instead of scanning __fields__ per call.
+        namespace['__primary_key__'] = next(
+            (attr for attr, field in fields.items() if field.primary_key),
+            'id')
+        namespace['__indexed_fields__'] = tuple(
+            attr for attr, field in fields.items()
+            if field.index or field.unique or field.primary_key)
+        namespace['__fk_fields__'] = tuple(
+            attr for attr, field in fields.items()
+            if field.foreign_key is not None)
+        if fields:
+            namespace.setdefault('__init__', mcs._build_init(fields))
+            namespace.setdefault('to_dict', mcs._build_to_dict(fields))
+        cls = super().__new__(mcs, name, bases, namespace)
+        for attr, field in local.items():
+            field.__set_name__(cls, attr)
+        return cls
+
+    @staticmethod
+    def _build_init(fields: Dict[str, Field]) -> Callable:
+        """Generate a specialized ``__init__`` for one field set.
+
+        The body is straight-line ``self.x = ...`` statements — one
+        conditional kwargs lookup per field, defaults bound through
+        the compilation namespace — instead of a generic loop over
+        ``__fields__`` with a dict lookup and setattr per field per
+        instance.
+        """
+        namespace: Dict[str, Any] = {}
+        lines = ['def __init__(self, **kwargs):']
+        for name, field in fields.items():
+            default = f'_d_{name}'
+            namespace[default] = (field.default_factory
+                                  or _constantly(field.default))
+            lines.append(f"    self.{name} = kwargs[{name!r}]"
+                         f" if {name!r} in kwargs else {default}()")
+        exec('\n'.join(lines), namespace)  # noqa: S102 - field names only
+        init = namespace['__init__']
+        init.__doc__ = "Initialize the model from keyword field values."
+        return init
+
+    @staticmethod
+    def _build_to_dict(fields: Dict[str, Field]) -> Callable:
+        """Generate a specialized ``to_dict`` for one field set.
+
+        The body is a single dict display over the class's fields, so
+        serialization is one bytecode-level dict build instead of a
+        comprehension iterating ``__fields__`` with per-key getattr
+        calls through a loop frame.
+        """
+        items = ', '.join(f"{name!r}: self.{name}" for name in fields)
+        namespace: Dict[str, Any] = {}
+        exec(f"def to_dict(self):\n    return {{{items}}}",
+             namespace)  # noqa: S102 - field names only
+        to_dict = namespace['to_dict']
+        to_dict.__doc__ = "Serialize the instance as a plain field dict."
+        return to_dict
+
+
+def _constantly(value: Any) -> Callable[[], Any]:
+    """Build a zero-argument callable returning a fixed default."""
+    def default() -> Any:
+        return value
+    return default
+
+
+class Model(metaclass=ModelMeta):
+    """Base class for database models.
+
+    Subclasses declare their schema with annotated attributes and
+    :class:`Field` definitions; the metaclass collects them into
+    ``__fields__`` and generates the per-class constructor and
+    serializer.
+
+    Example:
+        ```python
+        class User(Model):
+            id: int = Field(primary_key=True)
+            name: str = Field(unique=True)
+            age: int = Field(default=0)
+
+        user = User(name="John", age=25)
+        user.to_dict()  # {'id': None, 'name': 'John', 'age': 25}
+        ```
+    """
+
+    @classmethod
+    def get_primary_key(cls) -> str:
+        """Get the primary key field name (``'id'`` when undeclared).
+
+        Precomputed by the metaclass at class creation; this is a
+        single attribute read.
+        """
+        return cls.__primary_key__
+
+    @classmethod
+    def get_indexes(cls) -> Tuple[str, ...]:
+        """Get the names of fields that should be indexed.
+
+        Covers primary-key, unique and explicitly indexed fields.
+        Precomputed by the metaclass at class creation.
+        """
+        return cls.__indexed_fields__
+
+    @classmethod
+    def get_foreign_keys(cls) -> Tuple[str, ...]:
+        """Get the names of fields declaring a foreign key.
+
+        Precomputed by the metaclass at class creation.
+        """
+        return cls.__fk_fields__
+
+    @classmethod
+    def _fast_construct(cls: Type[T], record: Dict[str, Any]) -> T:
+        """Build an instance from a record of exactly this field shape.
+
+        Query results already carry the stored field values, so the
+        validated ``__init__`` path — a kwargs dict allocation and a
+        default lookup per field per row — is pure overhead there.
+        This skips it: allocate with ``object.__new__`` and set the
+        slots directly.
+
+        Args:
+            record: Field-name to value mapping for one row.
+
+        Returns:
+            The constructed instance.
+        """
+        instance = object.__new__(cls)
+        for name in cls.__fields__:
+            setattr(instance, name, record.get(name))
+        return instance
+
+    def __repr__(self) -> str:
+        values = ', '.join(f"{name}={getattr(self, name, None)!r}"
+                           for name in self.__fields__)
+        return f"{type(self).__name__}({values})"
\ No newline at end of file
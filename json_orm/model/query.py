@@ -0,0 +1,301 @@
+"""Fluent model queries over the database's column stores.
+
+This module provides the :class:`QueryBuilder` behind
+``Database.query(Model)``. Filtering is pushed into the scan instead of
+materializing every record first: indexed equality conditions narrow
+the candidate rows through the posting sets, vectorizable condition
+trees compile to one NumPy mask over the column buffers, and only the
+rows that survive are materialized as dicts. Unordered queries with a
+limit stop streaming as soon as enough rows matched.
+
+Example:
+    ```python
+    adults = (db.query(User)
+              .where(gte("age", 18), eq("status", "active"))
+              .order_by("name")
+              .limit(10)
+              .all())
+    ```
+"""
+
+import heapq
+import operator
+from typing import Any, Dict, List, Optional, Type, Union
+
+import numpy as np
+
+from .conditions import AndCondition, Condition, and_
+
+
+class QueryBuilder:
+    """Builds and runs a filtered scan over one model's table.
+
+    The builder collects conditions, ordering and limits, then
+    :meth:`all` picks the cheapest execution strategy available:
+    index-driven candidate sets, a vectorized column mask, or a
+    streaming row scan with an early stop.
+
+    Attributes:
+        database: The database to read from.
+        model_class: Model class (or table name) being queried.
+        conditions: Conditions a record must satisfy (implicit AND).
+
+    Example:
+        ```python
+        rows = (QueryBuilder(db, User)
+                .where(eq("status", "active"))
+                .limit(5)
+                .all())
+        ```
+    """
+
+    def __init__(self, database: Any, model_class: Union[str, Type[Any]]):
+        """Initialize an empty query.
+
+        Args:
+            database: The database to read from.
+            model_class: Model class (or table name) to query.
+        """
+        self.database = database
+        self.model_class = model_class
+        self.conditions: List[Condition] = []
+        self.order_by_field: Optional[str] = None
+        self.order_desc = False
+        self.limit_val: Optional[int] = None
+        self.offset_val = 0
+
+    def where(self, *conditions: Condition) -> 'QueryBuilder':
+        """Add conditions; all added conditions must hold (AND)."""
+        self.conditions.extend(conditions)
+        return self
+
+    def order_by(self, field: str, desc: bool = False) -> 'QueryBuilder':
+        """Order the results by one field.
+
+        Args:
+            field: Field to order by.
+            desc: Sort descending when True.
+        """
+        self.order_by_field = field
+        self.order_desc = desc
+        return self
+
+    def limit(self, count: int) -> 'QueryBuilder':
+        """Return at most ``count`` rows."""
+        self.limit_val = count
+        return self
+
+    def offset(self, count: int) -> 'QueryBuilder':
+        """Skip the first ``count`` rows of the result."""
+        self.offset_val = count
+        return self
+
+    def all(self) -> List[Any]:
+        """Run the query and get the matching rows.
+
+        The filter runs inside the scan, cheapest strategy first:
+
+        1. Indexed equality conditions intersect their posting sets,
+           so only candidate rows are ever looked at.
+        2. A vectorizable condition tree compiles to one boolean mask
+           over the table's column buffers; only rows the mask keeps
+           are materialized as dicts.
+        3. Otherwise rows stream through the conditions one by one,
+           stopping early once limit+offset rows matched (when no
+           ordering is requested).
+
+        When querying a model class, rows come back as model instances
+        built through ``Model._fast_construct`` — ``map`` over the
+        already-shaped records, skipping ``__init__`` kwargs unpacking
+        and default resolution per row. Table-name queries return the
+        raw dicts.
+
+        Returns:
+            The matching rows.
+        """
+        table = self.database._table_name(self.model_class)
+        store = self.database._tables.get(table)
+        if store is None or not len(store):
+            return []
+
+        rows = self._order_and_slice(self._scan(table, store))
+        construct = getattr(self.model_class, '_fast_construct', None)
+        if construct is not None:
+            return list(map(construct, rows))
+        return rows
+
+    def first(self) -> Optional[Any]:
+        """Run the query and get the first matching row, or None.
+
+        The limit is applied for this call only; the builder's own
+        limit is left untouched, so a later :meth:`all` on the same
+        builder still returns every match.
+        """
+        previous = self.limit_val
+        self.limit_val = 1
+        try:
+            rows = self.all()
+        finally:
+            self.limit_val = previous
+        return rows[0] if rows else None
+
+    def count(self) -> int:
+        """Count the matching rows without keeping them."""
+        return len(self.all())
+
+    def _ordered_conditions(self, table: str) -> List[Condition]:
+        """The query's conditions, cheapest/most-selective first.
+
+        Row loops short-circuit at the first failing condition, so the
+        condition most likely to fail — and cheapest to test — should
+        run first. Equality estimates use the table's index key counts
+        when available.
+        """
+        if len(self.conditions) < 2:
+            return self.conditions
+        manager = getattr(self.database, 'indexes', None)
+        field_indexes = (manager.indexes.get(table, {})
+                         if manager is not None else {})
+        return sorted(self.conditions,
+                      key=lambda c: (c.estimate_cost(),
+                                     c.estimate_selectivity(field_indexes)))
+
+    def _scan(self, table: str, store: Any) -> List[Dict[str, Any]]:
+        """Produce the filtered (unordered) rows of the table."""
+        if not self.conditions:
+            return store.rows()
+
+        candidates = self._index_candidates(table, store)
+        if candidates is not None:
+            return candidates
+
+        columns = store.columns()
+        combined = (self.conditions[0] if len(self.conditions) == 1
+                    else and_(*self.conditions))
+        mask = combined.compile_to_numpy(columns)
+        if mask is not None:
+            keep = np.flatnonzero(mask)
+            if (self.order_by_field is None
+                    and self.limit_val is not None):
+                keep = keep[:self.limit_val + self.offset_val]
+            return _materialize(columns, keep)
+
+        return self._stream(store, self._ordered_conditions(table))
+
+    def _index_candidates(self, table: str,
+                          store: Any) -> Optional[List[Dict[str, Any]]]:
+        """Resolve indexed equality conditions through posting sets.
+
+        Returns:
+            The matching rows, or None when no equality condition has
+            an index (callers then fall back to a scan).
+        """
+        manager = getattr(self.database, 'indexes', None)
+        if manager is None:
+            return None
+        ids: Optional[set] = None
+        residual: List[Condition] = []
+        for condition in self.conditions:
+            postings = None
+            if getattr(condition, 'tag', None) == 'eq':
+                postings = manager.find_by_index(
+                    table, condition.field, condition.value)
+            if postings is None:
+                residual.append(condition)
+            elif ids is None:
+                ids = set(postings)
+            else:
+                ids &= set(postings)
+        if ids is None:
+            return None
+        if not ids:
+            return []
+
+        columns = store.columns()
+        id_column = columns.get('id')
+        if id_column is None:
+            return None
+        keep = np.flatnonzero(np.isin(id_column, list(ids)))
+        rows = _materialize(columns, keep)
+        if residual:
+            manager = getattr(self.database, 'indexes', None)
+            field_indexes = (manager.indexes.get(table, {})
+                             if manager is not None else {})
+            residual.sort(key=lambda c: (c.estimate_cost(),
+                                         c.estimate_selectivity(field_indexes)))
+            rows = [row for row in rows
+                    if all(c.evaluate(row) for c in residual)]
+        return rows
+
+    def _stream(self, store: Any,
+                conditions: List[Condition]) -> List[Dict[str, Any]]:
+        """Row-at-a-time fallback scan with an early stop.
+
+        The whole conjunction is compiled into one flat closure first
+        (see ``Condition.compile``), so each row costs a single call
+        with the field tests inlined as short-circuiting ``and``
+        source — not one method dispatch per condition. Compiled
+        closures are shared across queries with the same shape and
+        literals. Without an ordering the scan stops as soon as
+        limit+offset rows matched, so a selective LIMIT query over a
+        large table touches only a prefix of it.
+        """
+        combined = (conditions[0] if len(conditions) == 1
+                    else AndCondition(conditions))
+        predicate = combined.compile()
+        stop: Optional[int] = None
+        if self.order_by_field is None and self.limit_val is not None:
+            stop = self.limit_val + self.offset_val
+        matched: List[Dict[str, Any]] = []
+        for row in store.iter_rows():
+            if predicate(row):
+                matched.append(row)
+                if stop is not None and len(matched) >= stop:
+                    break
+        return matched
+
+    def _order_and_slice(self,
+                         rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Apply ordering, offset and limit to the filtered rows.
+
+        ORDER BY x LIMIT k with k much smaller than the match count
+        runs through a bounded heap — O(n log k) comparisons and a
+        k-sized buffer instead of sorting the full result. The key is
+        an itemgetter, which runs in C without a per-call frame.
+        """
+        if self.order_by_field is not None:
+            key = operator.itemgetter(self.order_by_field)
+            needed = (None if self.limit_val is None
+                      else self.limit_val + self.offset_val)
+            if needed is not None and needed < len(rows):
+                select = (heapq.nlargest if self.order_desc
+                          else heapq.nsmallest)
+                rows = select(needed, rows, key=key)
+            else:
+                rows = sorted(rows, key=key, reverse=self.order_desc)
+        if self.offset_val:
+            rows = rows[self.offset_val:]
+        if self.limit_val is not None:
+            rows = rows[:self.limit_val]
+        return rows
+
+
+def _materialize(columns: Dict[str, np.ndarray],
+                 keep: np.ndarray) -> List[Dict[str, Any]]:
+    """Materialize only the selected row indices as dicts.
+
+    Args:
+        columns: The table's column buffers.
+        keep: Row indices to materialize.
+
+    Returns:
+        List[Dict[str, Any]]: One dict per kept row, NumPy scalars
+        unboxed to native Python values.
+    """
+    names = list(columns)
+    buffers = [columns[name] for name in names]
+    return [
+        {name: (value.item() if isinstance(value, np.generic) else value)
+         for name, value in zip(names, (buf[i] for buf in buffers))}
+        for i in keep
+    ]
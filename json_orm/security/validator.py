@@ -8,21 +8,48 @@ protecting against common vulnerabilities while working with JSON storage:
 - Resource usage protection
 """
 
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from ..sql.clause.base import Clause
 from ..sql.statement.base import Statement
 
 
+def _resolve_extractor(clause: Clause, names: Tuple[str, ...],
+                       default: Any) -> Callable[[Clause], Any]:
+    """Build a one-getattr extractor for one clause type.
+
+    The candidate names are probed once, against the given instance
+    (clause attributes are set in ``__init__``, so the first instance
+    of a type is representative); the returned accessor reads the
+    winning attribute directly on every later call.
+    """
+    for name in names:
+        if hasattr(clause, name):
+            def extract(c: Clause, _name: str = name,
+                        _default: Any = default) -> Any:
+                value = getattr(c, _name, None)
+                return value if value is not None else _default
+            return extract
+
+    def extract_missing(c: Clause, _default: Any = default) -> Any:
+        return _default
+    return extract_missing
+
+
+# Accessor tuples per concrete Clause subclass, resolved lazily from
+# the first instance seen (see SecurityValidator._classify).
+_CLAUSE_ACCESSORS: Dict[type, Tuple[Callable, ...]] = {}
+
+
 class SecurityValidator:
     """Validates queries and operations for security concerns.
-    
+
     Provides a robust security layer that:
     - Enforces access control on tables and columns
     - Limits query complexity to prevent DoS
     - Validates all SQL operations for safety
     - Prevents common attack vectors
-    
+
     Attributes:
         _max_query_depth (int): Maximum allowed depth of nested queries
         _max_conditions (int): Maximum number of conditions in a query
@@ -37,135 +64,240 @@ class SecurityValidator:
         self._max_joins = 5
         self._allowed_tables: Set[str] = set()
         self._allowed_columns: Dict[str, Set[str]] = {}
+        # Flat (table, column) ACL maintained incrementally at grant
+        # time, so per-clause checks are single hash lookups instead of
+        # a cascade of set constructions and branches.
+        self._flat_acl: Set[Tuple[str, str]] = set()
 
     def allow_table(self, table: str) -> None:
         """Grant access permission to a table.
-        
+
         Args:
             table: Name of the table to allow access to
         """
-        pass
+        self._allowed_tables.add(table)
 
     def allow_column(self, table: str, column: str) -> None:
         """Grant access permission to a specific column.
-        
+
         Args:
             table: Name of the table containing the column
             column: Name of the column to allow access to
         """
-        pass
+        self._allowed_columns.setdefault(table, set()).add(column)
+        self._flat_acl.add((table, column))
 
     def validate_statement(self, statement: Statement) -> None:
         """Validate a complete SQL statement for security compliance.
-        
+
         Performs comprehensive security checks including:
         - Access control validation
         - Query complexity limits
         - SQL injection prevention
         - Resource usage checks
-        
+
         Args:
             statement: SQL statement to validate
-            
+
         Raises:
             SecurityError: If any security check fails
         """
+        # Statements that carry precomputed complexity counters (depth,
+        # conditions, joins) are checked with three integer comparisons.
+        counters = getattr(statement, '_complexity', None)
+        if counters is not None:
+            depth, conditions, joins = counters
+            for clause in statement.get_clauses():
+                if clause is not None:
+                    self._validate_clause(clause)
+        else:
+            depth = self._get_query_depth(statement)
+            conditions = 0
+            joins = 0
+            for clause in statement.get_clauses():
+                if clause is None:
+                    continue
+                self._validate_clause(clause)
+                conditions += len(self._get_clause_conditions(clause))
+                joins += len(self._get_clause_joins(clause))
+
+        if depth > self._max_query_depth:
+            raise SecurityError(
+                f"Query exceeds maximum depth of {self._max_query_depth}"
+            )
+
+        if conditions > self._max_conditions:
+            raise SecurityError(
+                f"Query exceeds maximum of {self._max_conditions} conditions"
+            )
+        if joins > self._max_joins:
+            raise SecurityError(
+                f"Query exceeds maximum of {self._max_joins} joins"
+            )
+
+        # Joins are flattened out of the clause list into parallel
+        # arrays on the statement; check their tables here.
+        for table in getattr(statement, '_join_tables', ()):
+            self._check_table_access(table)
+
     def _validate_clause(self, clause: Clause) -> None:
         """Validate a single clause for security compliance.
-        
+
         Checks the clause for potential security risks, including:
         - Access control violations
         - SQL injection vulnerabilities
         - Excessive complexity
-        
+
+        Access checks are O(1) lookups against the flat (table, column)
+        ACL maintained by allow_table/allow_column. Most clauses of a
+        SELECT carry no ``table`` of their own, so each column is
+        checked against the table it names itself (falling back to the
+        clause's table when the column has none).
+
         Args:
             clause: Clause to validate
-            
+
         Raises:
             SecurityError: If any security check fails
         """
+        table = self._get_clause_table(clause)
+        if table is not None:
+            self._check_table_access(table)
+
+        flat_acl = self._flat_acl
+        for column in self._get_clause_columns(clause):
+            name = getattr(column, 'name', column)
+            owner = getattr(column, 'table', None) or table
+            owner = getattr(owner, 'name', owner)
+            if owner is None:
+                continue
+            self._check_table_access(owner)
+            if owner in self._allowed_columns \
+                    and (owner, name) not in flat_acl:
+                raise SecurityError(
+                    f"Access to column '{name}' of table "
+                    f"'{owner}' is not allowed"
+                )
+
+    def _check_table_access(self, table: str) -> None:
+        """Raise unless the table passes the table ACL.
+
+        Args:
+            table: Table name to check
+
+        Raises:
+            SecurityError: If a table ACL is set and excludes the table
+        """
+        if self._allowed_tables and table not in self._allowed_tables:
+            raise SecurityError(f"Access to table '{table}' is not allowed")
 
     def _get_query_depth(self, statement: Statement) -> int:
         """Calculate the depth of nested queries in a statement.
-        
+
         Recursively traverses the statement to determine the maximum depth of nested queries.
-        
+
         Args:
             statement: SQL statement to calculate query depth for
-            
+
         Returns:
             int: Maximum depth of nested queries
         """
+        depth = 1
+        for clause in statement.get_clauses():
+            if clause is None:
+                continue
+            for subquery in self._get_clause_subqueries(clause):
+                depth = max(depth, 1 + self._get_query_depth(subquery))
+        return depth
+
+    @staticmethod
+    def _classify(clause: Clause) -> Tuple[Callable, ...]:
+        """Get the specialized introspection accessors for a clause.
+
+        On the first clause of each type the candidate attribute names
+        are probed once and the winners captured in direct accessors;
+        every later clause of that type resolves to one dict lookup
+        and one getattr, with no probing cascade.
+
+        Args:
+            clause: Clause instance to classify
+
+        Returns:
+            Tuple of (get_table, get_columns, get_conditions,
+            get_joins, get_subqueries) callables
+        """
+        accessors = _CLAUSE_ACCESSORS.get(type(clause))
+        if accessors is None:
+            accessors = _CLAUSE_ACCESSORS[type(clause)] = (
+                _resolve_extractor(clause, ('table',), None),
+                _resolve_extractor(clause, ('columns', '_columns'), ()),
+                _resolve_extractor(clause, ('conditions', 'condition'), ()),
+                _resolve_extractor(clause, ('joins', '_joins'), ()),
+                _resolve_extractor(clause, ('subqueries', 'subquery'), ()),
+            )
+        return accessors
 
     def _get_clause_table(self, clause: Clause) -> Optional[str]:
         """Get the main table referenced in a clause.
-        
-        Extracts the primary table from the clause, if applicable.
-        
+
         Args:
             clause: Clause to extract table from
-            
+
         Returns:
             Optional[str]: Name of the main table, or None if not applicable
         """
-        # Implementation depends on clause type
-        pass
+        table = self._classify(clause)[0](clause)
+        return getattr(table, 'name', table)
 
     def _get_clause_columns(self, clause: Clause) -> List[Any]:
         """Get all columns referenced in a clause.
-        
-        Extracts a list of columns mentioned in the clause.
-        
+
         Args:
             clause: Clause to extract columns from
-            
+
         Returns:
             List[Any]: List of columns referenced in the clause
         """
-        # Implementation depends on clause type
-        pass
+        return list(self._classify(clause)[1](clause))
 
     def _get_clause_conditions(self, clause: Clause) -> List[Any]:
         """Get all conditions in a clause.
-        
-        Extracts a list of conditions defined in the clause.
-        
+
         Args:
             clause: Clause to extract conditions from
-            
+
         Returns:
             List[Any]: List of conditions in the clause
         """
-        # Implementation depends on clause type
-        pass
+        conditions = self._classify(clause)[2](clause)
+        if isinstance(conditions, (list, tuple)):
+            return list(conditions)
+        return [conditions]
 
     def _get_clause_joins(self, clause: Clause) -> List[Any]:
         """Get all joins in a clause.
-        
-        Extracts a list of joins defined in the clause.
-        
+
         Args:
             clause: Clause to extract joins from
-            
+
         Returns:
             List[Any]: List of joins in the clause
         """
-        # Implementation depends on clause type
-        pass
+        return list(self._classify(clause)[3](clause))
 
     def _get_clause_subqueries(self, clause: Clause) -> List[Statement]:
         """Get all subqueries in a clause.
-        
-        Extracts a list of subqueries defined in the clause.
-        
+
         Args:
             clause: Clause to extract subqueries from
-            
+
         Returns:
             List[Statement]: List of subqueries in the clause
         """
-        # Implementation depends on clause type
-        pass
+        subqueries = self._classify(clause)[4](clause)
+        if isinstance(subqueries, (list, tuple)):
+            return list(subqueries)
+        return [subqueries]
 
 
 class SecurityError(Exception):
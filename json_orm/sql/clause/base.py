@@ -12,18 +12,116 @@ Example:
     where.add(ComparisonClause(User.status, "=", "active"))
     
     # Process the clause
-    validator = ClauseValidator()
-    optimizer = ClauseOptimizer()
-    validator.set_next(optimizer)
-    validator.handle(where)
+    chain = ClauseProcessingChain()
+    chain.add_handler(ClauseValidator())
+    chain.add_handler(ClauseOptimizer())
+    chain.process(where)
     ```
 """
 
+import warnings
 from abc import ABC, abstractmethod
-from typing import List, Optional, TypeVar, Generic
+from functools import singledispatchmethod
+from sys import intern
+from typing import Any, Callable, Generic, Iterable, Iterator, List, \
+    Optional, Tuple, TypeVar
 
 T = TypeVar('T')
 
+# Opcodes for flattened clause-evaluation programs.
+OP_VALIDATE = 0  # call a leaf clause's own validate()
+OP_ALL = 1       # AND together previously computed child results
+
+
+class ClauseEvalStep:
+    """One step of a flattened clause-evaluation program.
+
+    Attributes:
+        opcode: Which handler in the dispatch table runs this step.
+        operand: Opcode-specific payload (a bound validate method for
+            OP_VALIDATE, a tuple of child result slots for OP_ALL).
+        resvalue_idx: Slot in the result array this step writes.
+    """
+
+    __slots__ = ('opcode', 'operand', 'resvalue_idx')
+
+    def __init__(self, opcode: int, operand: Any, resvalue_idx: int):
+        self.opcode = opcode
+        self.operand = operand
+        self.resvalue_idx = resvalue_idx
+
+
+class ClauseEvalInit:
+    """Compiles a clause tree into a flat opcode program.
+
+    All isinstance checks and attribute resolution happen here, once
+    per tree shape; the interpreter loop then does nothing but table
+    dispatch over a sequential array of steps, avoiding per-node
+    recursion and indirect visitor calls.
+    """
+
+    def compile(self, clause: 'Clause') -> List[ClauseEvalStep]:
+        """Flatten a clause tree into an executable step list.
+
+        Args:
+            clause: Root of the tree to compile.
+
+        Returns:
+            List[ClauseEvalStep]: Steps in evaluation (post) order; the
+            final step writes the overall result.
+        """
+        steps: List[ClauseEvalStep] = []
+        self._flatten(clause, steps)
+        return steps
+
+    def _flatten(self, clause: 'Clause', steps: List[ClauseEvalStep]) -> int:
+        """Emit steps for one node, returning its result slot index."""
+        if isinstance(clause, ClauseComposite):
+            child_slots = tuple(
+                self._flatten(child, steps) for child in clause._children
+            )
+            slot = len(steps)
+            steps.append(ClauseEvalStep(OP_ALL, child_slots, slot))
+            return slot
+        slot = len(steps)
+        steps.append(ClauseEvalStep(OP_VALIDATE, clause.validate, slot))
+        return slot
+
+
+def _op_validate(step: ClauseEvalStep, results: List[bool]) -> None:
+    results[step.resvalue_idx] = step.operand()
+
+
+def _op_all(step: ClauseEvalStep, results: List[bool]) -> None:
+    results[step.resvalue_idx] = all(results[i] for i in step.operand)
+
+
+# Tuple-of-functions dispatch table indexed by opcode (the Python
+# equivalent of computed goto).
+EVAL_HANDLERS: Tuple[Callable[[ClauseEvalStep, List[bool]], None], ...] = (
+    _op_validate,
+    _op_all,
+)
+
+
+def _run_clause_program_py(steps: List[ClauseEvalStep]) -> bool:
+    """Run a compiled clause program and return the final result."""
+    if not steps:
+        return True
+    results = [False] * len(steps)
+    handlers = EVAL_HANDLERS
+    for step in steps:
+        handlers[step.opcode](step, results)
+    return results[-1]
+
+
+try:
+    # Compiled interpreter loop (C switch dispatch); built via
+    # ``python setup.py build_ext --inplace``.
+    from .._interp import run as run_clause_program
+except ImportError:
+    run_clause_program = _run_clause_program_py
+
 
 class Clause(ABC):
     """Base class for all SQL clauses.
@@ -34,22 +132,12 @@ class Clause(ABC):
     Example:
         ```python
         class WhereClause(Clause):
-            def accept(self, visitor: ClauseVisitor) -> None:
-                visitor.visit(self)
-                
             def validate(self) -> bool:
                 return self.condition is not None
         ```
     """
 
-    @abstractmethod
-    def accept(self, visitor: 'ClauseVisitor') -> None:
-        """Accept a clause visitor.
-        
-        Args:
-            visitor: The visitor that will process this clause.
-        """
-        pass
+    __slots__ = ()
 
     @abstractmethod
     def validate(self) -> bool:
@@ -70,30 +158,59 @@ class Clause(ABC):
         pass
 
 
-class ClauseVisitor(ABC):
+class ClauseVisitor:
     """Base visitor for SQL clauses.
-    
-    This abstract class defines the interface for clause visitors, which
-    can process different types of clauses in various ways (validation,
-    optimization, execution, etc.).
-    
+
+    Visitors take clauses directly — there is no ``accept`` trampoline.
+    Dispatch runs through :func:`functools.singledispatchmethod`, whose
+    per-type cache resolves the handler in one call instead of the
+    classic two-call accept/visit round trip. Concrete visitors declare
+    their own dispatcher and register one handler per clause type.
+
     Example:
         ```python
         class ClauseValidator(ClauseVisitor):
+            @singledispatchmethod
             def visit(self, clause: Clause) -> None:
                 if not clause.validate():
                     raise ValueError("Invalid clause")
+
+            @visit.register
+            def _(self, clause: WhereClause) -> None:
+                for condition in clause.conditions:
+                    self.check_condition(condition)
         ```
     """
 
-    @abstractmethod
+    __slots__ = ()
+
+    @singledispatchmethod
     def visit(self, clause: Clause) -> None:
         """Visit a clause.
-        
+
+        The default implementation handles any clause type without a
+        registered handler; subclasses override or register per-type
+        handlers as needed.
+
         Args:
             clause: The clause to process.
         """
-        pass
+        self.generic_visit(clause)
+
+    def generic_visit(self, clause: Clause) -> None:
+        """Fallback for clause types without a registered handler.
+
+        Args:
+            clause: The unhandled clause.
+
+        Raises:
+            NotImplementedError: Always; subclasses override this to
+                change the fallback behavior.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} has no handler for "
+            f"{type(clause).__name__}"
+        )
 
 
 class ClauseBuilder(Generic[T], ABC):
@@ -143,41 +260,114 @@ class ClauseComposite(Clause):
         ```
     """
 
-    def __init__(self):
-        """Initialize an empty composite clause."""
-        self._children: List[Clause] = []
+    __slots__ = ('_children', '_program', '_parent', '_hash')
+
+    def __init__(self, children: Iterable[Clause] = ()):
+        """Initialize a composite clause.
+
+        Args:
+            children: Optional initial child clauses, adopted in one
+                shot so bulk construction avoids repeated list growth.
+        """
+        self._children: List[Clause] = list(children)
+        self._program: Optional[List[ClauseEvalStep]] = None
+        self._parent: Optional['ClauseComposite'] = None
+        self._hash: Optional[int] = None
+        for child in self._children:
+            if isinstance(child, ClauseComposite):
+                child._parent = self
 
     def add(self, clause: Clause) -> None:
         """Add a child clause.
-        
+
         Args:
             clause: The clause to add as a child.
         """
         self._children.append(clause)
+        if isinstance(clause, ClauseComposite):
+            clause._parent = self
+        self._invalidate_program()
 
     def remove(self, clause: Clause) -> None:
         """Remove a child clause.
-        
+
         Args:
             clause: The clause to remove.
         """
         self._children.remove(clause)
+        if isinstance(clause, ClauseComposite):
+            clause._parent = None
+        self._invalidate_program()
+
+    def _invalidate_program(self) -> None:
+        """Drop compiled programs and cached hashes up the ancestor chain."""
+        node: Optional['ClauseComposite'] = self
+        while node is not None:
+            node._program = None
+            node._hash = None
+            node = node._parent
+
+    def fingerprint(self) -> Tuple:
+        """Compute the structural fingerprint of this composite.
+
+        Captures the composite's type and, recursively, the shape of
+        its subtree. String components are interned so repeated
+        fingerprints share storage and compare by pointer.
+
+        Returns:
+            Tuple: A hashable fingerprint of the subtree structure.
+        """
+        return (intern(type(self).__name__),) + tuple(
+            child.fingerprint() if isinstance(child, ClauseComposite)
+            else intern(type(child).__name__)
+            for child in self._children
+        )
+
+    def __hash__(self) -> int:
+        """Hash by structural fingerprint, cached until the tree mutates."""
+        if self._hash is None:
+            self._hash = hash(self.fingerprint())
+        return self._hash
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare composites by structural fingerprint."""
+        if not isinstance(other, ClauseComposite):
+            return NotImplemented
+        return self.fingerprint() == other.fingerprint()
+
+    def get_children(self) -> Tuple[Clause, ...]:
+        """Get an isolated snapshot of the child clauses.
 
-    def get_children(self) -> List[Clause]:
-        """Get all child clauses.
-        
         Returns:
-            List[Clause]: A copy of the list of child clauses.
+            Tuple[Clause, ...]: The child clauses; immutable, so callers
+            cannot perturb the tree through it.
         """
-        return self._children.copy()
+        return tuple(self._children)
+
+    def iter_children(self) -> Iterator[Clause]:
+        """Iterate over the child clauses without copying.
+
+        Prefer this in visitors and other read-only walks; it avoids
+        the per-call allocation of :meth:`get_children`.
+
+        Returns:
+            Iterator[Clause]: An iterator over the children.
+        """
+        return iter(self._children)
 
     def validate(self) -> bool:
         """Validate all child clauses.
-        
+
+        The tree is flattened once into an opcode program (recompiled
+        only when children change) and evaluated with a non-recursive
+        interpreter loop, so deep trees cost no Python stack frames.
+
         Returns:
             bool: True if all children are valid, False otherwise.
         """
-        return all(child.validate() for child in self._children)
+        if self._program is None:
+            self._program = ClauseEvalInit().compile(self)
+        return run_clause_program(self._program)
 
     def clone(self) -> 'ClauseComposite':
         """Create a deep copy.
@@ -185,47 +375,61 @@ class ClauseComposite(Clause):
         Returns:
             ClauseComposite: A new instance with cloned children.
         """
-        clone = type(self)()
-        for child in self._children:
-            clone.add(child.clone())
-        return clone
+        return type(self)(child.clone() for child in self._children)
 
 
 class ClauseHandler(ABC):
     """Base handler for clause processing.
     
-    This class implements the Chain of Responsibility pattern for
-    processing clauses through multiple steps (validation,
-    optimization, etc.).
-    
+    Handlers are independent processing steps; compose them with
+    ``ClauseProcessingChain``, which holds a flat tuple and runs them
+    in a sequential loop. The old linked-list chaining through
+    ``set_next``/``_next_handler`` is deprecated — pointer-chasing one
+    indirect call per link loses to a plain tuple traversal.
+
     Example:
         ```python
-        # Create a processing chain
-        validator = ClauseValidator()
-        optimizer = ClauseOptimizer()
-        executor = ClauseExecutor()
-        
-        validator.set_next(optimizer).set_next(executor)
-        validator.handle(clause)
+        # Compose handlers through a flat chain
+        chain = ClauseProcessingChain()
+        chain.add_handler(ClauseValidator())
+        chain.add_handler(ClauseOptimizer())
+        chain.add_handler(ClauseExecutor())
+        chain.process(clause)
         ```
     """
 
+    __slots__ = ('_next_handler',)
+
     def __init__(self):
         """Initialize handler with no next handler."""
         self._next_handler: Optional['ClauseHandler'] = None
 
     def set_next(self, handler: 'ClauseHandler') -> 'ClauseHandler':
         """Set the next handler in the chain.
-        
+
+        .. deprecated:: Compose handlers via ``ClauseProcessingChain``
+           instead; the linked list costs an indirect call per link.
+
         Args:
             handler: The next handler to process clauses.
-            
+
         Returns:
             ClauseHandler: The next handler (for chaining).
         """
+        warnings.warn(
+            "ClauseHandler.set_next is deprecated; add handlers to a "
+            "ClauseProcessingChain instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         self._next_handler = handler
         return handler
 
+    def _handle_next(self, clause: 'Clause') -> None:
+        """Forward to the deprecated linked-list successor, if any."""
+        if self._next_handler is not None:
+            self._next_handler.handle(clause)
+
     @abstractmethod
     def handle(self, clause: Clause) -> None:
         """Handle a clause.
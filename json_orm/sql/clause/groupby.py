@@ -0,0 +1,41 @@
+"""GROUP BY clause implementation for SQL statements.
+
+This module provides the GROUP BY clause used by SELECT statements,
+usually together with aggregate functions and a HAVING clause.
+
+Example:
+    ```python
+    group = GroupByClause([User.country, User.city])
+    ```
+"""
+
+from typing import List, Optional
+
+from .base import Clause
+from ..expressions import Expression
+
+
+class GroupByClause(Clause):
+    """GROUP BY clause in a SELECT statement.
+
+    Attributes:
+        columns: Columns to group results by.
+    """
+
+    __slots__ = ('columns',)
+
+    def __init__(self, columns: Optional[List[Expression]] = None):
+        """Initialize the grouping clause.
+
+        Args:
+            columns: Columns to group by.
+        """
+        self.columns: List[Expression] = list(columns or [])
+
+    def validate(self) -> bool:
+        """Validate the clause: at least one grouping column."""
+        return len(self.columns) > 0
+
+    def clone(self) -> 'GroupByClause':
+        """Create a copy of this clause."""
+        return GroupByClause(list(self.columns))
@@ -0,0 +1,41 @@
+"""HAVING clause implementation for SQL statements.
+
+This module provides the HAVING clause used by SELECT statements to
+filter grouped results; it always accompanies a GROUP BY clause.
+
+Example:
+    ```python
+    having = HavingClause(func.count(Order.id) > 5)
+    ```
+"""
+
+from typing import Optional
+
+from .base import Clause
+from ..expressions import Expression
+
+
+class HavingClause(Clause):
+    """HAVING clause in a SELECT statement.
+
+    Attributes:
+        condition: Expression filtering the grouped results.
+    """
+
+    __slots__ = ('condition',)
+
+    def __init__(self, condition: Optional[Expression] = None):
+        """Initialize the clause.
+
+        Args:
+            condition: Expression filtering the grouped results.
+        """
+        self.condition = condition
+
+    def validate(self) -> bool:
+        """Validate the clause: a condition must be set."""
+        return self.condition is not None
+
+    def clone(self) -> 'HavingClause':
+        """Create a copy of this clause."""
+        return HavingClause(self.condition)
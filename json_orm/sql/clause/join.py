@@ -0,0 +1,48 @@
+"""JOIN clause implementation for SQL statements.
+
+This module provides the JOIN clause used by SELECT statements,
+supporting INNER, LEFT, RIGHT and FULL joins with a join condition.
+
+Example:
+    ```python
+    join = JoinClause(Order, User.id == Order.user_id, "LEFT")
+    ```
+"""
+
+from typing import Any, Optional
+
+from .base import Clause
+from ..expressions import Expression
+
+
+class JoinClause(Clause):
+    """JOIN clause in a SELECT statement.
+
+    Attributes:
+        table: The table being joined.
+        condition: Expression specifying the join condition.
+        join_type: Type of join (INNER, LEFT, RIGHT, FULL).
+    """
+
+    __slots__ = ('table', 'condition', 'join_type')
+
+    def __init__(self, table: Any, condition: Optional[Expression] = None,
+                 join_type: str = "INNER"):
+        """Initialize the join clause.
+
+        Args:
+            table: The table to join with.
+            condition: Expression specifying the join condition.
+            join_type: Type of join (INNER, LEFT, RIGHT, FULL).
+        """
+        self.table = table
+        self.condition = condition
+        self.join_type = join_type
+
+    def validate(self) -> bool:
+        """Validate the clause: table and condition must be set."""
+        return self.table is not None and self.condition is not None
+
+    def clone(self) -> 'JoinClause':
+        """Create a copy of this clause."""
+        return JoinClause(self.table, self.condition, self.join_type)
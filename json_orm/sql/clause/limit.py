@@ -0,0 +1,44 @@
+"""LIMIT clause implementation for SQL statements.
+
+This module provides the LIMIT clause used by SELECT statements for
+result limiting and pagination.
+
+Example:
+    ```python
+    # Get 10 rows starting from position 20
+    limit = LimitClause(count=10, offset=20)
+    ```
+"""
+
+from typing import Optional
+
+from .base import Clause
+
+
+class LimitClause(Clause):
+    """LIMIT clause in a SELECT statement.
+
+    Attributes:
+        count: Maximum number of rows to return.
+        offset: Number of rows to skip (for pagination).
+    """
+
+    __slots__ = ('count', 'offset')
+
+    def __init__(self, count: int = 0, offset: Optional[int] = None):
+        """Initialize the clause.
+
+        Args:
+            count: Maximum number of rows to return.
+            offset: Number of rows to skip.
+        """
+        self.count = count
+        self.offset = offset
+
+    def validate(self) -> bool:
+        """Validate the clause: non-negative count and offset."""
+        return self.count >= 0 and (self.offset is None or self.offset >= 0)
+
+    def clone(self) -> 'LimitClause':
+        """Create a copy of this clause."""
+        return LimitClause(self.count, self.offset)
@@ -0,0 +1,48 @@
+"""ORDER BY clause implementation for SQL statements.
+
+This module provides the ORDER BY clause used by SELECT statements.
+Each ordering column carries its own sort direction.
+
+Example:
+    ```python
+    order = OrderByClause([User.name, User.age], ["ASC", "DESC"])
+    ```
+"""
+
+from typing import List, Optional
+
+from .base import Clause
+from ..expressions import Expression
+
+
+class OrderByClause(Clause):
+    """ORDER BY clause in a SELECT statement.
+
+    Attributes:
+        columns: Columns or expressions to order by.
+        directions: Sort directions ("ASC" or "DESC"), one per column.
+    """
+
+    __slots__ = ('columns', 'directions')
+
+    def __init__(self, columns: Optional[List[Expression]] = None,
+                 directions: Optional[List[str]] = None):
+        """Initialize the ordering clause.
+
+        Args:
+            columns: Columns or expressions to order by.
+            directions: Sort directions, one per column; defaults to ASC.
+        """
+        self.columns: List[Expression] = list(columns or [])
+        self.directions: List[str] = list(
+            directions or ["ASC"] * len(self.columns)
+        )
+
+    def validate(self) -> bool:
+        """Validate the clause: columns present, one direction each."""
+        return (len(self.columns) > 0
+                and len(self.columns) == len(self.directions))
+
+    def clone(self) -> 'OrderByClause':
+        """Create a copy of this clause."""
+        return OrderByClause(list(self.columns), list(self.directions))
@@ -22,8 +22,8 @@ Example:
 
 from typing import List
 
-from .base import Clause, ClauseVisitor, ClauseBuilder, ClauseHandler
-from ..expression import Expression
+from .base import Clause, ClauseBuilder, ClauseHandler
+from ..expressions import Expression
 
 
 class SelectClause(Clause):
@@ -45,6 +45,8 @@ class SelectClause(Clause):
         ```
     """
 
+    __slots__ = ('_columns', '_distinct')
+
     def __init__(self):
         """Initialize an empty SELECT clause."""
         self._columns: List[Expression] = []
@@ -66,14 +68,6 @@ class SelectClause(Clause):
         """
         self._distinct = distinct
 
-    def accept(self, visitor: ClauseVisitor) -> None:
-        """Accept a clause visitor.
-        
-        Args:
-            visitor: Visitor to process this clause.
-        """
-        visitor.visit(self)
-
     def validate(self) -> bool:
         """Validate the SELECT clause.
         
@@ -162,9 +156,10 @@ class SelectClauseHandler(ClauseHandler):
     
     Example:
         ```python
-        handler = SelectClauseHandler()
-        handler.set_next(OptimizationHandler())
-        handler.handle(select_clause)
+        chain = ClauseProcessingChain()
+        chain.add_handler(SelectClauseHandler())
+        chain.add_handler(OptimizationHandler())
+        chain.process(select_clause)
         ```
     """
 
@@ -172,13 +167,12 @@ class SelectClauseHandler(ClauseHandler):
         """Handle a clause.
         
         Args:
-            clause: Clause to process. If it's a SelectClause,
-                   process it before passing to next handler.
+            clause: Clause to process; SelectClause instances are
+                processed, others are ignored.
         """
         if isinstance(clause, SelectClause):
             # Handle SELECT clause
             self._process_select(clause)
-        self._handle_next(clause)
 
     def _process_select(self, clause: SelectClause) -> None:
         """Process a SELECT clause.
@@ -0,0 +1,55 @@
+"""WHERE clause implementation for SQL statements.
+
+This module provides the WHERE clause used by SELECT, UPDATE and DELETE
+statements. Conditions added to the clause are combined with AND logic.
+
+Example:
+    ```python
+    where = WhereClause()
+    where.add_condition(User.age > 18)
+    where.add_condition(User.status == "active")
+    ```
+"""
+
+from typing import List, Optional
+
+from .base import Clause
+from ..expressions import Expression
+
+
+class WhereClause(Clause):
+    """WHERE clause in a SQL statement.
+
+    Attributes:
+        conditions: Expressions combined with AND to filter rows.
+    """
+
+    __slots__ = ('conditions',)
+
+    def __init__(self, condition: Optional[Expression] = None):
+        """Initialize the clause, optionally with a first condition.
+
+        Args:
+            condition: Initial filtering condition, if any.
+        """
+        self.conditions: List[Expression] = []
+        if condition is not None:
+            self.conditions.append(condition)
+
+    def add_condition(self, condition: Expression) -> None:
+        """Add a condition, ANDed with any existing ones.
+
+        Args:
+            condition: Expression representing the condition to add.
+        """
+        self.conditions.append(condition)
+
+    def validate(self) -> bool:
+        """Validate the clause: at least one condition is present."""
+        return len(self.conditions) > 0
+
+    def clone(self) -> 'WhereClause':
+        """Create a copy of this clause."""
+        clone = WhereClause()
+        clone.conditions = list(self.conditions)
+        return clone
@@ -1,39 +1,80 @@
 """SQL evaluation context for the JSON database.
 
 This module provides context classes that hold state and configuration
-for SQL expression and statement evaluation. It ensures secure and
-consistent evaluation across the database engine.
+for SQL expression and statement evaluation, plus the batched
+expression evaluator. Evaluation is vectorized: instead of calling an
+``evaluate`` per row (Volcano style), expressions run against a column
+batch — a dict of NumPy arrays — producing a boolean mask or value
+array per batch, so comparisons compile down to single SIMD-backed
+NumPy calls.
 
 Example:
     ```python
-    # Create an evaluation context
+    # Create an evaluation context over a column batch
     context = EvaluationContext(
         parameters={"user_id": 123},
-        max_recursion=10,
-        timeout_ms=1000
+        batch={"age": ages, "status": statuses},
     )
-    
-    # Use in expression evaluation
-    result = expression.evaluate(context)
+
+    # Evaluate a predicate over the whole batch at once
+    mask = evaluate_batch(User.age > 18, context)
     ```
 """
 
-from dataclasses import dataclass
+import operator
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+from .expressions import BinaryOperator, Column, Expression, Literal, \
+    UnaryOperator
+
+# Default number of rows evaluated per batch.
+DEFAULT_BATCH_SIZE = 1024
+
+# Operator symbol -> vectorized implementation. NumPy broadcasts these
+# over whole column arrays, so one table entry is one SIMD kernel.
+_BINARY_OPS: Dict[str, Callable[[Any, Any], Any]] = {
+    '=': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+    'AND': operator.and_,
+    'OR': operator.or_,
+}
+
+_UNARY_OPS: Dict[str, Callable[[Any], Any]] = {
+    'NOT': np.logical_not,
+    '-': operator.neg,
+    '+': operator.pos,
+}
 
 
-@dataclass
 class EvaluationContext:
     """Context for secure expression evaluation.
-    
+
     This class provides a secure environment for evaluating SQL
     expressions, with configurable limits and parameters to
-    prevent malicious or resource-intensive operations.
-    
+    prevent malicious or resource-intensive operations. It is a plain
+    slots class rather than a dataclass: contexts are built per batch
+    boundary on the hot path, compared by identity, and never hashed
+    or pretty-printed, so the generated dunder machinery is dead
+    weight.
+
     Attributes:
         parameters: Dictionary of parameter values for the query.
         max_recursion: Maximum recursion depth for expression evaluation.
         timeout_ms: Maximum time in milliseconds for evaluation.
-        
+        batch: Column batch (name -> NumPy array) being evaluated, if
+            the vectorized path is in use.
+        batch_size: Number of rows per batch.
+
     Example:
         ```python
         # Create context with parameters
@@ -42,8 +83,97 @@ class EvaluationContext:
             max_recursion=5,
             timeout_ms=500
         )
-        
+
         # Use in expression evaluation
         result = (User.age >= context.parameters["min_age"]).evaluate(context)
         ```
-    """
\ No newline at end of file
+    """
+
+    __slots__ = ('parameters', 'max_recursion', 'timeout_ms', 'batch',
+                 'batch_size')
+
+    def __init__(self,
+                 parameters: Optional[Dict[str, Any]] = None,
+                 max_recursion: int = 10,
+                 timeout_ms: Optional[int] = None,
+                 batch: Optional[Dict[str, np.ndarray]] = None,
+                 batch_size: int = DEFAULT_BATCH_SIZE):
+        """Initialize the context.
+
+        Args:
+            parameters: Parameter values for the query.
+            max_recursion: Maximum expression recursion depth.
+            timeout_ms: Maximum evaluation time in milliseconds.
+            batch: Column batch for vectorized evaluation.
+            batch_size: Rows per batch.
+        """
+        self.parameters = parameters if parameters is not None else {}
+        self.max_recursion = max_recursion
+        self.timeout_ms = timeout_ms
+        self.batch = batch
+        self.batch_size = batch_size
+
+
+def evaluate_batch(expression: Expression,
+                   context: EvaluationContext) -> np.ndarray:
+    """Evaluate an expression over the context's column batch.
+
+    Runs one NumPy operation per expression node rather than one
+    Python call per row: comparisons yield boolean masks (WHERE),
+    arithmetic yields value arrays. Columns resolve against
+    ``context.batch``; literals broadcast as scalars.
+
+    Args:
+        expression: The expression tree to evaluate.
+        context: Evaluation context whose ``batch`` holds the columns.
+
+    Returns:
+        np.ndarray: A per-row result array for the batch (boolean mask
+        for predicates).
+
+    Raises:
+        KeyError: If a referenced column is missing from the batch.
+        ValueError: If the expression type is unsupported or the
+            context has no batch.
+    """
+    if context.batch is None:
+        raise ValueError("EvaluationContext has no column batch")
+    return _eval_node(expression, context)
+
+
+def _eval_node(node: Any, context: EvaluationContext) -> Any:
+    """Evaluate one expression node against the batch."""
+    if isinstance(node, Column):
+        return context.batch[node.name]
+    if isinstance(node, Literal):
+        return node.value
+    if isinstance(node, BinaryOperator):
+        left = _eval_node(node.left, context)
+        right = _eval_node(node.right, context)
+        return _BINARY_OPS[node.operator](left, right)
+    if isinstance(node, UnaryOperator):
+        return _UNARY_OPS[node.operator](_eval_node(node.operand, context))
+    if not isinstance(node, Expression):
+        return node  # bare parameter value
+    raise ValueError(
+        f"Unsupported expression type: {type(node).__name__}"
+    )
+
+
+def iter_batches(columns: Dict[str, np.ndarray],
+                 batch_size: int = DEFAULT_BATCH_SIZE):
+    """Slice a column set into contiguous row batches.
+
+    Args:
+        columns: Full column arrays, all of equal length.
+        batch_size: Rows per batch.
+
+    Yields:
+        Dict[str, np.ndarray]: Zero-copy views over one row group.
+    """
+    if not columns:
+        return
+    total = len(next(iter(columns.values())))
+    for start in range(0, total, batch_size):
+        end = start + batch_size
+        yield {name: arr[start:end] for name, arr in columns.items()}
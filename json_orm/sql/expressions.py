@@ -9,6 +9,14 @@ import re
 from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Any, List, Optional, Union
+from weakref import WeakValueDictionary
+
+# Pools of interned expression nodes. Repeated queries re-use the same
+# Literal/Column objects for identical constants and column references,
+# cutting allocations and letting caches key on object identity. Weak
+# values keep the pools from pinning nodes alive past their last user.
+_LITERAL_POOL: 'WeakValueDictionary' = WeakValueDictionary()
+_COLUMN_POOL: 'WeakValueDictionary' = WeakValueDictionary()
 
 
 class ExpressionType(Enum):
@@ -91,7 +99,7 @@ class Expression:
         return BinaryOperator(self, "<=", other)
 
 
-@dataclass
+@dataclass(eq=False)
 class Column(Expression, ExpressionMixin):
     """Represents a column in a SQL statement.
     
@@ -102,7 +110,33 @@ class Column(Expression, ExpressionMixin):
     alias: Optional[str] = None
 
     def __init__(self, name: str, table: Optional['Table'] = None, alias: Optional[str] = None):
-        pass
+        super().__init__(ExpressionType.COLUMN)
+        self.name = name
+        self.table = table
+        self.alias = alias
+
+    @classmethod
+    def intern(cls, name: str, table: Optional['Table'] = None,
+               alias: Optional[str] = None) -> 'Column':
+        """Get a pooled Column, creating it on first use.
+
+        Identical column references across parses share one object, so
+        structural fingerprints can hash them by identity.
+
+        Args:
+            name: The column name.
+            table: Optional table the column belongs to.
+            alias: Optional alias for the column.
+
+        Returns:
+            Column: The interned column instance.
+        """
+        key = (name, table.name if table is not None else None, alias)
+        column = _COLUMN_POOL.get(key)
+        if column is None:
+            column = cls(name, table, alias)
+            _COLUMN_POOL[key] = column
+        return column
 
 
 @dataclass
@@ -114,10 +148,12 @@ class Table(ExpressionMixin):
     name: str
     alias: Optional[str] = None
 
-    def __init__(self, name: str, alias: Optional[str] = None): pass
+    def __init__(self, name: str, alias: Optional[str] = None):
+        self.name = name
+        self.alias = alias
 
 
-@dataclass
+@dataclass(eq=False)
 class Literal(Expression, ExpressionMixin):
     """Represents a literal value in a SQL statement.
     
@@ -126,10 +162,35 @@ class Literal(Expression, ExpressionMixin):
     value: Any
 
     def __init__(self, value: Any):
-        pass
+        super().__init__(ExpressionType.LITERAL)
+        self.value = value
 
+    @classmethod
+    def intern(cls, value: Any) -> 'Literal':
+        """Get a pooled Literal, creating it on first use.
 
-@dataclass
+        Repeated constants (status codes, small ints, flag strings)
+        share one node instead of allocating a duplicate per parse.
+        Unhashable values fall back to a fresh instance.
+
+        Args:
+            value: The literal value.
+
+        Returns:
+            Literal: The interned (or fresh, if unhashable) literal.
+        """
+        try:
+            key = (type(value), value)
+            literal = _LITERAL_POOL.get(key)
+        except TypeError:
+            return cls(value)
+        if literal is None:
+            literal = cls(value)
+            _LITERAL_POOL[key] = literal
+        return literal
+
+
+@dataclass(eq=False)
 class Function(Expression, ExpressionMixin):
     """Represents a function call in a SQL statement.
     
@@ -139,10 +200,12 @@ class Function(Expression, ExpressionMixin):
     arguments: List[Expression]
 
     def __init__(self, name: str, *args: Expression):
-        pass
+        super().__init__(ExpressionType.FUNCTION)
+        self.name = name
+        self.arguments = list(args)
 
 
-@dataclass
+@dataclass(eq=False)
 class BinaryOperator(Expression):
     """Represents a binary operator in a SQL statement.
     
@@ -158,10 +221,10 @@ class BinaryOperator(Expression):
             raise ValueError(f"Invalid operator: {operator}")
         self.left = left
         self.operator = operator
-        self.right = right if isinstance(right, Expression) else Literal(right)
+        self.right = right if isinstance(right, Expression) else Literal.intern(right)
 
 
-@dataclass
+@dataclass(eq=False)
 class UnaryOperator(Expression):
     """Represents a unary operator in a SQL statement.
     
@@ -0,0 +1,186 @@
+"""JIT compilation of hot clause programs.
+
+This module promotes frequently executed clause programs from the
+opcode interpreter to compiled form. Compilation is driven by an
+execution-count threshold so one-shot queries never pay the compile
+cost; only statements whose structural fingerprint keeps recurring are
+promoted.
+
+Two tiers exist:
+
+* Straight-lining: the opcode list is specialized into a single Python
+  function with no interpreter loop or dispatch — each step becomes one
+  line of generated code with its operand bound as a local.
+* LLVM lowering (optional, requires ``llvmlite``): the OP_ALL
+  aggregation tree is lowered to native code via MCJIT. Leaf
+  ``validate`` callbacks still run in Python (they are arbitrary Python
+  methods), but combining their results happens in straight-line native
+  code, which pays off on deep composite trees.
+
+Example:
+    ```python
+    program = statement.compile()
+    fast = maybe_compile(statement.fingerprint(), program)
+    result = fast() if fast is not None else run_clause_program(program)
+    ```
+"""
+
+import ctypes
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .clause.base import ClauseEvalStep, OP_ALL, OP_VALIDATE
+
+try:
+    from llvmlite import binding as llvm_binding
+    from llvmlite import ir as llvm_ir
+    HAS_LLVM = True
+except ImportError:
+    HAS_LLVM = False
+
+# Executions of one fingerprint before its program is compiled
+# (jit_above_cost-style threshold).
+JIT_THRESHOLD = 50
+
+_exec_counts: Dict[Tuple, int] = {}
+_compiled: Dict[Tuple, Callable[[], bool]] = {}
+
+_llvm_initialized = False
+# MCJIT engines must outlive their function pointers.
+_llvm_engines: List = []
+
+
+def maybe_compile(fingerprint: Tuple,
+                  steps: List[ClauseEvalStep]) -> Optional[Callable[[], bool]]:
+    """Get a compiled program for a fingerprint, if it is hot enough.
+
+    Bumps the fingerprint's execution count; once it crosses
+    ``JIT_THRESHOLD`` the program is compiled and cached. Below the
+    threshold (or for empty programs) the caller should fall back to
+    the interpreter.
+
+    Args:
+        fingerprint: Structural fingerprint of the owning statement.
+        steps: The flattened opcode program to compile.
+
+    Returns:
+        Optional[Callable[[], bool]]: A zero-argument compiled
+        evaluator, or None while the program is still cold.
+    """
+    compiled = _compiled.get(fingerprint)
+    if compiled is not None:
+        return compiled
+    count = _exec_counts.get(fingerprint, 0) + 1
+    _exec_counts[fingerprint] = count
+    if count < JIT_THRESHOLD or not steps:
+        return None
+    compiled = _compile(steps)
+    _compiled[fingerprint] = compiled
+    return compiled
+
+
+def invalidate(fingerprint: Tuple) -> None:
+    """Drop compiled state for a fingerprint.
+
+    Args:
+        fingerprint: The fingerprint whose program changed.
+    """
+    _exec_counts.pop(fingerprint, None)
+    _compiled.pop(fingerprint, None)
+
+
+def _compile(steps: List[ClauseEvalStep]) -> Callable[[], bool]:
+    """Compile a program, preferring native aggregation when available."""
+    if HAS_LLVM:
+        try:
+            return _compile_llvm(steps)
+        except Exception:
+            # Native lowering is best-effort; straight-lining is always
+            # a correct fallback.
+            pass
+    return _straight_line(steps)
+
+
+def _straight_line(steps: List[ClauseEvalStep]) -> Callable[[], bool]:
+    """Specialize the opcode list into one loop-free Python function.
+
+    Each step becomes a single generated line with its operand bound as
+    a function default, removing the interpreter loop, the dispatch
+    table lookup and the per-step attribute reads.
+    """
+    lines = []
+    operands = {}
+    for i, step in enumerate(steps):
+        name = f"_op{i}"
+        operands[name] = step.operand
+        if step.opcode == OP_VALIDATE:
+            lines.append(f"    r{step.resvalue_idx} = {name}()")
+        else:  # OP_ALL
+            expr = " and ".join(f"r{slot}" for slot in step.operand) or "True"
+            lines.append(f"    r{step.resvalue_idx} = {expr}")
+    src = "def _compiled({}):\n{}\n    return r{}".format(
+        ", ".join(f"{n}={n}" for n in operands),
+        "\n".join(lines),
+        steps[-1].resvalue_idx,
+    )
+    namespace: Dict = dict(operands)
+    exec(src, namespace)  # noqa: S102 - generated from our own opcodes
+    return namespace["_compiled"]
+
+
+def _compile_llvm(steps: List[ClauseEvalStep]) -> Callable[[], bool]:
+    """Lower the OP_ALL aggregation tree to native code via MCJIT.
+
+    The generated function takes an ``i8*`` array of leaf results and
+    returns the combined result; Python fills the array by calling the
+    leaf ``validate`` callbacks, then one native call aggregates.
+    """
+    global _llvm_initialized
+    if not _llvm_initialized:
+        llvm_binding.initialize()
+        llvm_binding.initialize_native_target()
+        llvm_binding.initialize_native_asmprinter()
+        _llvm_initialized = True
+
+    i8 = llvm_ir.IntType(8)
+    module = llvm_ir.Module(name="clause_program")
+    fnty = llvm_ir.FunctionType(i8, [i8.as_pointer()])
+    func = llvm_ir.Function(module, fnty, name="run_program")
+    builder = llvm_ir.IRBuilder(func.append_basic_block(name="entry"))
+    leaves = func.args[0]
+
+    slots: Dict[int, llvm_ir.Value] = {}
+    leaf_indices: List[int] = []
+    for step in steps:
+        if step.opcode == OP_VALIDATE:
+            idx = len(leaf_indices)
+            leaf_indices.append(step.resvalue_idx)
+            ptr = builder.gep(leaves, [llvm_ir.Constant(i8, idx)])
+            slots[step.resvalue_idx] = builder.load(ptr)
+        else:  # OP_ALL
+            value = llvm_ir.Constant(i8, 1)
+            for child in step.operand:
+                value = builder.and_(value, slots[child])
+            slots[step.resvalue_idx] = value
+    builder.ret(slots[steps[-1].resvalue_idx])
+
+    target = llvm_binding.Target.from_default_triple().create_target_machine()
+    backing = llvm_binding.parse_assembly(str(module))
+    backing.verify()
+    engine = llvm_binding.create_mcjit_compiler(backing, target)
+    engine.finalize_object()
+    _llvm_engines.append(engine)
+    native = ctypes.CFUNCTYPE(ctypes.c_uint8, ctypes.POINTER(ctypes.c_uint8))(
+        engine.get_function_address("run_program")
+    )
+
+    validators = tuple(steps[slot_pos].operand
+                       for slot_pos in range(len(steps))
+                       if steps[slot_pos].opcode == OP_VALIDATE)
+    buffer = (ctypes.c_uint8 * max(len(validators), 1))()
+
+    def _run() -> bool:
+        for i, validate in enumerate(validators):
+            buffer[i] = 1 if validate() else 0
+        return bool(native(buffer))
+
+    return _run
@@ -22,11 +22,17 @@ Example:
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
-from uuid import uuid4
+from itertools import count
+from typing import Any, Dict, List, Optional
 
+import numpy as np
 
-@dataclass
+# Monotonic source of parameter names. ``next()`` on a count iterator is
+# atomic under the GIL, so concurrent binders never collide.
+_param_counter = count()
+
+
+@dataclass(slots=True)
 class Parameter:
     """Represents a query parameter.
     
@@ -54,17 +60,18 @@ class Parameter:
     @classmethod
     def create(cls, value: Any, type_hint: Optional[type] = None) -> 'Parameter':
         """Create a new parameter with a unique name.
-        
-        This factory method generates a unique parameter name using UUID
-        and creates a new Parameter instance.
-        
+
+        This factory method draws the name from a process-wide monotonic
+        counter, which is collision-free and far cheaper than UUID
+        generation (no entropy syscall) in bulk-binding loops.
+
         Args:
             value: The parameter value.
             type_hint: Optional type hint for the value.
-            
+
         Returns:
             Parameter: A new parameter with unique name.
-            
+
         Example:
             ```python
             # Create parameter with automatic name
@@ -73,7 +80,7 @@ class Parameter:
             ```
         """
         return cls(
-            name=f"p_{uuid4().hex[:8]}",
+            name=f"p_{next(_param_counter):x}",
             value=value,
             type=type_hint or type(value)
         )
@@ -82,43 +89,56 @@ class Parameter:
 @dataclass
 class ParameterStore:
     """Stores and manages query parameters.
-    
+
     This class provides a central store for query parameters,
-    managing their lifecycle and access. It ensures parameter
-    uniqueness and proper typing.
-    
+    managing their lifecycle and access. Parameters are stored in a
+    structure-of-arrays layout — parallel name/value/type lists plus a
+    name-to-index map — so bulk iteration for batched binding walks
+    contiguous lists instead of chasing per-parameter objects.
+
     Attributes:
-        parameters: Dictionary mapping parameter names to Parameter objects.
-        
+        _names: Parameter names, in insertion order.
+        _values: Parameter values, parallel to ``_names``.
+        _types: Parameter types, parallel to ``_names``.
+        _index: Name-to-position map for O(1) lookup.
+
     Example:
         ```python
         # Create store and add parameters
         store = ParameterStore()
         age_param = store.add(18, int)
         name_param = store.add("John")
-        
+
         # Access parameters
         param = store.get(age_param.name)
         assert param.value == 18
-        
+
         # Clear store
         store.clear()
         ```
     """
-    parameters: Dict[str, Parameter] = field(default_factory=dict)
+    _names: List[str] = field(default_factory=list)
+    _values: List[Any] = field(default_factory=list)
+    _types: List[type] = field(default_factory=list)
+    _index: Dict[str, int] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        """Get the number of stored parameters."""
+        return len(self._names)
 
     def add(self, value: Any, type_hint: Optional[type] = None) -> Parameter:
         """Add a new parameter and return its reference.
-        
-        Creates a new parameter with a unique name and stores it.
-        
+
+        Appends to the three parallel arrays in a single pass and
+        returns a lightweight ``Parameter`` view of the new entry.
+
         Args:
             value: The parameter value.
             type_hint: Optional type hint for the value.
-            
+
         Returns:
-            Parameter: The newly created parameter.
-            
+            Parameter: A view of the newly added parameter.
+
         Example:
             ```python
             store = ParameterStore()
@@ -127,22 +147,25 @@ class ParameterStore:
             assert param.type == int
             ```
         """
-        param = Parameter.create(value, type_hint)
-        self.parameters[param.name] = param
-        return param
+        name = f"p_{next(_param_counter):x}"
+        self._index[name] = len(self._names)
+        self._names.append(name)
+        self._values.append(value)
+        self._types.append(type_hint or type(value))
+        return Parameter(name, value, self._types[-1])
 
     def get(self, name: str) -> Parameter:
         """Get a parameter by name.
-        
+
         Args:
             name: Name of the parameter to retrieve.
-            
+
         Returns:
-            Parameter: The parameter with the given name.
-            
+            Parameter: A view of the parameter with the given name.
+
         Raises:
             KeyError: If no parameter exists with the given name.
-            
+
         Example:
             ```python
             store = ParameterStore()
@@ -151,21 +174,40 @@ class ParameterStore:
             assert same_param.value == 18
             ```
         """
-        return self.parameters[name]
+        i = self._index[name]
+        return Parameter(self._names[i], self._values[i], self._types[i])
+
+    def values_as_array(self, dtype: Any = None) -> np.ndarray:
+        """Get all parameter values as a contiguous NumPy array.
+
+        For numeric parameter sweeps this gives downstream binders a
+        single contiguous buffer to consume column-wise instead of
+        iterating Python objects.
+
+        Args:
+            dtype: Optional NumPy dtype for the array.
+
+        Returns:
+            np.ndarray: The parameter values, in insertion order.
+        """
+        return np.asarray(self._values, dtype=dtype)
 
     def clear(self) -> None:
         """Clear all parameters.
-        
+
         Removes all parameters from the store. Useful when reusing
         the store for a new query.
-        
+
         Example:
             ```python
             store = ParameterStore()
             store.add(18)
             store.add("test")
             store.clear()
-            assert len(store.parameters) == 0
+            assert len(store) == 0
             ```
         """
-        self.parameters.clear()
+        self._names.clear()
+        self._values.clear()
+        self._types.clear()
+        self._index.clear()
@@ -0,0 +1,182 @@
+"""Compiled row predicates with type-specialized comparison opcodes.
+
+This module compiles ``BinaryOperator`` expression trees into flat
+opcode programs evaluated against a row mapping. The overwhelmingly
+common predicate shape — ``column OP literal`` with an int or str
+literal — gets a dedicated opcode per (operator, type) pair whose
+handler is a single typed comparison: no isinstance checks, no type
+coercion, no general-case dispatch. Everything else falls back to
+``OP_CMP_GENERIC``.
+
+Example:
+    ```python
+    program = compile_predicate(User.age > 18)
+    for row in rows:
+        if run_predicate(program, row):
+            ...
+    ```
+"""
+
+from typing import Any, Callable, Dict, List, Tuple
+
+from .expressions import BinaryOperator, Column, Literal, UnaryOperator
+
+# Specialized opcodes, one per (comparison, literal type) pair. The
+# operand is (column_name, literal_value); the handler body is a single
+# typed comparison.
+OP_CMP_INT_EQ = 0
+OP_CMP_INT_NE = 1
+OP_CMP_INT_LT = 2
+OP_CMP_INT_LE = 3
+OP_CMP_INT_GT = 4
+OP_CMP_INT_GE = 5
+OP_CMP_STR_EQ = 6
+OP_CMP_STR_NE = 7
+# Boolean combinators over previously computed slots.
+OP_AND = 8
+OP_OR = 9
+OP_NOT = 10
+# General case: operand is a prebuilt closure taking the row.
+OP_CMP_GENERIC = 11
+
+_INT_OPS = {'=': OP_CMP_INT_EQ, '!=': OP_CMP_INT_NE, '<': OP_CMP_INT_LT,
+            '<=': OP_CMP_INT_LE, '>': OP_CMP_INT_GT, '>=': OP_CMP_INT_GE}
+_STR_OPS = {'=': OP_CMP_STR_EQ, '!=': OP_CMP_STR_NE}
+
+
+class PredStep:
+    """One step of a compiled row-predicate program.
+
+    Attributes:
+        opcode: Index into the handler dispatch table.
+        operand: Opcode-specific payload.
+        resvalue_idx: Result slot this step writes.
+    """
+
+    __slots__ = ('opcode', 'operand', 'resvalue_idx')
+
+    def __init__(self, opcode: int, operand: Any, resvalue_idx: int):
+        self.opcode = opcode
+        self.operand = operand
+        self.resvalue_idx = resvalue_idx
+
+
+def compile_predicate(expression: Any) -> List[PredStep]:
+    """Compile an expression tree into a flat predicate program.
+
+    Args:
+        expression: A ``BinaryOperator``/``UnaryOperator`` tree, as
+            produced by the column operator overloads.
+
+    Returns:
+        List[PredStep]: Steps in evaluation order; the final step
+        writes the overall result.
+    """
+    steps: List[PredStep] = []
+    _flatten(expression, steps)
+    return steps
+
+
+def _flatten(node: Any, steps: List[PredStep]) -> int:
+    """Emit steps for one node, returning its result slot."""
+    if isinstance(node, BinaryOperator):
+        if node.operator in ('AND', 'OR'):
+            left = _flatten(node.left, steps)
+            right = _flatten(node.right, steps)
+            slot = len(steps)
+            opcode = OP_AND if node.operator == 'AND' else OP_OR
+            steps.append(PredStep(opcode, (left, right), slot))
+            return slot
+        specialized = _specialize(node)
+        slot = len(steps)
+        if specialized is not None:
+            steps.append(PredStep(specialized[0], specialized[1], slot))
+        else:
+            steps.append(PredStep(OP_CMP_GENERIC, _generic(node), slot))
+        return slot
+    if isinstance(node, UnaryOperator) and node.operator == 'NOT':
+        child = _flatten(node.operand, steps)
+        slot = len(steps)
+        steps.append(PredStep(OP_NOT, child, slot))
+        return slot
+    slot = len(steps)
+    steps.append(PredStep(OP_CMP_GENERIC, _generic(node), slot))
+    return slot
+
+
+def _specialize(node: BinaryOperator) -> 'Tuple[int, Tuple[str, Any]]':
+    """Pick a typed opcode for ``column OP literal``, if one applies."""
+    if not (isinstance(node.left, Column) and isinstance(node.right, Literal)):
+        return None
+    value = node.right.value
+    # bool is an int subclass; keep it on the generic path so True
+    # doesn't silently compare as 1 against int columns.
+    if type(value) is int:
+        opcode = _INT_OPS.get(node.operator)
+    elif type(value) is str:
+        opcode = _STR_OPS.get(node.operator)
+    else:
+        opcode = None
+    if opcode is None:
+        return None
+    return opcode, (node.left.name, value)
+
+
+def _generic(node: Any) -> Callable[[Dict[str, Any]], bool]:
+    """Build the general-case closure for an arbitrary comparison."""
+    from .context import _BINARY_OPS
+
+    if isinstance(node, BinaryOperator):
+        op = _BINARY_OPS[node.operator]
+        left, right = node.left, node.right
+
+        def _eval(row: Dict[str, Any]) -> bool:
+            lhs = row[left.name] if isinstance(left, Column) else \
+                (left.value if isinstance(left, Literal) else left)
+            rhs = row[right.name] if isinstance(right, Column) else \
+                (right.value if isinstance(right, Literal) else right)
+            return bool(op(lhs, rhs))
+
+        return _eval
+    return lambda row: bool(node)
+
+
+# One handler per opcode; specialized bodies are a single typed
+# comparison against the row.
+def _h_int_eq(s, row, res): res[s.resvalue_idx] = row[s.operand[0]] == s.operand[1]
+def _h_int_ne(s, row, res): res[s.resvalue_idx] = row[s.operand[0]] != s.operand[1]
+def _h_int_lt(s, row, res): res[s.resvalue_idx] = row[s.operand[0]] < s.operand[1]
+def _h_int_le(s, row, res): res[s.resvalue_idx] = row[s.operand[0]] <= s.operand[1]
+def _h_int_gt(s, row, res): res[s.resvalue_idx] = row[s.operand[0]] > s.operand[1]
+def _h_int_ge(s, row, res): res[s.resvalue_idx] = row[s.operand[0]] >= s.operand[1]
+def _h_str_eq(s, row, res): res[s.resvalue_idx] = row[s.operand[0]] == s.operand[1]
+def _h_str_ne(s, row, res): res[s.resvalue_idx] = row[s.operand[0]] != s.operand[1]
+def _h_and(s, row, res): res[s.resvalue_idx] = res[s.operand[0]] and res[s.operand[1]]
+def _h_or(s, row, res): res[s.resvalue_idx] = res[s.operand[0]] or res[s.operand[1]]
+def _h_not(s, row, res): res[s.resvalue_idx] = not res[s.operand]
+def _h_generic(s, row, res): res[s.resvalue_idx] = s.operand(row)
+
+
+PRED_HANDLERS: Tuple[Callable, ...] = (
+    _h_int_eq, _h_int_ne, _h_int_lt, _h_int_le, _h_int_gt, _h_int_ge,
+    _h_str_eq, _h_str_ne, _h_and, _h_or, _h_not, _h_generic,
+)
+
+
+def run_predicate(steps: List[PredStep], row: Dict[str, Any]) -> bool:
+    """Run a compiled predicate program against one row.
+
+    Args:
+        steps: Program from :func:`compile_predicate`.
+        row: Row mapping column names to values.
+
+    Returns:
+        bool: Whether the row satisfies the predicate.
+    """
+    if not steps:
+        return True
+    results = [False] * len(steps)
+    handlers = PRED_HANDLERS
+    for step in steps:
+        handlers[step.opcode](step, row, results)
+    return results[-1]
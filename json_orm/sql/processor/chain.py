@@ -1,9 +1,11 @@
 """SQL clause processing chain implementation.
 
-This module implements the Chain of Responsibility pattern for processing
-SQL clauses through multiple steps such as validation, optimization,
-and execution. It provides a flexible way to add and configure processing
-steps.
+This module implements clause processing through multiple steps such as
+validation, optimization, and execution. Instead of the classic Chain of
+Responsibility — where each handler re-walks the clause tree before
+passing it on — the configured steps are fused into a single pass: the
+tree is flattened once and every hook runs on each node inline, so a
+chain of three steps costs one traversal, not three.
 
 Example:
     ```python
@@ -13,33 +15,68 @@ Example:
              .add_optimizer()
              .add_executor()
              .build())
-    
+
     # Process clauses
     chain.process(where_clause)
     chain.process(join_clause)
     ```
 """
 
+from typing import Any, Callable, List, Tuple
+
+from ..clause.base import Clause, ClauseComposite, ClauseHandler
+
+# A hook is one fused processing step applied to a single clause node.
+ClauseHook = Callable[[Clause], Any]
+
+
+def _flatten_nodes(clause: Clause) -> List[Clause]:
+    """Flatten a clause tree into a node list, children first.
+
+    Uses an explicit stack so deep trees cost no Python recursion.
+
+    Args:
+        clause: Root of the tree to flatten.
+
+    Returns:
+        List[Clause]: All nodes in post-order.
+    """
+    nodes: List[Clause] = []
+    stack: List[Clause] = [clause]
+    while stack:
+        node = stack.pop()
+        nodes.append(node)
+        if isinstance(node, ClauseComposite):
+            stack.extend(node.iter_children())
+    nodes.reverse()
+    return nodes
+
+
+def _validate_hook(clause: Clause) -> None:
+    """Default validation step: reject structurally invalid clauses."""
+    if not clause.validate():
+        raise ValueError(f"Invalid clause: {type(clause).__name__}")
+
 
 class ClauseProcessingChain:
-    """Chain of responsibility for clause processing.
-    
-    This class implements the Chain of Responsibility pattern for
-    processing SQL clauses. Each handler in the chain can perform
-    a specific operation (validation, optimization, etc.) and pass
-    the clause to the next handler.
-    
+    """Fused processing pipeline for SQL clauses.
+
+    All configured steps run on each node during a single flattened
+    walk of the clause tree, rather than each handler re-traversing
+    the tree in turn. The hook tuple is captured as a local inside the
+    processing loop so per-node dispatch is two fast locals away.
+
     Example:
         ```python
         # Create and use a chain
         chain = ClauseProcessingChain()
         chain.add_handler(ValidationHandler())
         chain.add_handler(OptimizationHandler())
-        
+
         # Process clauses
         chain.process(where_clause)
         chain.process(join_clause)
-        
+
         # Create a specialized chain
         class AnalyticsChain(ClauseProcessingChain):
             def __init__(self):
@@ -50,14 +87,53 @@ class ClauseProcessingChain:
         ```
     """
 
+    __slots__ = ('_hooks',)
+
+    def __init__(self, hooks: Tuple[ClauseHook, ...] = ()):
+        """Initialize the chain.
+
+        Args:
+            hooks: Processing steps to fuse, in execution order.
+        """
+        self._hooks: Tuple[ClauseHook, ...] = tuple(hooks)
+
+    def add_handler(self, handler) -> 'ClauseProcessingChain':
+        """Append a processing step.
+
+        Args:
+            handler: A callable taking a clause, or a ``ClauseHandler``
+                whose ``handle`` method is used as the hook.
+
+        Returns:
+            ClauseProcessingChain: This chain (for chaining).
+        """
+        hook = handler.handle if isinstance(handler, ClauseHandler) else handler
+        self._hooks = self._hooks + (hook,)
+        return self
+
+    def process(self, clause: Clause) -> None:
+        """Process a clause tree in a single fused pass.
+
+        Args:
+            clause: Root of the clause tree to process.
+
+        Raises:
+            ValueError: If a validation step rejects a node.
+        """
+        hooks = self._hooks
+        for node in _flatten_nodes(clause):
+            for hook in hooks:
+                hook(node)
+
 
 class ClauseProcessingBuilder:
     """Builder for clause processing chains.
-    
-    This class implements the Builder pattern for constructing
-    clause processing chains. It provides methods to add various
-    types of handlers and configure their behavior.
-    
+
+    This class implements the Builder pattern for constructing fused
+    processing chains. It provides methods to add the standard steps
+    and configure their behavior; ``build`` closes over the collected
+    hooks so the finished chain carries no builder state.
+
     Example:
         ```python
         # Build a basic chain
@@ -66,14 +142,79 @@ class ClauseProcessingBuilder:
                 .add_optimizer()
                 .add_executor()
                 .build())
-        
+
         # Build a specialized chain
         chain = (ClauseProcessingBuilder()
                 .add_validator(strict=True)
-                .add_statistics_collector()
-                .add_cost_estimator(max_cost=1000)
-                .add_index_optimizer()
-                .add_executor(parallel=True)
+                .add_handler(StatisticsCollector().handle)
+                .add_executor(ParallelExecutor().handle)
                 .build())
         ```
     """
+
+    __slots__ = ('_hooks',)
+
+    def __init__(self):
+        """Initialize an empty builder."""
+        self._hooks: List[ClauseHook] = []
+
+    def add_validator(self, strict: bool = True) -> 'ClauseProcessingBuilder':
+        """Add a validation step.
+
+        Args:
+            strict: If True, invalid nodes raise ``ValueError``;
+                otherwise validation results are simply discarded.
+
+        Returns:
+            ClauseProcessingBuilder: This builder (for chaining).
+        """
+        self._hooks.append(_validate_hook if strict
+                           else lambda clause: clause.validate())
+        return self
+
+    def add_optimizer(self, hook: ClauseHook = None) -> 'ClauseProcessingBuilder':
+        """Add an optimization step.
+
+        Args:
+            hook: Callable applied to each node; defaults to a no-op
+                placeholder subclass chains override.
+
+        Returns:
+            ClauseProcessingBuilder: This builder (for chaining).
+        """
+        self._hooks.append(hook or (lambda clause: clause))
+        return self
+
+    def add_executor(self, hook: ClauseHook = None) -> 'ClauseProcessingBuilder':
+        """Add an execution step.
+
+        Args:
+            hook: Callable applied to each node; defaults to a no-op
+                placeholder subclass chains override.
+
+        Returns:
+            ClauseProcessingBuilder: This builder (for chaining).
+        """
+        self._hooks.append(hook or (lambda clause: clause))
+        return self
+
+    def add_handler(self, hook: ClauseHook) -> 'ClauseProcessingBuilder':
+        """Add an arbitrary processing step.
+
+        Args:
+            hook: Callable applied to each node.
+
+        Returns:
+            ClauseProcessingBuilder: This builder (for chaining).
+        """
+        self._hooks.append(hook)
+        return self
+
+    def build(self) -> ClauseProcessingChain:
+        """Build the fused chain.
+
+        Returns:
+            ClauseProcessingChain: A chain running all added steps in
+            one pass per clause tree.
+        """
+        return ClauseProcessingChain(tuple(self._hooks))
@@ -0,0 +1,115 @@
+"""Asynchronous batched I/O for the executor stage of the chain.
+
+Evaluating a clause program usually needs several JSON shards (one per
+referenced table). Reading them one blocking call at a time serializes
+I/O behind evaluation; this module batches all shard reads up front
+and overlaps them with processing.
+
+The batching runs over a small thread pool: each shard read is one
+blocking call in a worker, so N shards are in flight at once with
+portable primitives. A kernel-side submission backend (io_uring, as in
+the JSD file reader) could slot in behind the same submit/results
+surface, but only the thread pool is implemented.
+
+Example:
+    ```python
+    executor = AsyncExecutorHandler(shard_dir="data/")
+    chain = (ClauseProcessingBuilder()
+             .add_validator()
+             .add_executor(executor.handle)
+             .build())
+    chain.process(where_clause)
+    shards = executor.results()
+    ```
+"""
+
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from ..clause.base import Clause, ClauseHandler
+
+
+def _read_shard(path: str) -> bytes:
+    """Read one shard file in a single call."""
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+class AsyncExecutorHandler(ClauseHandler):
+    """Executor handler that batches shard reads instead of blocking.
+
+    For each processed clause, every referenced table's shard is
+    scheduled immediately; results are collected lazily, so I/O for
+    later shards overlaps evaluation of earlier ones. All pending
+    reads for one clause are submitted in a single batch.
+
+    Attributes:
+        shard_dir: Directory containing per-table shard files.
+    """
+
+    __slots__ = ('shard_dir', '_pool', '_pending')
+
+    def __init__(self, shard_dir: str, max_workers: int = 4):
+        """Initialize the executor.
+
+        Args:
+            shard_dir: Directory containing per-table JSON shards.
+            max_workers: Concurrent in-flight reads.
+        """
+        super().__init__()
+        self.shard_dir = shard_dir
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+        self._pending: Dict[str, Future] = {}
+
+    def handle(self, clause: Clause) -> None:
+        """Schedule shard reads for every table the clause references.
+
+        Args:
+            clause: The clause being executed.
+        """
+        self.submit(self._tables_of(clause))
+
+    def submit(self, tables: List[str]) -> None:
+        """Submit one batched read for a set of tables.
+
+        Args:
+            tables: Table names whose shards should be loaded.
+        """
+        for table in tables:
+            if table in self._pending:
+                continue
+            path = os.path.join(self.shard_dir, f"{table}.json")
+            self._pending[table] = self._pool.submit(_read_shard, path)
+
+    def results(self) -> Dict[str, bytes]:
+        """Collect all completed shard reads, blocking on stragglers.
+
+        Returns:
+            Dict[str, bytes]: Raw shard contents keyed by table name.
+        """
+        collected = {name: future.result()
+                     for name, future in self._pending.items()}
+        self._pending.clear()
+        return collected
+
+    def close(self) -> None:
+        """Shut the worker pool down."""
+        self._pool.shutdown(wait=False)
+
+    @staticmethod
+    def _tables_of(clause: Clause) -> List[str]:
+        """Extract referenced table names from a clause."""
+        tables: List[str] = []
+        table = getattr(clause, 'table', None)
+        if table is not None:
+            tables.append(table if isinstance(table, str) else table.name)
+        for condition in getattr(clause, 'conditions', ()) or ():
+            for side in (getattr(condition, 'left', None),
+                         getattr(condition, 'right', None)):
+                side_table: Optional[object] = getattr(side, 'table', None)
+                if side_table is not None:
+                    tables.append(side_table.name
+                                  if not isinstance(side_table, str)
+                                  else side_table)
+        return tables
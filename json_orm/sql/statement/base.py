@@ -9,7 +9,7 @@ Example:
     # Create a statement visitor
     class StatementValidator(StatementVisitor):
         def visit(self, statement: Statement) -> None:
-            for clause in statement.get_clauses():
+            for clause in statement.iter_clauses():
                 if not clause.validate():
                     raise ValueError("Invalid clause")
     
@@ -21,7 +21,7 @@ Example:
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Generic, TypeVar
+from typing import Generic, Iterator, List, Tuple, TypeVar
 
 from ..clause.base import Clause
 
@@ -45,6 +45,8 @@ class Statement(ABC):
         ```
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def accept(self, visitor: 'StatementVisitor') -> None:
         """Accept a statement visitor.
@@ -54,12 +56,25 @@ class Statement(ABC):
         """
         pass
 
+    def iter_clauses(self) -> Iterator[Clause]:
+        """Iterate over the statement's clauses without copying.
+
+        Prefer this for internal traversal (validators, optimizers,
+        flatteners); it avoids the snapshot allocation of
+        :meth:`get_clauses`. Subclasses typically override this with a
+        generator and derive ``get_clauses`` from it.
+
+        Returns:
+            Iterator[Clause]: An iterator over the clauses.
+        """
+        return iter(self.get_clauses())
+
     @abstractmethod
-    def get_clauses(self) -> List[Clause]:
-        """Get all clauses in this statement.
-        
+    def get_clauses(self) -> Tuple[Clause, ...]:
+        """Get an isolated snapshot of the statement's clauses.
+
         Returns:
-            List[Clause]: List of all clauses in the statement.
+            Tuple[Clause, ...]: All clauses in the statement.
         """
         pass
 
@@ -20,17 +20,63 @@ Example:
     ```
 """
 
-from typing import List, Optional
+from collections import OrderedDict
+from sys import intern
+from typing import Any, Iterator, List, Optional, Tuple
 
 from .base import Statement, StatementBuilder, StatementDirector
+from .. import jit
+from ..clause.base import Clause, ClauseEvalInit, ClauseEvalStep, OP_ALL, \
+    run_clause_program
 from ..clause.groupby import GroupByClause
 from ..clause.having import HavingClause
-from ..clause.join import JoinClause
 from ..clause.limit import LimitClause
 from ..clause.orderby import OrderByClause
 from ..clause.select import SelectClause
 from ..clause.where import WhereClause
 
+# Process-wide LRU of compiled clause programs, keyed by structural
+# fingerprint. Entries record the identities of the clause objects they
+# were compiled from, since program steps bind those instances.
+_PROGRAM_CACHE_SIZE = 1024
+_program_cache: 'OrderedDict[Tuple, Tuple[Tuple[int, ...], List[ClauseEvalStep]]]' \
+    = OrderedDict()
+
+
+def _intern_str(value: Any) -> Any:
+    """Intern string fingerprint components; pass others through."""
+    return intern(value) if isinstance(value, str) else value
+
+
+def _clause_fingerprint(clause: Optional[Clause]) -> Optional[Tuple]:
+    """Fingerprint one clause by structure, not literal values.
+
+    Captures the clause type plus column identities and operator
+    symbols, so parameterized reruns of the same query shape share a
+    cache slot while literal values stay out of the key.
+    """
+    if clause is None:
+        return None
+    fingerprint = getattr(clause, 'fingerprint', None)
+    if fingerprint is not None:
+        return fingerprint()
+    parts: List = [intern(type(clause).__name__)]
+    for attr in ('columns', '_columns', 'conditions', 'condition',
+                 'table', 'join_type', 'directions', 'count', 'offset'):
+        value = getattr(clause, attr, None)
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            parts.append((attr, tuple(
+                (intern(type(v).__name__), _intern_str(getattr(v, 'name', None)),
+                 _intern_str(getattr(v, 'operator', None)))
+                for v in value
+            )))
+        else:
+            parts.append((attr, intern(type(value).__name__),
+                          _intern_str(getattr(value, 'name', str(value)))))
+    return tuple(parts)
+
 
 class SelectStatement(Statement):
     """Represents a SELECT statement.
@@ -39,45 +85,201 @@ class SelectStatement(Statement):
     for all standard clauses. It follows the composite pattern, containing
     multiple clause objects that form the complete statement.
     
+    Joins are stored flattened as two parallel arrays — interned table
+    names and compiled condition programs — rather than a list of
+    ``JoinClause`` objects, so planning and execution walk sequential
+    memory instead of chasing per-join nodes.
+
     Attributes:
         _select: The SELECT clause specifying columns to retrieve.
         _where: Optional WHERE clause for filtering.
-        _joins: List of JOIN clauses for table joining.
+        _join_tables: Interned table names of the joins, in order.
+        _join_cond_programs: Compiled condition program per join,
+            parallel to ``_join_tables``.
         _group_by: Optional GROUP BY clause for grouping.
         _having: Optional HAVING clause for group filtering.
         _order_by: Optional ORDER BY clause for sorting.
         _limit: Optional LIMIT clause for result limiting.
-        
+
     Example:
         ```python
         stmt = SelectStatement()
         stmt.select = SelectClause([User.name, User.email])
         stmt.where = WhereClause(User.age > 18)
-        stmt.joins.append(
-            JoinClause(Order, User.id == Order.user_id)
-        )
+        stmt.add_join("orders", User.id == Order.user_id)
         stmt.order_by = OrderByClause([User.name], ["ASC"])
         ```
     """
 
+    __slots__ = ('_select', '_where', '_join_tables', '_join_cond_programs',
+                 '_group_by', '_having', '_order_by', '_limit',
+                 '_cached_fingerprint', '_hash', '_validated')
+
     def __init__(self):
         """Initialize an empty SELECT statement."""
+        object.__setattr__(self, '_cached_fingerprint', None)
+        object.__setattr__(self, '_hash', None)
+        object.__setattr__(self, '_validated', False)
         self._select: Optional[SelectClause] = None
         self._where: Optional[WhereClause] = None
-        self._joins: List[JoinClause] = []
+        self._join_tables: List[str] = []
+        self._join_cond_programs: List[List[ClauseEvalStep]] = []
         self._group_by: Optional[GroupByClause] = None
         self._having: Optional[HavingClause] = None
         self._order_by: Optional[OrderByClause] = None
         self._limit: Optional[LimitClause] = None
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Assign an attribute, invalidating cached fingerprint state.
+
+        Any clause assignment changes the statement's structure, so the
+        memoized fingerprint and hash are dropped and recomputed on
+        next access.
+        """
+        object.__setattr__(self, name, value)
+        if name not in ('_cached_fingerprint', '_hash', '_validated'):
+            object.__setattr__(self, '_cached_fingerprint', None)
+            object.__setattr__(self, '_hash', None)
+            object.__setattr__(self, '_validated', False)
+
+    def __hash__(self) -> int:
+        """Hash by structural fingerprint, cached until mutation."""
+        if self._hash is None:
+            object.__setattr__(self, '_hash', hash(self.fingerprint()))
+        return self._hash
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare statements by structural fingerprint."""
+        if not isinstance(other, SelectStatement):
+            return NotImplemented
+        return self.fingerprint() == other.fingerprint()
+
+    def accept(self, visitor) -> None:
+        """Accept a statement visitor."""
+        visitor.visit(self)
+
+    def add_join(self, table: str, condition: Optional[Clause] = None,
+                 join_type: str = "INNER") -> None:
+        """Add a join, flattened into the parallel join arrays.
+
+        Args:
+            table: Name of the table to join.
+            condition: Optional join condition clause; compiled to its
+                opcode program immediately.
+            join_type: The join type (currently informational).
+        """
+        self._join_tables.append(intern(table))
+        self._join_cond_programs.append(
+            ClauseEvalInit().compile(condition) if condition is not None
+            and isinstance(condition, Clause) else []
+        )
+        # List mutation bypasses __setattr__; invalidate explicitly.
+        object.__setattr__(self, '_cached_fingerprint', None)
+        object.__setattr__(self, '_hash', None)
+        object.__setattr__(self, '_validated', False)
+
+    def iter_clauses(self) -> Iterator[Clause]:
+        """Iterate over the set clauses in evaluation order, no copy.
+
+        Joins are not clause objects anymore; read ``_join_tables`` and
+        ``_join_cond_programs`` for the flattened join metadata.
+        """
+        for clause in (self._select, self._where, self._group_by,
+                       self._having, self._order_by, self._limit):
+            if clause is not None:
+                yield clause
+
+    def get_clauses(self) -> Tuple[Clause, ...]:
+        """Get an isolated snapshot of the set clauses."""
+        return tuple(self.iter_clauses())
+
+    def fingerprint(self) -> Tuple:
+        """Compute the structural fingerprint of this statement.
+
+        Two statements with the same fingerprint have the same clause
+        shape — same clause types, columns and operators — and differ
+        at most in literal values, so they can share a compiled clause
+        program slot in the module-level cache.
+
+        The fingerprint is memoized on the instance and recomputed only
+        after a clause assignment, so plan-cache lookups cost one
+        attribute read instead of an O(tree) walk.
+
+        Returns:
+            Tuple: A hashable fingerprint of the statement structure.
+        """
+        if self._cached_fingerprint is None:
+            parts = tuple(_clause_fingerprint(c)
+                          for c in self.iter_clauses())
+            if self._join_tables:
+                parts += (('joins', tuple(self._join_tables)),)
+            object.__setattr__(self, '_cached_fingerprint', parts)
+        return self._cached_fingerprint
+
+    def compile(self) -> List[ClauseEvalStep]:
+        """Get the compiled clause program for this statement.
+
+        Programs are looked up in a module-level LRU keyed by the
+        structural fingerprint. Because program steps bind the clause
+        instances they were compiled from, a cache hit is only reused
+        when those instances are the ones this statement still holds;
+        otherwise the program is recompiled in place.
+
+        Returns:
+            List[ClauseEvalStep]: The flattened opcode program.
+        """
+        clauses = tuple(self.iter_clauses())
+        key = self.fingerprint()
+        entry = _program_cache.get(key)
+        if entry is not None:
+            owner_ids, program = entry
+            if owner_ids == tuple(id(c) for c in clauses):
+                _program_cache.move_to_end(key)
+                return program
+        init = ClauseEvalInit()
+        steps: List[ClauseEvalStep] = []
+        slots = tuple(init._flatten(clause, steps) for clause in clauses)
+        steps.append(ClauseEvalStep(OP_ALL, slots, len(steps)))
+        _program_cache[key] = (tuple(id(c) for c in clauses), steps)
+        if len(_program_cache) > _PROGRAM_CACHE_SIZE:
+            _program_cache.popitem(last=False)
+        return steps
+
+    def validate(self) -> bool:
+        """Validate the statement by running its clause program.
+
+        Structural validation runs once: statements finalized by
+        ``SelectStatementBuilder.get_result`` (or previously validated
+        and unmutated since) short-circuit to True, so warm prepared
+        statements pay a single flag read per execute. Hot statements —
+        fingerprints executed past the JIT threshold — run a compiled
+        program instead of the interpreter. Join condition programs run
+        as a linear sweep over the flattened join arrays.
+        """
+        if self._validated:
+            return True
+        program = self.compile()
+        compiled = jit.maybe_compile(self.fingerprint(), program)
+        result = compiled() if compiled is not None \
+            else run_clause_program(program)
+        if not result:
+            return False
+        for cond_program in self._join_cond_programs:
+            if cond_program and not run_clause_program(cond_program):
+                return False
+        object.__setattr__(self, '_validated', True)
+        return True
+
 
 class SelectStatementBuilder(StatementBuilder['SelectStatement']):
     """Builder for SELECT statements.
-    
+
     This class implements the Builder pattern for constructing SELECT
-    statements. It provides methods for adding each type of clause
-    and ensures proper statement construction.
-    
+    statements. It provides methods for adding each type of clause and
+    validates the finished statement's structure once at
+    ``get_result``, so per-execute validation on the built statement
+    is a flag check rather than a tree walk.
+
     Example:
         ```python
         builder = SelectStatementBuilder()
@@ -88,6 +290,135 @@ class SelectStatementBuilder(StatementBuilder['SelectStatement']):
         ```
     """
 
+    __slots__ = ('_statement',)
+
+    def __init__(self):
+        """Initialize the builder with a fresh statement."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset the builder to initial state."""
+        self._statement = SelectStatement()
+
+    def add_select(self, columns) -> 'SelectStatementBuilder':
+        """Set the SELECT clause.
+
+        Args:
+            columns: Columns or expressions to select.
+
+        Returns:
+            SelectStatementBuilder: This builder (for chaining).
+        """
+        clause = SelectClause()
+        for column in columns:
+            clause.add_column(column)
+        self._statement._select = clause
+        return self
+
+    def add_where(self, *conditions) -> 'SelectStatementBuilder':
+        """Set the WHERE clause.
+
+        Args:
+            *conditions: Filter conditions.
+
+        Returns:
+            SelectStatementBuilder: This builder (for chaining).
+        """
+        clause = WhereClause()
+        for condition in conditions:
+            clause.add_condition(condition)
+        self._statement._where = clause
+        return self
+
+    def add_join(self, table: str, condition=None,
+                 join_type: str = "INNER") -> 'SelectStatementBuilder':
+        """Add a JOIN.
+
+        Args:
+            table: Name of the table to join.
+            condition: Optional join condition.
+            join_type: The join type.
+
+        Returns:
+            SelectStatementBuilder: This builder (for chaining).
+        """
+        self._statement.add_join(table, condition, join_type)
+        return self
+
+    def add_group_by(self, columns) -> 'SelectStatementBuilder':
+        """Set the GROUP BY clause.
+
+        Args:
+            columns: Columns to group by.
+
+        Returns:
+            SelectStatementBuilder: This builder (for chaining).
+        """
+        self._statement._group_by = GroupByClause(list(columns))
+        return self
+
+    def add_having(self, condition) -> 'SelectStatementBuilder':
+        """Set the HAVING clause.
+
+        Args:
+            condition: Group filter condition.
+
+        Returns:
+            SelectStatementBuilder: This builder (for chaining).
+        """
+        self._statement._having = HavingClause(condition)
+        return self
+
+    def add_order_by(self, columns,
+                     directions=None) -> 'SelectStatementBuilder':
+        """Set the ORDER BY clause.
+
+        Args:
+            columns: Columns to order by.
+            directions: Sort directions, one per column.
+
+        Returns:
+            SelectStatementBuilder: This builder (for chaining).
+        """
+        self._statement._order_by = OrderByClause(list(columns), directions)
+        return self
+
+    def add_limit(self, count: int,
+                  offset: Optional[int] = None) -> 'SelectStatementBuilder':
+        """Set the LIMIT clause.
+
+        Args:
+            count: Maximum number of rows.
+            offset: Rows to skip.
+
+        Returns:
+            SelectStatementBuilder: This builder (for chaining).
+        """
+        self._statement._limit = LimitClause(count, offset)
+        return self
+
+    def get_result(self) -> SelectStatement:
+        """Finalize and return the built statement.
+
+        Structural validation happens here, once — immutable
+        properties (required clauses present, operator symbols known,
+        ordering columns matched to directions) cannot change after
+        finalize, so the statement is marked validated and executes
+        skip the per-run tree walk. Runtime checks against the
+        evaluation context stay in the execution path.
+
+        Returns:
+            SelectStatement: The validated statement.
+
+        Raises:
+            ValueError: If the statement structure is invalid.
+        """
+        statement = self._statement
+        self.reset()
+        if not statement.validate():
+            raise ValueError("Invalid SELECT statement structure")
+        return statement
+
 
 class SelectStatementDirector(StatementDirector):
     """Director for SELECT statement construction.
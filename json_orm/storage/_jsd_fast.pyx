@@ -0,0 +1,80 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Compiled fast path for JSD encoding.
+
+This module accelerates ``JSDFile.write`` by encoding the common
+``{"users": [record, ...]}`` payload shape with C-level dict/list access,
+avoiding Python-level method dispatch in the per-record loop. Payloads
+that do not match the fast shape fall back to orjson directly, so the
+output is always byte-identical JSON.
+
+The pure-Python ``JSDFile`` remains fully functional when this module is
+not compiled; ``json_orm.storage.jsd`` imports it inside a
+``try/except ImportError``.
+"""
+
+from cpython.dict cimport PyDict_GetItem, PyDict_Next
+from cpython.list cimport PyList_GET_ITEM, PyList_GET_SIZE
+from cpython.object cimport PyObject
+
+import orjson
+
+cdef object _DUMPS = orjson.dumps
+# Mirrors jsd._ORJSON_OPTS; OPT_PASSTHROUGH_DATACLASS would suppress
+# dataclass serialization, so it is excluded.
+cdef long _OPTS = (orjson.OPT_SERIALIZE_NUMPY |
+                   orjson.OPT_SERIALIZE_DATACLASS)
+
+
+cdef class CJSDWriter:
+    """Encodes JSD payloads record-by-record with typed locals."""
+
+    cdef bytes _encode_record(self, dict rec):
+        """Encode a single record dict to JSON bytes."""
+        return _DUMPS(rec, option=_OPTS)
+
+    cpdef bytes write(self, object data):
+        """Encode a full payload to JSON bytes.
+
+        Dict payloads whose values are record lists are encoded with a
+        typed per-record loop and joined with C-level buffer writes;
+        anything else is passed straight to orjson.
+        """
+        cdef list parts
+        cdef list records
+        cdef Py_ssize_t i, n
+        cdef object key, value
+        cdef bint first_key = True
+
+        if type(data) is not dict:
+            return _DUMPS(data, option=_OPTS)
+
+        parts = [b"{"]
+        for key, value in (<dict> data).items():
+            if not first_key:
+                parts.append(b",")
+            first_key = False
+            parts.append(_DUMPS(key, option=_OPTS))
+            parts.append(b":")
+            if type(value) is list and PyList_GET_SIZE(<list> value) > 0 \
+                    and type(<object> PyList_GET_ITEM(<list> value, 0)) is dict:
+                records = <list> value
+                n = PyList_GET_SIZE(records)
+                parts.append(b"[")
+                for i in range(n):
+                    if i > 0:
+                        parts.append(b",")
+                    parts.append(self._encode_record(
+                        <dict> <object> PyList_GET_ITEM(records, i)))
+                parts.append(b"]")
+            else:
+                parts.append(_DUMPS(value, option=_OPTS))
+        parts.append(b"}")
+        return b"".join(parts)
+
+
+cdef CJSDWriter _writer = CJSDWriter()
+
+
+def encode(data):
+    """Module-level entry point used by ``JSDFile._encode``."""
+    return _writer.write(data)
@@ -1,110 +1,408 @@
 """JSD (JSON Database) file format implementation."""
 
+import mmap
 import os
+import sys
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from multiprocessing import shared_memory
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
-import numpy as np
 import orjson
 import xxhash
 
+try:
+    # Optional compiled accelerator (built with Cython, see setup.py).
+    from ._jsd_fast import encode as _fast_encode
+except ImportError:
+    _fast_encode = None
+
+try:
+    # Optional io_uring backend for cold loads of large files: batched
+    # kernel reads avoid the page-fault stalls a cold mmap walk takes.
+    # Linux-only and an optional extra; everywhere else reads stay on
+    # the mmap path.
+    import liburing
+    HAS_IO_URING = sys.platform == 'linux'
+except ImportError:
+    HAS_IO_URING = False
+
+try:
+    # Optional decoder with a built-in short-key cache: repeated record
+    # keys come back as the same string object instead of a fresh
+    # allocation per row. orjson stays the encoder either way.
+    import msgspec
+    _msgspec_decode = msgspec.json.Decoder().decode
+    _DECODE_ERRORS: Tuple[type, ...] = (orjson.JSONDecodeError,
+                                        msgspec.DecodeError)
+except ImportError:
+    _msgspec_decode = None
+    _DECODE_ERRORS = (orjson.JSONDecodeError,)
+
+
+def _intern_keys(decoded: Any) -> Any:
+    """Intern record dict keys after an orjson parse.
+
+    orjson allocates a fresh str for every key of every row; a table of
+    N rows with the same schema carries N copies of each key. Interning
+    collapses them to one object per key, shrinking the parse and
+    letting later dict lookups hit the ``is``-comparison fast path.
+    Only the top-level mapping and rows in its list values are walked —
+    that is where the repetition lives in the JSD shape.
+    """
+    if not isinstance(decoded, dict):
+        return decoded
+    interned: Dict[str, Any] = {}
+    for key, value in decoded.items():
+        if isinstance(value, list):
+            value = [{sys.intern(k): v for k, v in row.items()}
+                     if isinstance(row, dict) else row
+                     for row in value]
+        interned[sys.intern(key)] = value
+    return interned
+
+
+def _loads(raw: Union[bytes, memoryview]) -> Any:
+    """Parse JSON bytes, deduplicating repeated keys."""
+    if _msgspec_decode is not None:
+        return _msgspec_decode(raw)
+    return _intern_keys(orjson.loads(raw))
+
+# madvise is not available on every platform (nor every flag on every
+# kernel); resolve the hints once and no-op where unsupported.
+_HAS_MADV_SEQUENTIAL = hasattr(mmap, 'MADV_SEQUENTIAL')
+_HAS_MADV_DONTNEED = hasattr(mmap, 'MADV_DONTNEED')
+
+# Serialization flags, computed once instead of per call.
+# OPT_PASSTHROUGH_DATACLASS is deliberately absent: it suppresses
+# OPT_SERIALIZE_DATACLASS (requiring a default= hook instead), so
+# combining the two silently disabled dataclass serialization.
+_ORJSON_OPTS = (orjson.OPT_SERIALIZE_NUMPY |
+                orjson.OPT_SERIALIZE_DATACLASS)
+
+
+class JSDError(Exception):
+    """Raised when a JSD file cannot be read or decoded."""
+    pass
+
+
+@dataclass
+class JSDHeader:
+    """Metadata describing the last written/read JSD payload.
+
+    Attributes:
+        records: Number of top-level entries in the data.
+        data_size: Size of the encoded payload in bytes.
+        compressed: Whether the payload is zlib-compressed on disk.
+    """
+    records: int
+    data_size: int
+    compressed: bool = False
+
 
 class JSDFile:
     """JSD file format handler."""
-    
+
     # Size threshold for using memory mapping
     SHARED_MEM_THRESHOLD = 1024 * 1024  # 1MB
-    
+
     def __init__(self, path: Union[str, Path]):
         """Initialize JSD file."""
         self.path = Path(path)
         self._data: Optional[Dict[str, Any]] = None
         self._shared_mem: Optional[shared_memory.SharedMemory] = None
         self._data_hash: Optional[str] = None
-        self._mmap: Optional[np.memmap] = None
-        
+        self._mmap: Optional[mmap.mmap] = None
+        self._header: Optional[JSDHeader] = None
+        self._stat_key: Optional[Tuple[int, int]] = None
+        self._flush_pool: Optional[ThreadPoolExecutor] = None
+        self._flush_future: Optional[Future] = None
+
+    # Unit of work for streaming hash/copy loops: large enough to keep
+    # per-chunk Python overhead negligible, small enough that a chunk
+    # hashed then written is still resident in L2.
+    HASH_CHUNK = 64 * 1024
+
     def _get_data_hash(self, data: Dict[str, Any]) -> str:
         """Get fast hash of data for cache validation."""
-        return xxhash.xxh64(orjson.dumps(data)).hexdigest()
-    
-    def write(self, data: Dict[str, Any]) -> None:
-        """Write data to JSD file."""
-        # Check if data changed
-        new_hash = self._get_data_hash(data)
-        if new_hash == self._data_hash:
-            return
-            
+        return self._stream_hash(self._encode(data))
+
+    @classmethod
+    def _stream_hash(cls, buf: Union[bytes, memoryview]) -> str:
+        """Hash a buffer incrementally in fixed-size chunks.
+
+        Equivalent to one-shot ``xxh64(buf)`` but touches the buffer a
+        cache-friendly window at a time; write() walks the same windows
+        when copying into the mapping so each chunk is hashed while its
+        pages are still warm.
+        """
+        h = xxhash.xxh64()
+        view = memoryview(buf)
+        for offset in range(0, len(view), cls.HASH_CHUNK):
+            h.update(view[offset:offset + cls.HASH_CHUNK])
+        return h.hexdigest()
+
+    @staticmethod
+    def _encode(data: Dict[str, Any]) -> bytes:
+        """Encode data to JSON bytes, using the compiled fast path if built."""
+        if _fast_encode is not None:
+            return _fast_encode(data)
+        return orjson.dumps(data, option=_ORJSON_OPTS)
+
+    @staticmethod
+    def make_fragment(subtree: Any) -> 'orjson.Fragment':
+        """Pre-serialize a stable subtree for splicing into writes.
+
+        A sub-document that rarely changes between writes can be
+        encoded once and stored back into the data dict as an
+        ``orjson.Fragment``; subsequent writes splice the cached bytes
+        directly instead of re-serializing the subtree.
+
+        Args:
+            subtree: Any serializable value.
+
+        Returns:
+            orjson.Fragment: The pre-serialized bytes wrapper.
+
+        On orjson builds without ``Fragment`` support the subtree is
+        returned unchanged, so callers can apply this unconditionally.
+
+        Example:
+            ```python
+            data["config"] = JSDFile.make_fragment(data["config"])
+            jsd.write(data)  # config bytes are spliced, not re-encoded
+            ```
+        """
+        fragment = getattr(orjson, 'Fragment', None)
+        if fragment is None:
+            return subtree
+        return fragment(orjson.dumps(subtree, option=_ORJSON_OPTS))
+
+    def write(self, data: Dict[str, Any], compress: bool = False) -> int:
+        """Write data to JSD file.
+
+        Args:
+            data: Dictionary to persist.
+            compress: If True, zlib-compress the payload on disk.
+
+        Returns:
+            int: Number of bytes on disk, so callers can track the file
+            size without a stat syscall.
+        """
+        # Serialize once; the hash is computed over the resulting bytes
+        # so unchanged data costs one encode, not two.
+        json_bytes = self._encode(data)
+        new_hash = self._stream_hash(json_bytes)
+        if new_hash == self._data_hash and self._header is not None \
+                and self._header.compressed == compress:
+            return self._header.data_size
+
         # Cache data and hash
         self._data = data
         self._data_hash = new_hash
-        
-        # Convert to bytes
-        json_bytes = orjson.dumps(
-            data,
-            option=orjson.OPT_SERIALIZE_NUMPY | 
-                   orjson.OPT_SERIALIZE_DATACLASS |
-                   orjson.OPT_PASSTHROUGH_DATACLASS
+
+        if compress:
+            json_bytes = zlib.compress(json_bytes)
+
+        self._header = JSDHeader(
+            records=len(data),
+            data_size=len(json_bytes),
+            compressed=compress
         )
-        
-        # For large data, use memory mapping
+
+        # For large data, write through a raw memory mapping; the bytes
+        # go straight into the page cache with no intermediate copy.
         if len(json_bytes) >= self.SHARED_MEM_THRESHOLD:
-            # Create memory mapped array
-            if self._mmap is not None:
-                self._mmap.flush()
-                del self._mmap
-            
-            # Create new memmap with exact size
-            self._mmap = np.memmap(
-                self.path, 
-                dtype='uint8',
-                mode='w+',
-                shape=(len(json_bytes),)
-            )
-            # Write data
-            self._mmap[:] = np.frombuffer(json_bytes, dtype='uint8')
-            self._mmap.flush()
+            self._close_mmap()
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                os.ftruncate(fd, len(json_bytes))
+                mm = mmap.mmap(fd, len(json_bytes))
+            finally:
+                os.close(fd)
+            # Copy in the same windows the hash walked; a full-buffer
+            # slice assignment would dirty the whole mapping at once.
+            src = memoryview(json_bytes)
+            for offset in range(0, len(src), self.HASH_CHUNK):
+                end = min(offset + self.HASH_CHUNK, len(src))
+                mm[offset:end] = src[offset:end]
+            src.release()
+            self._mmap = mm
+            # The flush syscall can block on slow disks; run it on the
+            # background worker so write() returns as soon as the pages
+            # are dirtied. flush() is the synchronous barrier.
+            if self._flush_pool is None:
+                self._flush_pool = ThreadPoolExecutor(max_workers=1)
+            self._flush_future = self._flush_pool.submit(mm.flush)
         else:
             # For small data, write directly
             with open(self.path, 'wb') as f:
                 f.write(json_bytes)
-            if self._mmap is not None:
-                del self._mmap
-                self._mmap = None
-    
+            self._close_mmap()
+        st = os.stat(self.path)
+        self._stat_key = (st.st_mtime_ns, st.st_size)
+        return len(json_bytes)
+
+    def _await_flush(self) -> None:
+        """Wait for an in-flight background flush, if any."""
+        if self._flush_future is not None:
+            self._flush_future.result()
+            self._flush_future = None
+
+    def _close_mmap(self) -> None:
+        """Flush and drop the current write mapping, if any.
+
+        Flushed pages are marked MADV_DONTNEED so the kernel can
+        reclaim the dirty PTEs immediately instead of keeping the whole
+        written range resident.
+        """
+        self._await_flush()
+        if self._mmap is not None:
+            self._mmap.flush()
+            if _HAS_MADV_DONTNEED:
+                self._mmap.madvise(mmap.MADV_DONTNEED)
+            self._mmap.close()
+            self._mmap = None
+
+    # Per-SQE read size for the io_uring path.
+    URING_CHUNK = 1024 * 1024
+
+    def _read_uring(self, size: int) -> Optional[bytearray]:
+        """Read the whole file through one io_uring submission batch.
+
+        All chunk reads are queued as SQEs and submitted with a single
+        syscall; completions are then drained once. Any failure —
+        including an unsupported kernel — returns None so the caller
+        falls back to the mmap path.
+
+        Args:
+            size: File size in bytes (from the stat already taken).
+
+        Returns:
+            Optional[bytearray]: The file contents, or None when the
+            io_uring read could not be performed.
+        """
+        try:
+            buf = bytearray(size)
+            chunks = range(0, size, self.URING_CHUNK)
+            ring = liburing.io_uring()
+            liburing.io_uring_queue_init(max(len(chunks), 1), ring)
+            fd = os.open(self.path, os.O_RDONLY)
+            try:
+                view = memoryview(buf)
+                for offset in chunks:
+                    sqe = liburing.io_uring_get_sqe(ring)
+                    length = min(self.URING_CHUNK, size - offset)
+                    liburing.io_uring_prep_read(
+                        sqe, fd, view[offset:offset + length], length,
+                        offset)
+                liburing.io_uring_submit(ring)
+                cqe = liburing.io_uring_cqe()
+                for _ in chunks:
+                    liburing.io_uring_wait_cqe(ring, cqe)
+                    if cqe.res < 0:
+                        return None
+                    liburing.io_uring_cqe_seen(ring, cqe)
+            finally:
+                os.close(fd)
+                liburing.io_uring_queue_exit(ring)
+            return buf
+        except Exception:
+            # Bindings/kernel mismatch (tmpfs, NFS, old kernels):
+            # degrade silently to the portable path.
+            return None
+
     def read(self) -> Dict[str, Any]:
-        """Read data from JSD file."""
-        # Return cached data if available
-        if self._data is not None:
+        """Read data from JSD file.
+
+        Raises:
+            JSDError: If the file does not contain valid JSD data.
+        """
+        # Warm path: the cached parse is valid as long as the file's
+        # identity (mtime, size) hasn't changed on disk, so unchanged
+        # files skip the parse and hash entirely.
+        st = os.stat(self.path)
+        stat_key = (st.st_mtime_ns, st.st_size)
+        if self._data is not None and stat_key == self._stat_key:
             return self._data
-            
-        file_size = os.path.getsize(self.path)
-        
-        # Use memory mapping for large files
-        if file_size >= self.SHARED_MEM_THRESHOLD:
-            # Create or reuse memory map
-            if self._mmap is None:
-                self._mmap = np.memmap(
-                    self.path,
-                    dtype='uint8',
-                    mode='r',
-                    shape=(file_size,)
-                )
-            # Convert to bytes and parse
-            data = bytes(self._mmap)
-        else:
-            # Read directly for small files
-            with open(self.path, 'rb') as f:
-                data = f.read()
-            if self._mmap is not None:
-                del self._mmap
-                self._mmap = None
-        
-        # Parse and cache
-        self._data = orjson.loads(data)
-        self._data_hash = xxhash.xxh64(data).hexdigest()
+
+        if st.st_size == 0:
+            raise JSDError(f"Invalid JSD file: {self.path} is empty")
+
+        # Cold loads of large files prefer batched io_uring reads over
+        # a page-faulting mmap walk, when the binding is available.
+        if HAS_IO_URING and st.st_size >= self.SHARED_MEM_THRESHOLD:
+            raw = self._read_uring(st.st_size)
+            if raw is not None:
+                self._data = self._decode(raw)
+                self._data_hash = self._stream_hash(raw)
+                self._stat_key = stat_key
+                return self._data
+
+        # Map the file and hand a zero-copy view straight to the parser
+        # and the hasher; no user-space copy of the file bytes is made.
+        fd = os.open(self.path, os.O_RDONLY)
+        try:
+            mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+        if _HAS_MADV_SEQUENTIAL:
+            # The parser and hasher stream the file front to back once;
+            # tell the kernel so it reads ahead and drops pages behind.
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        try:
+            # The parser and the hasher both accept the buffer protocol;
+            # a memoryview over the mapping hands the pages over with no
+            # bytes() materialization of the file contents. (orjson does
+            # not take the mmap object itself, so the view is required.)
+            view = memoryview(mm)
+            try:
+                self._data = self._decode(view)
+                self._data_hash = xxhash.xxh64(view).hexdigest()
+            finally:
+                view.release()
+        finally:
+            if _HAS_MADV_DONTNEED:
+                # Pages are decoded into Python objects now; release
+                # them so RSS stays bounded on files larger than RAM.
+                mm.madvise(mmap.MADV_DONTNEED)
+            mm.close()
+        self._stat_key = stat_key
         return self._data
-    
+
+    def _decode(self, raw: Union[bytes, memoryview]) -> Dict[str, Any]:
+        """Decode raw file bytes, transparently handling compression.
+
+        Raises:
+            JSDError: If the bytes are neither valid JSON nor a
+                compressed JSON payload.
+        """
+        compressed = False
+        try:
+            decoded = _loads(raw)
+        except _DECODE_ERRORS:
+            try:
+                raw = zlib.decompress(raw)
+                decoded = _loads(raw)
+                compressed = True
+            except (zlib.error, *_DECODE_ERRORS) as e:
+                raise JSDError(f"Invalid JSD file: {self.path}") from e
+
+        self._header = JSDHeader(
+            records=len(decoded) if isinstance(decoded, dict) else 1,
+            data_size=len(raw),
+            compressed=compressed
+        )
+        return decoded
+
+    def get_header(self) -> Optional[JSDHeader]:
+        """Get header metadata for the file, reading it if necessary."""
+        if self._header is None and self.exists:
+            self.read()
+        return self._header
+
     def append(self, data: Dict[str, Any]) -> None:
         """Append data to existing JSD file."""
         # Use cached data if available
@@ -113,46 +411,54 @@ class JSDFile:
                 self._data.update(data)
                 self.write(self._data)
                 return
-                
+
         # Otherwise read and update
         try:
             existing = self.read()
         except FileNotFoundError:
             existing = {}
-            
+
         if isinstance(existing, dict):
             existing.update(data)
             self.write(existing)
         else:
             raise ValueError("Existing data is not a dictionary")
-    
+
     def flush(self) -> None:
-        """Flush cached data to disk."""
+        """Flush cached data to disk.
+
+        This is the durability barrier: writes may leave their mmap
+        flush running on the background worker, and this call waits
+        for it before flushing synchronously.
+        """
         if self._data is not None:
             self.write(self._data)
+        self._await_flush()
         if self._mmap is not None:
             self._mmap.flush()
-    
+
     def clear_cache(self) -> None:
         """Clear cached data."""
         self._data = None
         self._data_hash = None
+        self._header = None
+        self._stat_key = None
         if self._shared_mem:
             self._shared_mem.close()
             self._shared_mem.unlink()
             self._shared_mem = None
-        if self._mmap is not None:
-            self._mmap.flush()
-            del self._mmap
-            self._mmap = None
-    
+        self._close_mmap()
+        if self._flush_pool is not None:
+            self._flush_pool.shutdown(wait=True)
+            self._flush_pool = None
+
     @property
     def exists(self) -> bool:
         """Check if the file exists."""
         return self.path.exists()
-    
+
     def __enter__(self):
         return self
-    
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.clear_cache()
@@ -0,0 +1,55 @@
+"""Optional build script for the compiled accelerators.
+
+The package is pure Python by default (built with poetry); this script
+only exists to compile the Cython fast paths for ``JSDFile`` and the
+clause opcode interpreter:
+
+    python setup.py build_ext --inplace
+
+If Cython or a C compiler is unavailable the package works unchanged,
+falling back to the pure-Python encoder.
+
+Profile-guided optimization is a two-phase build driven by the
+``JSON_ORM_PGO`` environment variable:
+
+    JSON_ORM_PGO=generate python setup.py build_ext --inplace
+    python benchmarks/benchmark_storage.py      # emits profile data
+    JSON_ORM_PGO=use python setup.py build_ext --inplace
+"""
+
+import os
+
+from setuptools import setup
+
+PGO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".pgo")
+
+
+def _compile_args():
+    """Optimization flags for the accelerator, including LTO and PGO."""
+    args = ["-O3", "-flto"]
+    pgo = os.environ.get("JSON_ORM_PGO")
+    if pgo == "generate":
+        args.append(f"-fprofile-generate={PGO_DIR}")
+    elif pgo == "use":
+        args.append(f"-fprofile-use={PGO_DIR}")
+    return args
+
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        ["json_orm/storage/_jsd_fast.pyx", "json_orm/sql/_interp.pyx"],
+        language_level=3,
+        compiler_directives={"boundscheck": False, "wraparound": False},
+    )
+    for ext in ext_modules:
+        ext.extra_compile_args = _compile_args()
+        ext.extra_link_args = ["-flto"]
+
+setup(
+    name="json-orm-ext",
+    ext_modules=ext_modules,
+)
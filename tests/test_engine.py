@@ -0,0 +1,89 @@
+"""Tests for the query engine's planner and execution plans."""
+
+from types import SimpleNamespace
+
+from json_orm.engine.execution import TableScanPlan
+from json_orm.engine.planner import QueryPlanner
+from json_orm.model.conditions import eq, gt, ne
+
+
+def test_visit_insert_builds_plan():
+    """visit_insert carries the statement's table, columns and values."""
+    statement = SimpleNamespace(table="users",
+                                columns=["id", "name"],
+                                values=[(1, "a"), (2, "b")])
+    plan = QueryPlanner().visit_insert(statement)
+
+    assert plan.table == "users"
+    assert plan.columns == ("id", "name")
+    assert plan.values == [(1, "a"), (2, "b")]
+
+
+def test_visit_insert_tolerates_bare_statement():
+    """Statements without the optional attributes still plan."""
+    plan = QueryPlanner().visit_insert(SimpleNamespace())
+
+    assert plan.table == ""
+    assert plan.columns == ()
+    assert plan.values == []
+
+
+class _ListStorage:
+    """Minimal row-dict storage exposing the raw-read fast path."""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def read_raw(self, table):
+        return self.rows
+
+    def read(self, table, columns, predicate):  # pragma: no cover
+        raise AssertionError("vectorized path expected")
+
+
+def test_table_scan_cache_sees_mutations():
+    """A reused scan plan must not serve stale column buffers."""
+    storage = _ListStorage([{"id": 1, "age": 30}, {"id": 2, "age": 7}])
+    context = SimpleNamespace(get_storage=lambda: storage)
+    plan = TableScanPlan("users", [], eq("age", 30))
+
+    first = plan.execute(context)
+    assert first.row_count() == 1
+
+    storage.rows.append({"id": 3, "age": 30})
+    second = plan.execute(context)
+    assert second.row_count() == 2
+
+
+def test_table_scan_handles_rows_missing_the_field():
+    """Raw rows lacking the predicate's field never match, crash-free."""
+    storage = _ListStorage([{"id": 1, "age": 30},
+                            {"id": 2},  # no age
+                            {"id": 3, "age": 5}])
+    context = SimpleNamespace(get_storage=lambda: storage)
+
+    result = TableScanPlan("users", [], gt("age", 10)).execute(context)
+    assert result.row_count() == 1
+
+    result = TableScanPlan("users", [], ne("age", 30)).execute(context)
+    assert result.row_count() == 1
+
+
+def test_plan_cache_hits_for_identical_conditions():
+    """Structurally identical queries share one cached plan."""
+    planner = QueryPlanner()
+    first = planner.visit_select(
+        SimpleNamespace(tables=["users"], columns=[],
+                        predicate=gt("age", 18)))
+    second = planner.visit_select(
+        SimpleNamespace(tables=["users"], columns=[],
+                        predicate=gt("age", 18)))
+
+    assert second is first
+    assert len(planner._plan_cache) == 1
+
+    # A different operand must not reuse the pinned predicate.
+    third = planner.visit_select(
+        SimpleNamespace(tables=["users"], columns=[],
+                        predicate=gt("age", 21)))
+    assert third is not first
@@ -0,0 +1,54 @@
+"""Tests for the model layer's query builder and conditions."""
+
+import numpy as np
+import pytest
+
+from json_orm.model.conditions import eq, gt, ne
+from json_orm.model.database import Database
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Create a database backed by a temporary file."""
+    return Database(tmp_path / "test.json")
+
+
+def test_query_with_missing_field_matches_scalar_semantics(db):
+    """Vectorized scans must treat rows missing the field as non-matches."""
+    db.bulk_insert("users", [
+        {"name": "a", "age": 30},
+        {"name": "b"},  # no age
+        {"name": "c", "age": 5},
+    ])
+
+    rows = db.query("users").where(gt("age", 10)).all()
+    assert [r["name"] for r in rows] == ["a"]
+
+    # Negated operators must not match the absent value either.
+    rows = db.query("users").where(ne("age", 30)).all()
+    assert [r["name"] for r in rows] == ["c"]
+
+
+def test_evaluate_batch_masks_none_entries():
+    """Object columns with None entries produce the per-row results."""
+    column = np.array([30, None, 5], dtype=object)
+
+    mask = gt("age", 10).evaluate_batch(column)
+    assert mask.tolist() == [True, False, False]
+
+    mask = ne("age", 30).evaluate_batch(column)
+    assert mask.tolist() == [False, False, True]
+
+    # Values the operator cannot broadcast over force the fallback.
+    mixed = np.array(["x", 5, None], dtype=object)
+    assert gt("age", 10).evaluate_batch(mixed) is None
+    assert eq("age", 5).evaluate_batch(mixed).tolist() == [False, True, False]
+
+
+def test_first_does_not_clamp_later_all(db):
+    """first() must not leave a limit behind on the builder."""
+    db.bulk_insert("users", [{"name": f"u{i}"} for i in range(5)])
+    query = db.query("users")
+
+    assert query.first() is not None
+    assert len(query.all()) == 5
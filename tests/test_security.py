@@ -0,0 +1,65 @@
+"""Tests for the security validator's access control checks."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from json_orm.security.validator import SecurityError, SecurityValidator
+from json_orm.sql.clause.select import SelectClause
+from json_orm.sql.statement.select import SelectStatement
+
+
+def _select_statement(*columns):
+    """Build a SELECT statement projecting the given columns."""
+    clause = SelectClause()
+    for column in columns:
+        clause.add_column(column)
+    statement = SelectStatement()
+    statement._select = clause
+    return statement
+
+
+def test_denied_table_raises():
+    """Selecting columns of a non-granted table fails validation."""
+    validator = SecurityValidator()
+    validator.allow_table("users")
+    statement = _select_statement(
+        SimpleNamespace(name="value", table="secrets"))
+
+    with pytest.raises(SecurityError):
+        validator.validate_statement(statement)
+
+
+def test_denied_column_raises():
+    """Selecting a non-granted column of a restricted table fails."""
+    validator = SecurityValidator()
+    validator.allow_table("users")
+    validator.allow_column("users", "name")
+    statement = _select_statement(
+        SimpleNamespace(name="email", table="users"))
+
+    with pytest.raises(SecurityError):
+        validator.validate_statement(statement)
+
+
+def test_denied_join_table_raises():
+    """Joining a non-granted table fails validation."""
+    validator = SecurityValidator()
+    validator.allow_table("users")
+    statement = _select_statement(
+        SimpleNamespace(name="name", table="users"))
+    statement.add_join("secrets")
+
+    with pytest.raises(SecurityError):
+        validator.validate_statement(statement)
+
+
+def test_granted_access_passes():
+    """Granted tables and columns validate cleanly."""
+    validator = SecurityValidator()
+    validator.allow_table("users")
+    validator.allow_column("users", "name")
+    statement = _select_statement(
+        SimpleNamespace(name="name", table="users"))
+
+    validator.validate_statement(statement)